@@ -10,15 +10,33 @@ import yaml
 import os
 import sys
 import datetime
+import functools
 import json
 import boto3
+from botocore.config import Config
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-import seaborn as sns
 from pathlib import Path
 import logging
+import matplotlib as mpl
+mpl.use('Agg')  # Non-interactive backend; plots are rendered in worker processes
+import matplotlib.pyplot as plt  # noqa: E402 (backend must be selected first)
+import seaborn as sns  # noqa: E402
+
+# Use orjson for (de)serialization when available; stdlib json accepts bytes as well
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
+# ijson lets us pull run_summary out of large manifests without building the whole tree
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logging.basicConfig(
@@ -31,6 +49,25 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of concurrent S3 transfers used when downloading benchmark results
+DOWNLOAD_WORKERS = 32
+
+# Metrics that are always stored as floats in the analysis DataFrame
+NUMERIC_COLUMNS = ['throughput_days_per_day', 'duration_seconds', 'duration_hours',
+                   'cost_per_sim_day', 'memory_usage_gb', 'cpu_efficiency']
+
+# Repeated string labels that are stored as categoricals
+CATEGORICAL_COLUMNS = ['processor_type', 'instance_type', 'resolution', 'simulation_type']
+
+# Labels that are always stored as strings; other fields keep the dtype pandas infers
+STRING_COLUMNS = ['benchmark_id', 'description', 'metrics_focus'] + CATEGORICAL_COLUMNS
+
+# Index of downloaded objects, kept in the local results directory
+DOWNLOAD_CACHE_FILE = ".download-cache.json"
+
+# Manifests larger than this are streamed with ijson rather than parsed in full
+MANIFEST_STREAM_THRESHOLD = 1024 * 1024
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="GEOS-Chem Benchmark Analyzer")
@@ -60,61 +97,99 @@ def load_benchmark_config(config_path):
         logger.error(f"Error loading configuration: {e}")
         return None
 
-def list_benchmark_results(bucket, prefix="benchmark-results/"):
+def create_s3_client():
+    """Create the S3 client shared by listing and downloading"""
+    # Size the connection pool to match the worker count so concurrent requests don't queue
+    return boto3.client('s3', config=Config(
+        max_pool_connections=DOWNLOAD_WORKERS,
+        retries={'max_attempts': 10, 'mode': 'adaptive'}
+    ))
+
+def fetch_benchmark_manifest(s3_client, bucket, benchmark_prefix):
+    """Fetch the manifest (or results) JSON for a single benchmark prefix"""
+    # Extract benchmark ID from prefix
+    benchmark_id = benchmark_prefix.strip('/').split('/')[-1]
+    
+    # One listing tells us which JSON file exists, instead of probing with GETs
+    response = s3_client.list_objects_v2(Bucket=bucket, Prefix=benchmark_prefix, Delimiter='/')
+    keys = {obj['Key'] for obj in response.get('Contents', [])}
+    
+    # Prefer manifest.json, fall back to results.json
+    for filename, field in (('manifest.json', 'manifest'), ('results.json', 'results')):
+        key = f"{benchmark_prefix}{filename}"
+        if key in keys:
+            obj = s3_client.get_object(Bucket=bucket, Key=key)
+            return {
+                'benchmark_id': benchmark_id,
+                'prefix': benchmark_prefix,
+                field: json_loads(obj['Body'].read())
+            }
+    
+    logger.warning(f"No manifest or results found for {benchmark_prefix}")
+    return None
+
+def list_benchmark_results(bucket, prefix="benchmark-results/", s3_client=None):
     """List benchmark results in S3 bucket"""
-    s3_client = boto3.client('s3')
-    results = []
+    s3_client = s3_client or create_s3_client()
     
     try:
         # List all benchmark folders
         paginator = s3_client.get_paginator('list_objects_v2')
         pages = paginator.paginate(Bucket=bucket, Prefix=prefix, Delimiter='/')
         
+        benchmark_prefixes = []
         for page in pages:
             if 'CommonPrefixes' in page:
-                for obj in page['CommonPrefixes']:
-                    benchmark_prefix = obj['Prefix']
-                    # Extract benchmark ID from prefix
-                    benchmark_id = benchmark_prefix.strip('/').split('/')[-1]
-                    
-                    # Look for manifest.json in this prefix
-                    manifest_key = f"{benchmark_prefix}manifest.json"
-                    try:
-                        manifest = s3_client.get_object(Bucket=bucket, Key=manifest_key)
-                        manifest_data = json.loads(manifest['Body'].read().decode('utf-8'))
-                        
-                        results.append({
-                            'benchmark_id': benchmark_id,
-                            'prefix': benchmark_prefix,
-                            'manifest': manifest_data
-                        })
-                    except s3_client.exceptions.NoSuchKey:
-                        # Try results.json as an alternative
-                        try:
-                            results_key = f"{benchmark_prefix}results.json"
-                            results_obj = s3_client.get_object(Bucket=bucket, Key=results_key)
-                            results_data = json.loads(results_obj['Body'].read().decode('utf-8'))
-                            
-                            results.append({
-                                'benchmark_id': benchmark_id,
-                                'prefix': benchmark_prefix,
-                                'results': results_data
-                            })
-                        except s3_client.exceptions.NoSuchKey:
-                            logger.warning(f"No manifest or results found for {benchmark_prefix}")
+                benchmark_prefixes.extend(obj['Prefix'] for obj in page['CommonPrefixes'])
+        
+        if not benchmark_prefixes:
+            return []
+        
+        # Fetch manifests concurrently; each fetch is an independent round-trip
+        workers = min(DOWNLOAD_WORKERS, len(benchmark_prefixes))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            manifests = executor.map(
+                functools.partial(fetch_benchmark_manifest, s3_client, bucket),
+                benchmark_prefixes
+            )
+            results = [manifest for manifest in manifests if manifest is not None]
         
         return results
     except Exception as e:
         logger.error(f"Error listing benchmark results: {e}")
         return []
 
-def download_benchmark_results(bucket, benchmark_results, local_dir):
-    """Download benchmark results from S3"""
-    s3_client = boto3.client('s3')
+def load_download_cache(cache_path):
+    """Load the index of previously downloaded objects (key -> ETag/size)"""
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                return json_loads(f.read())
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable download cache {cache_path}: {e}")
+    return {}
+
+def save_download_cache(cache_path, cache):
+    """Persist the download index next to the downloaded results"""
+    try:
+        with open(cache_path, 'w') as f:
+            json.dump(cache, f, indent=2)
+    except Exception as e:
+        logger.warning(f"Could not write download cache {cache_path}: {e}")
+
+def download_benchmark_results(bucket, benchmark_results, local_dir, s3_client=None):
+    """Download benchmark results from S3, skipping objects that are unchanged locally"""
+    s3_client = s3_client or create_s3_client()
     
     # Create local directory
     os.makedirs(local_dir, exist_ok=True)
     
+    cache_path = os.path.join(local_dir, DOWNLOAD_CACHE_FILE)
+    cache = load_download_cache(cache_path)
+    
+    # Build a flat list of (key, local_path, etag, size) entries across all benchmarks
+    downloads = []
+    skipped = 0
     for benchmark in benchmark_results:
         benchmark_id = benchmark['benchmark_id']
         prefix = benchmark['prefix']
@@ -123,7 +198,7 @@ def download_benchmark_results(bucket, benchmark_results, local_dir):
         benchmark_dir = os.path.join(local_dir, benchmark_id)
         os.makedirs(benchmark_dir, exist_ok=True)
         
-        # Download all files for this benchmark
+        # List all files for this benchmark
         try:
             paginator = s3_client.get_paginator('list_objects_v2')
             pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
@@ -135,24 +210,65 @@ def download_benchmark_results(bucket, benchmark_results, local_dir):
                         filename = os.path.basename(key)
                         if filename:  # Skip directories
                             local_path = os.path.join(benchmark_dir, filename)
-                            logger.info(f"Downloading {key} to {local_path}")
-                            s3_client.download_file(bucket, key, local_path)
+                            
+                            # The listing already carries ETag and size, so no HEAD is needed
+                            cached = cache.get(key)
+                            if (cached and cached.get('etag') == obj['ETag']
+                                    and cached.get('size') == obj['Size']
+                                    and os.path.exists(local_path)):
+                                skipped += 1
+                                continue
+                            
+                            downloads.append((key, local_path, obj['ETag'], obj['Size']))
         except Exception as e:
-            logger.error(f"Error downloading files for {benchmark_id}: {e}")
+            logger.error(f"Error listing files for {benchmark_id}: {e}")
     
+    def download(item):
+        key, local_path, etag, size = item
+        logger.info(f"Downloading {key} to {local_path}")
+        try:
+            s3_client.download_file(bucket, key, local_path)
+            return key, {'etag': etag, 'size': size}
+        except Exception as e:
+            logger.error(f"Error downloading {key}: {e}")
+            return key, None
+    
+    # Downloads are latency-bound, so overlap the round-trips across threads
+    if downloads:
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(downloads))) as executor:
+            for key, entry in executor.map(download, downloads):
+                if entry is not None:
+                    cache[key] = entry
+        save_download_cache(cache_path, cache)
+    
+    if skipped:
+        logger.info(f"Skipped {skipped} unchanged files already present in {local_dir}")
     logger.info(f"Downloaded benchmark results to {local_dir}")
     return local_dir
 
+def load_manifest(manifest_path, size):
+    """Load a manifest.json, streaming only run_summary out of large files"""
+    if ijson is not None and size > MANIFEST_STREAM_THRESHOLD:
+        with open(manifest_path, 'rb') as f:
+            summary = dict(ijson.kvitems(f, 'run_summary', use_float=True))
+        return {'run_summary': summary} if summary else {}
+    
+    with open(manifest_path, 'rb') as f:
+        return json_loads(f.read())
+
 def extract_performance_metrics(benchmark_dir):
     """Extract performance metrics from benchmark results"""
     metrics = {}
     
+    # One directory scan instead of a stat() per candidate file
+    with os.scandir(benchmark_dir) as entries:
+        files = {entry.name: entry for entry in entries if entry.is_file()}
+    
     # Try to load manifest.json
-    manifest_path = os.path.join(benchmark_dir, "manifest.json")
-    if os.path.exists(manifest_path):
+    if "manifest.json" in files:
+        manifest_entry = files["manifest.json"]
         try:
-            with open(manifest_path, 'r') as f:
-                manifest = json.load(f)
+            manifest = load_manifest(manifest_entry.path, manifest_entry.stat().st_size)
             
             # Extract metrics from run_summary if available
             if 'run_summary' in manifest:
@@ -169,11 +285,10 @@ def extract_performance_metrics(benchmark_dir):
             logger.error(f"Error parsing manifest.json: {e}")
     
     # Try to load results.json
-    results_path = os.path.join(benchmark_dir, "results.json")
-    if os.path.exists(results_path):
+    if "results.json" in files:
         try:
-            with open(results_path, 'r') as f:
-                results = json.load(f)
+            with open(files["results.json"].path, 'rb') as f:
+                results = json_loads(f.read())
             
             # Extract metrics from results
             metrics.update({
@@ -197,11 +312,10 @@ def extract_performance_metrics(benchmark_dir):
             metrics['throughput_days_per_day'] = throughput
     
     # Look for benchmark configuration
-    config_path = os.path.join(benchmark_dir, "config.json")
-    if os.path.exists(config_path):
+    if "config.json" in files:
         try:
-            with open(config_path, 'r') as f:
-                config = json.load(f)
+            with open(files["config.json"].path, 'rb') as f:
+                config = json_loads(f.read())
             
             # Extract configuration details
             if isinstance(config, dict):
@@ -220,60 +334,83 @@ def extract_performance_metrics(benchmark_dir):
 def analyze_benchmarks(results_dir, config=None):
     """Analyze benchmark results and prepare dataframe"""
     # Get all benchmark directories
-    benchmark_dirs = [d for d in os.listdir(results_dir) 
-                     if os.path.isdir(os.path.join(results_dir, d))]
+    with os.scandir(results_dir) as entries:
+        benchmark_dirs = [entry.name for entry in entries if entry.is_dir()]
+    
+    # If we have the original config, index phase information by benchmark ID
+    phase_index = {}
+    if config:
+        phase_index = {
+            bench_config.get('id'): (phase_num, bench_config.get('description'),
+                                     bench_config.get('metrics_focus'))
+            for phase_num in range(1, 5)
+            for bench_config in config.get(f"phase_{phase_num}") or []
+        }
     
-    # Collect metrics for all benchmarks
+    # Collect metrics for all benchmarks; the reads are independent, so run them concurrently
     all_metrics = []
-    for benchmark_id in benchmark_dirs:
-        benchmark_dir = os.path.join(results_dir, benchmark_id)
-        metrics = extract_performance_metrics(benchmark_dir)
-        
+    extracted = []
+    if benchmark_dirs:
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(benchmark_dirs))) as executor:
+            extracted = list(executor.map(
+                extract_performance_metrics,
+                [os.path.join(results_dir, benchmark_id) for benchmark_id in benchmark_dirs]
+            ))
+    
+    for benchmark_id, metrics in zip(benchmark_dirs, extracted):
         # Add benchmark ID
         metrics['benchmark_id'] = benchmark_id
         
-        # If we have the original config, add phase information
-        if config:
-            # Find the phase this benchmark belongs to
-            for phase_num in range(1, 5):
-                phase_key = f"phase_{phase_num}"
-                if phase_key in config:
-                    for bench_config in config[phase_key]:
-                        if bench_config.get('id') == benchmark_id:
-                            metrics['phase'] = phase_num
-                            metrics['description'] = bench_config.get('description')
-                            metrics['metrics_focus'] = bench_config.get('metrics_focus')
-                            break
+        # Add phase information for this benchmark
+        if benchmark_id in phase_index:
+            (metrics['phase'], metrics['description'],
+             metrics['metrics_focus']) = phase_index[benchmark_id]
         
         all_metrics.append(metrics)
     
-    # Convert to DataFrame
-    df = pd.DataFrame(all_metrics)
+    # Convert to DataFrame column by column, so each column's dtype is settled in one pass
+    columns = list(dict.fromkeys(key for metrics in all_metrics for key in metrics))
+    data = {}
+    for col in columns:
+        values = [metrics.get(col) for metrics in all_metrics]
+        if col in NUMERIC_COLUMNS:
+            # Convert strings to numeric where appropriate
+            data[col] = pd.to_numeric(pd.Series(values, dtype=object),
+                                      errors='coerce').astype('float64')
+        elif col in STRING_COLUMNS:
+            data[col] = pd.Series(values, dtype=object)
+        else:
+            # e.g. phase and nodes stay integer (or float with gaps)
+            data[col] = pd.Series(values)
     
-    # Clean up DataFrame - convert strings to numeric where appropriate
-    numeric_columns = ['throughput_days_per_day', 'duration_seconds', 'duration_hours',
-                      'cost_per_sim_day', 'memory_usage_gb', 'cpu_efficiency']
+    df = pd.DataFrame(data, columns=columns)
     
-    for col in numeric_columns:
+    # Store repeated labels as categoricals before plotting/serialization. Metrics stay
+    # float64: float32 values widen to e.g. 0.03999999910593033 in the JSON report.
+    for col in CATEGORICAL_COLUMNS:
         if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+            df[col] = df[col].astype('category')
     
     return df
 
-def generate_performance_visualizations(df, output_dir):
-    """Generate performance visualization plots"""
-    # Create visualization directory
-    viz_dir = os.path.join(output_dir, "visualizations")
-    os.makedirs(viz_dir, exist_ok=True)
-    
-    # Set the style
+def bar_means(df, x, y, hue=None, rot=0):
+    """Bar chart of mean y per x (and hue), like sns.barplot but without the bootstrapped CI"""
+    if hue is None:
+        data = df.groupby(x, observed=True)[y].mean()
+    else:
+        data = df.pivot_table(index=x, columns=hue, values=y, aggfunc='mean', observed=True)
+    return data.plot(kind='bar', ax=plt.gca(), rot=rot)
+
+def set_plot_style():
+    """Apply the shared plot style (also used as the worker initializer)"""
     plt.style.use('seaborn-v0_8-whitegrid')
     sns.set_context("talk")
-    
-    # 1. Throughput Comparison by Processor Type
+
+def plot_throughput_by_processor(df, viz_dir):
+    """Throughput Comparison by Processor Type"""
     if 'throughput_days_per_day' in df.columns and 'processor_type' in df.columns:
         plt.figure(figsize=(14, 8))
-        ax = sns.barplot(x='benchmark_id', y='throughput_days_per_day', hue='processor_type', data=df)
+        ax = bar_means(df, 'benchmark_id', 'throughput_days_per_day', hue='processor_type')
         ax.set_title('Simulation Throughput by Processor Type')
         ax.set_xlabel('Benchmark ID')
         ax.set_ylabel('Throughput (Simulation Days / Wall Day)')
@@ -281,8 +418,9 @@ def generate_performance_visualizations(df, output_dir):
         plt.tight_layout()
         plt.savefig(os.path.join(viz_dir, 'throughput_by_processor.png'), dpi=300)
         plt.close()
-    
-    # 2. Cost vs. Performance
+
+def plot_cost_vs_performance(df, viz_dir):
+    """Cost vs. Performance"""
     if 'cost_per_sim_day' in df.columns and 'throughput_days_per_day' in df.columns:
         plt.figure(figsize=(12, 8))
         ax = sns.scatterplot(x='cost_per_sim_day', y='throughput_days_per_day', 
@@ -293,88 +431,144 @@ def generate_performance_visualizations(df, output_dir):
         plt.tight_layout()
         plt.savefig(os.path.join(viz_dir, 'cost_vs_performance.png'), dpi=300)
         plt.close()
-    
-    # 3. Performance by Instance Type for GC Classic
-    gc_classic_df = df[df['nodes'].isna()]  # Filter for GC Classic (no nodes)
+
+def plot_gc_classic_by_instance(gc_classic_df, viz_dir):
+    """Performance by Instance Type for GC Classic (benchmarks without nodes)"""
     if not gc_classic_df.empty and 'instance_type' in gc_classic_df.columns:
         plt.figure(figsize=(14, 8))
-        ax = sns.barplot(x='instance_type', y='throughput_days_per_day', data=gc_classic_df)
+        ax = bar_means(gc_classic_df, 'instance_type', 'throughput_days_per_day')
         ax.set_title('GC Classic Performance by Instance Type')
         ax.set_xlabel('Instance Type')
         ax.set_ylabel('Throughput (Simulation Days / Wall Day)')
         plt.tight_layout()
         plt.savefig(os.path.join(viz_dir, 'gc_classic_by_instance.png'), dpi=300)
         plt.close()
-    
-    # 4. GCHP Scaling Performance
-    gchp_df = df[df['nodes'].notna()]  # Filter for GCHP (has nodes)
+
+def plot_gchp_scaling(gchp_df, viz_dir):
+    """GCHP Scaling Performance (benchmarks with nodes)"""
     if not gchp_df.empty and 'nodes' in gchp_df.columns:
         plt.figure(figsize=(12, 8))
-        ax = sns.barplot(x='nodes', y='throughput_days_per_day', hue='resolution', data=gchp_df)
+        ax = bar_means(gchp_df, 'nodes', 'throughput_days_per_day', hue='resolution')
         ax.set_title('GCHP Performance by Node Count')
         ax.set_xlabel('Number of Nodes')
         ax.set_ylabel('Throughput (Simulation Days / Wall Day)')
         plt.tight_layout()
         plt.savefig(os.path.join(viz_dir, 'gchp_scaling.png'), dpi=300)
         plt.close()
-    
-    # 5. Performance by Simulation Type
+
+def plot_performance_by_sim_type(df, viz_dir):
+    """Performance by Simulation Type"""
     if 'simulation_type' in df.columns:
         plt.figure(figsize=(12, 8))
-        ax = sns.barplot(x='simulation_type', y='throughput_days_per_day', hue='processor_type', data=df)
+        ax = bar_means(df, 'simulation_type', 'throughput_days_per_day', hue='processor_type')
         ax.set_title('Performance by Simulation Type')
         ax.set_xlabel('Simulation Type')
         ax.set_ylabel('Throughput (Simulation Days / Wall Day)')
         plt.tight_layout()
         plt.savefig(os.path.join(viz_dir, 'performance_by_sim_type.png'), dpi=300)
         plt.close()
-    
-    # 6. Resolution Impact
+
+def plot_performance_by_resolution(df, viz_dir):
+    """Resolution Impact"""
     if 'resolution' in df.columns:
         plt.figure(figsize=(12, 8))
-        ax = sns.barplot(x='resolution', y='throughput_days_per_day', hue='processor_type', data=df)
+        ax = bar_means(df, 'resolution', 'throughput_days_per_day', hue='processor_type')
         ax.set_title('Performance by Resolution')
         ax.set_xlabel('Resolution')
         ax.set_ylabel('Throughput (Simulation Days / Wall Day)')
         plt.tight_layout()
         plt.savefig(os.path.join(viz_dir, 'performance_by_resolution.png'), dpi=300)
         plt.close()
+
+# Columns the plots read; only these are pickled to the workers
+PLOT_COLUMNS = ['benchmark_id', 'throughput_days_per_day', 'cost_per_sim_day', 'processor_type',
+                'simulation_type', 'instance_type', 'nodes', 'resolution']
+
+def generate_performance_visualizations(df, output_dir):
+    """Generate performance visualization plots"""
+    # Create visualization directory
+    viz_dir = os.path.join(output_dir, "visualizations")
+    os.makedirs(viz_dir, exist_ok=True)
+    
+    plot_df = df[[col for col in PLOT_COLUMNS if col in df.columns]]
+    
+    # Split GC Classic (no nodes) from GCHP (has nodes) once, with a single mask
+    if 'nodes' in plot_df.columns:
+        nodes_mask = plot_df['nodes'].notna()
+    else:
+        nodes_mask = pd.Series(False, index=plot_df.index)
+    
+    # Each plot is independent, so they are rendered in separate worker processes
+    plot_jobs = [
+        (plot_throughput_by_processor, plot_df),
+        (plot_cost_vs_performance, plot_df),
+        (plot_gc_classic_by_instance, plot_df.loc[~nodes_mask]),
+        (plot_gchp_scaling, plot_df.loc[nodes_mask]),
+        (plot_performance_by_sim_type, plot_df),
+        (plot_performance_by_resolution, plot_df)
+    ]
+    
+    # PNG rendering at 300 dpi is CPU-bound and matplotlib is not thread-safe, so use processes
+    with ProcessPoolExecutor(max_workers=len(plot_jobs), initializer=set_plot_style) as executor:
+        futures = {executor.submit(plot_fn, plot_data, viz_dir): plot_fn.__name__
+                   for plot_fn, plot_data in plot_jobs}
+        for future, name in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Error generating {name}: {e}")
     
     logger.info(f"Generated performance visualizations in {viz_dir}")
 
-def generate_html_report(df, output_dir, config=None):
+def compute_summary_stats(df):
+    """Compute min/max/mean and their locations for the headline metrics in one pass"""
+    summary_columns = [col for col in ['throughput_days_per_day', 'cost_per_sim_day']
+                       if col in df.columns]
+    if not summary_columns:
+        return pd.DataFrame()
+    stats = df[summary_columns].agg(['min', 'max', 'mean'])
+    
+    # idxmin/idxmax raise on all-NA columns, so only locate columns that have values
+    located = [col for col in summary_columns if df[col].notna().any()]
+    if located:
+        stats = pd.concat([stats, df[located].agg(['idxmin', 'idxmax'])])
+    return stats.reindex(['min', 'max', 'mean', 'idxmin', 'idxmax'])
+
+def format_two_decimals(value):
+    """Format a report table number with two decimals, leaving missing values blank"""
+    return "" if pd.isna(value) else f"{value:.2f}"
+
+def generate_html_report(df, output_dir, config=None, stats=None):
     """Generate HTML report with benchmark results"""
     # Create report directory
     report_dir = os.path.join(output_dir, "html")
     os.makedirs(report_dir, exist_ok=True)
     
-    # Copy visualization images if they exist
+    # Visualization images are referenced in place rather than copied next to the report
     viz_dir = os.path.join(output_dir, "visualizations")
-    if os.path.exists(viz_dir):
-        for img_file in os.listdir(viz_dir):
-            if img_file.endswith('.png'):
-                src = os.path.join(viz_dir, img_file)
-                dst = os.path.join(report_dir, img_file)
-                import shutil
-                shutil.copy2(src, dst)
     
     # Generate summary statistics
+    if stats is None:
+        stats = compute_summary_stats(df)
     summary_stats = {}
     
-    if 'throughput_days_per_day' in df.columns:
+    if ('throughput_days_per_day' in stats.columns
+            and pd.notna(stats.at['idxmax', 'throughput_days_per_day'])):
         summary_stats['max_throughput'] = {
-            'value': df['throughput_days_per_day'].max(),
-            'benchmark': df.loc[df['throughput_days_per_day'].idxmax(), 'benchmark_id']
+            'value': stats.at['max', 'throughput_days_per_day'],
+            'benchmark': df.loc[stats.at['idxmax', 'throughput_days_per_day'], 'benchmark_id']
         }
     
-    if 'cost_per_sim_day' in df.columns:
+    if ('cost_per_sim_day' in stats.columns
+            and pd.notna(stats.at['idxmin', 'cost_per_sim_day'])):
         summary_stats['min_cost'] = {
-            'value': df['cost_per_sim_day'].min(),
-            'benchmark': df.loc[df['cost_per_sim_day'].idxmin(), 'benchmark_id']
+            'value': stats.at['min', 'cost_per_sim_day'],
+            'benchmark': df.loc[stats.at['idxmin', 'cost_per_sim_day'], 'benchmark_id']
         }
     
-    # Build HTML content
-    html_content = f"""
+    # Build HTML content as a list of parts, joined once at the end
+    parts = []
+    parts.append(f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -402,19 +596,21 @@ def generate_html_report(df, output_dir, config=None):
         <div class="summary-card">
             <h2>Summary Statistics</h2>
             <ul>
-    """
+    """)
     
     # Add summary stats
     for stat_name, stat_data in summary_stats.items():
         formatted_name = ' '.join(word.capitalize() for word in stat_name.split('_'))
-        html_content += f"<li><strong>{formatted_name}:</strong> <span class='metric-highlight'>{stat_data['value']:.2f}</span> (Benchmark: {stat_data['benchmark']})</li>\n"
+        parts.append(f"<li><strong>{formatted_name}:</strong> "
+                     f"<span class='metric-highlight'>{stat_data['value']:.2f}</span> "
+                     f"(Benchmark: {stat_data['benchmark']})</li>\n")
     
-    html_content += """
+    parts.append("""
             </ul>
         </div>
         
         <h2>Performance Visualizations</h2>
-    """
+    """)
     
     # Add visualization images
     viz_files = [
@@ -427,22 +623,15 @@ def generate_html_report(df, output_dir, config=None):
     ]
     
     for viz_file in viz_files:
-        if os.path.exists(os.path.join(report_dir, viz_file)):
-            html_content += f"""
+        if os.path.exists(os.path.join(viz_dir, viz_file)):
+            parts.append(f"""
             <div class="chart-container">
                 <h3>{' '.join(word.capitalize() for word in viz_file.replace('.png', '').split('_'))}</h3>
-                <img src="{viz_file}" alt="{viz_file}">
+                <img src="../visualizations/{viz_file}" alt="{viz_file}">
             </div>
-            """
+            """)
     
-    html_content += """
-        <h2>Detailed Benchmark Results</h2>
-        <table>
-            <thead>
-                <tr>
-    """
-    
-    # Table headers
+    # Table columns
     columns_to_show = ['benchmark_id', 'description', 'simulation_type', 'resolution', 
                      'processor_type', 'instance_type', 'nodes',
                      'throughput_days_per_day', 'cost_per_sim_day', 'duration_hours']
@@ -450,61 +639,64 @@ def generate_html_report(df, output_dir, config=None):
     # Filter only columns that exist in the DataFrame
     columns_to_show = [col for col in columns_to_show if col in df.columns]
     
-    # Add table headers
-    for col in columns_to_show:
-        formatted_col = ' '.join(word.capitalize() for word in col.split('_'))
-        html_content += f"<th>{formatted_col}</th>\n"
-    
-    html_content += """
-                </tr>
-            </thead>
-            <tbody>
-    """
-    
-    # Add table rows
-    for _, row in df.iterrows():
-        html_content += "<tr>\n"
-        for col in columns_to_show:
-            value = row.get(col)
-            if pd.isna(value):
-                formatted_value = ""
-            elif isinstance(value, (int, float)):
-                formatted_value = f"{value:.2f}" if col in ['throughput_days_per_day', 'cost_per_sim_day', 'duration_hours'] else str(value)
-            else:
-                formatted_value = str(value)
-            
-            html_content += f"<td>{formatted_value}</td>\n"
-        html_content += "</tr>\n"
+    # Render the table in one pass with pandas instead of row-by-row
+    formatters = {col: format_two_decimals
+                  for col in ['throughput_days_per_day', 'cost_per_sim_day', 'duration_hours']
+                  if col in columns_to_show}
+    headers = [' '.join(word.capitalize() for word in col.split('_')) for col in columns_to_show]
+    table_html = df[columns_to_show].to_html(index=False, header=headers, formatters=formatters,
+                                             na_rep="", border=0, justify="left")
     
-    html_content += """
-            </tbody>
-        </table>
+    parts.append(f"""
+        <h2>Detailed Benchmark Results</h2>
+        {table_html}
         
         <footer>
             <p>GEOS-Chem AWS Cloud Runner Benchmarking System</p>
         </footer>
     </body>
     </html>
-    """
+    """)
     
     # Write HTML file
     html_path = os.path.join(report_dir, "benchmark-report.html")
     with open(html_path, 'w') as f:
-        f.write(html_content)
+        f.write(''.join(parts))
     
     logger.info(f"Generated HTML report at {html_path}")
     return html_path
 
+@functools.lru_cache(maxsize=None)
+def load_weasyprint():
+    """Import WeasyPrint once; it pulls in cairo/pango, so only PDF runs pay for it"""
+    try:
+        from weasyprint import HTML
+        return HTML
+    except ImportError:
+        return None
+
 def generate_benchmark_report(df, output_dir, report_format, config=None):
     """Generate benchmark report in the specified format"""
     # Generate data tables and summary statistics
     output_paths = {}
+    stats = compute_summary_stats(df)
     
     # Always save the processed data as CSV
     csv_path = os.path.join(output_dir, "benchmark-results.csv")
     df.to_csv(csv_path, index=False)
     output_paths['csv'] = csv_path
     
+    # Also save as Parquet, which is much faster to reload for downstream analysis
+    try:
+        import pyarrow  # noqa: F401
+        parquet_path = os.path.join(output_dir, "benchmark-results.parquet")
+        df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+        output_paths['parquet'] = parquet_path
+    except ImportError:
+        logger.warning("pyarrow module not found, skipping Parquet output")
+    except Exception as e:
+        logger.warning(f"Could not write Parquet output: {e}")
+    
     # Generate JSON output
     if report_format in ['json', 'all']:
         json_path = os.path.join(output_dir, "benchmark-results.json")
@@ -515,13 +707,20 @@ def generate_benchmark_report(df, output_dir, report_format, config=None):
             'benchmarks': df.to_dict(orient='records'),
             'summary': {
                 'total_benchmarks': len(df),
-                'mean_throughput': df['throughput_days_per_day'].mean() if 'throughput_days_per_day' in df.columns else None,
-                'mean_cost': df['cost_per_sim_day'].mean() if 'cost_per_sim_day' in df.columns else None
+                'mean_throughput': (stats.at['mean', 'throughput_days_per_day']
+                                    if 'throughput_days_per_day' in stats.columns else None),
+                'mean_cost': (stats.at['mean', 'cost_per_sim_day']
+                              if 'cost_per_sim_day' in stats.columns else None)
             }
         }
         
-        with open(json_path, 'w') as f:
-            json.dump(results_json, f, indent=2)
+        if orjson is not None:
+            with open(json_path, 'wb') as f:
+                f.write(orjson.dumps(results_json, default=str,
+                                     option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(json_path, 'w') as f:
+                json.dump(results_json, f, indent=2, default=str)
         
         output_paths['json'] = json_path
     
@@ -530,28 +729,26 @@ def generate_benchmark_report(df, output_dir, report_format, config=None):
     
     # Generate HTML report
     if report_format in ['html', 'all']:
-        html_path = generate_html_report(df, output_dir, config)
+        html_path = generate_html_report(df, output_dir, config, stats)
         output_paths['html'] = html_path
     
     # Generate PDF report (if requested and possible)
     if report_format in ['pdf', 'all']:
-        try:
-            from weasyprint import HTML
+        weasy_html = load_weasyprint()
+        if weasy_html is None:
+            logger.warning("weasyprint module not found, skipping PDF generation")
+        elif 'html' in output_paths:
+            # Use the HTML report as a base for the PDF
             pdf_dir = os.path.join(output_dir, "pdf")
             os.makedirs(pdf_dir, exist_ok=True)
+            html_path = output_paths['html']
+            pdf_path = os.path.join(pdf_dir, "benchmark-report.pdf")
             
-            # Use the HTML report as a base for the PDF
-            if 'html' in output_paths:
-                html_path = output_paths['html']
-                pdf_path = os.path.join(pdf_dir, "benchmark-report.pdf")
-                
-                HTML(html_path).write_pdf(pdf_path)
-                output_paths['pdf'] = pdf_path
-                logger.info(f"Generated PDF report at {pdf_path}")
-            else:
-                logger.warning("Cannot generate PDF without HTML report")
-        except ImportError:
-            logger.warning("weasyprint module not found, skipping PDF generation")
+            weasy_html(html_path).write_pdf(pdf_path)
+            output_paths['pdf'] = pdf_path
+            logger.info(f"Generated PDF report at {pdf_path}")
+        else:
+            logger.warning("Cannot generate PDF without HTML report")
     
     return output_paths
 
@@ -569,7 +766,8 @@ def main():
     
     # List benchmark results
     logger.info(f"Listing benchmark results in {args.results_bucket}")
-    benchmark_results = list_benchmark_results(args.results_bucket)
+    s3_client = create_s3_client()
+    benchmark_results = list_benchmark_results(args.results_bucket, s3_client=s3_client)
     
     if not benchmark_results:
         logger.error("No benchmark results found")
@@ -600,7 +798,7 @@ def main():
     
     # Download results
     results_dir = os.path.join(args.output_dir, "downloaded-results")
-    download_benchmark_results(args.results_bucket, benchmark_results, results_dir)
+    download_benchmark_results(args.results_bucket, benchmark_results, results_dir, s3_client)
     
     # Analyze benchmarks
     df = analyze_benchmarks(results_dir, config)
@@ -7,28 +7,181 @@ and instance types, submitting jobs to AWS Batch and ParallelCluster.
 """
 
 import argparse
-import yaml
+import atexit
 import os
 import sys
 import datetime
 import json
 import uuid
-import boto3
 import time
 import logging
+import logging.handlers
+import queue
+import random
+import re
+import subprocess
+import tempfile
+import functools
+import hashlib
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from botocore.exceptions import ClientError
+from benchmark_common import (create_job_event_queue, get_aws_client, load_cached_yaml,
+                              receive_job_events, teardown_job_event_queue,
+                              wait_for_submit_token)
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("benchmark.log")
-    ]
-)
+# Configure logging (file logging is opt-in via --log-file). Records are
+# queued and written by a listener thread so log I/O stays off the
+# submission and polling paths.
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+logging.getLogger().setLevel(logging.INFO)
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Persistent SSH sessions to ParallelCluster head nodes (paramiko is optional;
+# without it each submission shells out to ssh)
+try:
+    import paramiko
+except ImportError:
+    paramiko = None
+
+SSH_USER = "ec2-user"
+_ssh_clients = {}
+_ssh_lock = threading.Lock()
+
+# Concurrent submissions share each session; stay under sshd's default MaxSessions (10)
+SSH_MAX_SESSIONS = 8
+_ssh_sessions = threading.BoundedSemaphore(SSH_MAX_SESSIONS)
+
+# Without paramiko, let OpenSSH multiplex submissions over one master connection
+SSH_MULTIPLEX_OPTIONS = (
+    "-o ControlMaster=auto "
+    f"-o ControlPath={os.path.join(tempfile.gettempdir(), 'geos-chem-ssh-%r@%h:%p')} "
+    "-o ControlPersist=60s"
+)
+
+# orjson serializes configs and metadata much faster than the stdlib when available
+# (orjson >= 3.9 can also embed already-serialized fragments)
+try:
+    import orjson
+    orjson_fragment = getattr(orjson, "Fragment", None)
+except ImportError:
+    orjson = None
+    orjson_fragment = None
+
+# Metadata uploads at least this large are zstd-compressed when zstandard is installed
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
+METADATA_COMPRESS_THRESHOLD = 64 * 1024
+
+# Serialized benchmark configs keyed by id(); the config dicts live for the whole run
+_config_json_cache = {}
+
+# Structural checks for the benchmarking configuration, compiled into a
+# validator function when fastjsonschema is installed
+BENCHMARK_SCHEMA = {
+    "type": "object",
+    "required": ["simulation_type", "hardware"],
+    "properties": {
+        "hardware": {"type": "object"}
+    }
+}
+CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["phase_1", "phase_2", "phase_3", "phase_4"],
+    "properties": {
+        phase: {"type": "array", "items": BENCHMARK_SCHEMA}
+        for phase in ["phase_1", "phase_2", "phase_3", "phase_4"]
+    }
+}
+
+try:
+    import fastjsonschema
+    CONFIG_VALIDATOR = fastjsonschema.compile(CONFIG_SCHEMA)
+except ImportError:
+    fastjsonschema = None
+    CONFIG_VALIDATOR = None
+
+# S3 keys of benchmark configs already uploaded during this run
+_uploaded_config_keys = set()
+
+# Slurm's sbatch confirmation, printed by submit-gchp on the head node (matched on
+# the raw bytes so successful submissions never decode their output)
+JOB_ID_PATTERN = re.compile(rb'Submitted batch job (\d+)')
+
+# Number of threads used to submit AWS Batch jobs concurrently
+SUBMIT_WORKERS = 20
+
+# Number of threads used to upload ParallelCluster benchmark configs
+CONFIG_UPLOAD_WORKERS = 32
+
+# Number of threads issuing describe_jobs calls (100 job IDs each) per poll
+DESCRIBE_WORKERS = 8
+
+# Retry settings for throttled SubmitJob calls
+SUBMIT_MAX_RETRIES = 5
+SUBMIT_BACKOFF_BASE_SECONDS = 0.5
+
+# Runtime multipliers relative to a 7-day 4x5 fullchem run
+SIM_TYPE_FACTOR = {
+    "fullchem": 1.0,
+    "tropchem": 0.8,
+    "aerosol": 0.7,
+    "transport": 0.5,
+    "ch4": 0.6,
+    "co2": 0.6
+}
+RESOLUTION_FACTOR = {
+    "2x2.5": 2.5,
+    "0.5x0.625": 5.0,
+    "nested": 5.0
+}
+
+# Batch container resources by instance size and resolution
+VCPUS_BY_INSTANCE_SIZE = {
+    "16xlarge": 64,
+    "8xlarge": 32,
+    "4xlarge": 16
+}
+DEFAULT_VCPUS = 4
+HIGH_RES_RESOLUTIONS = ("2x2.5", "nested")
+HIGH_RES_MEMORY_MB = 16384
+DEFAULT_MEMORY_MB = 8192
+
+# Name prefix of the EventBridge rule and SQS queue that deliver Batch job state changes
+JOB_EVENTS_NAME = "geos-chem-benchmark-job-events"
+
+# How often describe_jobs reconciles the event stream (events can be missed
+# for jobs that finished before the rule existed)
+JOB_RECONCILE_INTERVAL_SECONDS = 300
+
+# How often the job monitor polls describe_jobs when not using job events
+JOB_MONITOR_INTERVAL_SECONDS = 30
+
+# ParallelCluster job status can't be queried, so their concurrency slot is
+# freed after this long
+PARALLEL_CLUSTER_SLOT_TIMEOUT_SECONDS = 120 * 60
+
+# Concurrency slots for running jobs, released by the job monitor thread
+_job_slots = None
+_running_jobs = {}
+_running_lock = threading.Lock()
+_monitor_stop = threading.Event()
+
+# Terminal events of tracked jobs already consumed from the queue, kept so that
+# a later wait on a different subset of jobs still sees them
+_completed_job_events = {}
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="GEOS-Chem Benchmarking Orchestrator")
@@ -49,21 +202,69 @@ def parse_args():
                         help="Validate configuration without submitting jobs")
     parser.add_argument("--max-concurrent", "-m", type=int, default=10,
                         help="Maximum number of concurrent benchmark jobs")
+    parser.add_argument("--array-jobs", action="store_true",
+                        help="Submit GC Classic benchmarks with equal resources as Batch "
+                             "array jobs (requires a container image with --benchmark-array "
+                             "support)")
+    parser.add_argument("--log-file",
+                        help="Also write the log to this file (e.g. benchmark.log)")
+    parser.add_argument("--save-local-metadata", action="store_true",
+                        help="Also write the job metadata JSON to the working directory")
+    parser.add_argument("--job-events", action="store_true",
+                        help="Track AWS Batch jobs via EventBridge/SQS state-change events "
+                             "instead of polling every 60 seconds")
     
     return parser.parse_args()
 
+def dumps_json(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, compact unless indent is requested"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+def loads_json(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def benchmark_json(benchmark):
+    """Compact JSON bytes for a benchmark config, serialized once per run"""
+    key = id(benchmark)
+    body = _config_json_cache.get(key)
+    if body is None:
+        body = _config_json_cache[key] = dumps_json(benchmark)
+    return body
+
 def load_config(config_path):
-    """Load benchmarking configuration from YAML file"""
+    """Load benchmarking configuration from YAML file (via a JSON cache when unchanged)"""
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        return config
+        return load_cached_yaml(config_path)
     except Exception as e:
         logger.error(f"Error loading configuration: {e}")
         sys.exit(1)
 
+def assign_missing_benchmark_ids(config):
+    """Generate IDs for benchmarks that don't define one"""
+    for phase in ["phase_1", "phase_2", "phase_3", "phase_4"]:
+        for i, benchmark in enumerate(config[phase]):
+            if "id" not in benchmark:
+                logger.warning("Benchmark in %s index %s is missing ID, generating one", phase, i)
+                benchmark["id"] = f"{phase.replace('_', '-')}-{str(uuid.uuid4())[:8]}"
+
 def validate_config(config):
     """Validate benchmarking configuration"""
+    if CONFIG_VALIDATOR is not None:
+        try:
+            CONFIG_VALIDATOR(config)
+        except fastjsonschema.JsonSchemaException as e:
+            logger.error("Invalid benchmarking configuration: %s", e.message)
+            return False
+        assign_missing_benchmark_ids(config)
+        return True
+
     # Check required fields
     required_fields = ["phase_1", "phase_2", "phase_3", "phase_4"]
     for field in required_fields:
@@ -78,54 +279,48 @@ def validate_config(config):
             return False
         
         for i, benchmark in enumerate(config[phase]):
-            # Check required benchmark fields
-            if "id" not in benchmark:
-                logger.warning(f"Benchmark in {phase} index {i} is missing ID, generating one")
-                benchmark["id"] = f"{phase.replace('_', '-')}-{str(uuid.uuid4())[:8]}"
-            
+            # Check required benchmark fields (IDs are generated once the checks pass)
+            benchmark_id = benchmark.get("id", f"in {phase} index {i}")
             if "simulation_type" not in benchmark:
-                logger.error(f"Benchmark {benchmark['id']} is missing simulation_type")
+                logger.error(f"Benchmark {benchmark_id} is missing simulation_type")
                 return False
                 
             if "hardware" not in benchmark:
-                logger.error(f"Benchmark {benchmark['id']} is missing hardware configuration")
+                logger.error(f"Benchmark {benchmark_id} is missing hardware configuration")
                 return False
     
+    assign_missing_benchmark_ids(config)
     return True
 
 def estimate_benchmark_runtime(benchmark):
     """Estimate runtime for a benchmark in hours"""
+    return estimate_runtime(
+        benchmark.get("simulation_type", "fullchem"),
+        benchmark.get("duration", {}).get("days", 7),
+        benchmark.get("domain", {}).get("resolution", "4x5")
+    )
+
+@functools.lru_cache(maxsize=None)
+def estimate_runtime(sim_type, duration_days, resolution):
+    """Estimate runtime in hours from the benchmark settings that affect it"""
     # Basic estimation based on simulation type and duration
     base_runtime = 1.0  # 1 hour base
     
     # Adjust for simulation type
-    sim_type_factor = {
-        "fullchem": 1.0,
-        "tropchem": 0.8,
-        "aerosol": 0.7,
-        "transport": 0.5,
-        "ch4": 0.6,
-        "co2": 0.6
-    }
-    
-    sim_type = benchmark.get("simulation_type", "fullchem")
-    factor = sim_type_factor.get(sim_type, 1.0)
+    factor = SIM_TYPE_FACTOR.get(sim_type, 1.0)
     
     # Adjust for duration
-    duration_days = benchmark.get("duration", {}).get("days", 7)
     duration_factor = duration_days / 7.0
     
     # Adjust for resolution
-    resolution = benchmark.get("domain", {}).get("resolution", "4x5")
-    resolution_factor = 1.0
-    if resolution == "2x2.5":
-        resolution_factor = 2.5
-    elif resolution in ["0.5x0.625", "nested"]:
-        resolution_factor = 5.0
-    elif "c90" in resolution:
-        resolution_factor = 4.0
-    elif "c180" in resolution:
-        resolution_factor = 8.0
+    resolution_factor = RESOLUTION_FACTOR.get(resolution)
+    if resolution_factor is None:
+        if "c90" in resolution:
+            resolution_factor = 4.0
+        elif "c180" in resolution:
+            resolution_factor = 8.0
+        else:
+            resolution_factor = 1.0
     
     # Calculate runtime
     estimated_runtime = base_runtime * factor * duration_factor * resolution_factor
@@ -133,23 +328,28 @@ def estimate_benchmark_runtime(benchmark):
     # Add safety margin
     return estimated_runtime * 1.5
 
-def generate_batch_job_params(benchmark, args):
-    """Generate AWS Batch job submission parameters"""
+def batch_job_resources(benchmark):
+    """Return the (vcpus, memory) requested for a GC Classic benchmark"""
+    return batch_resources_for(
+        benchmark.get("domain", {}).get("resolution"),
+        benchmark.get("hardware", {}).get("instance_type", "c7g.8xlarge")
+    )
+
+@functools.lru_cache(maxsize=None)
+def batch_resources_for(resolution, instance_type):
+    """Return the (vcpus, memory) for a resolution and instance type"""
     # Estimate memory needs
-    memory = 8192  # Default 8 GB
-    if benchmark.get("domain", {}).get("resolution") in ["2x2.5", "nested"]:
-        memory = 16384
+    memory = HIGH_RES_MEMORY_MB if resolution in HIGH_RES_RESOLUTIONS else DEFAULT_MEMORY_MB
     
-    # Determine instance type and adjust vCPUs
-    instance_type = benchmark.get("hardware", {}).get("instance_type", "c7g.8xlarge")
-    vcpus = 4  # Default
+    # Determine vCPUs from the instance size (first matching size wins)
+    vcpus = next((count for size, count in VCPUS_BY_INSTANCE_SIZE.items() if size in instance_type),
+                 DEFAULT_VCPUS)
     
-    if "16xlarge" in instance_type:
-        vcpus = 64
-    elif "8xlarge" in instance_type:
-        vcpus = 32
-    elif "4xlarge" in instance_type:
-        vcpus = 16
+    return vcpus, memory
+
+def generate_batch_job_params(benchmark, args):
+    """Generate AWS Batch job submission parameters"""
+    vcpus, memory = batch_job_resources(benchmark)
     
     # Generate unique run ID
     run_id = f"benchmark-{benchmark['id']}-{int(time.time())}"
@@ -158,7 +358,7 @@ def generate_batch_job_params(benchmark, args):
     output_path = f"s3://{args.output_bucket}/benchmark-results/{benchmark['id']}/"
     
     # Benchmark configuration as JSON
-    config_json = json.dumps(benchmark)
+    config_json = benchmark_json(benchmark).decode('utf-8')
     
     # Create job parameters
     job_params = {
@@ -191,6 +391,57 @@ def generate_batch_job_params(benchmark, args):
     
     return job_params
 
+def config_object_key(digest, kind=None):
+    """S3 key for a content-addressed config, fanned out over hash-derived prefixes"""
+    prefix = "benchmark-configs/" + (f"{kind}/" if kind else "")
+    return f"{prefix}{digest[:2]}/{digest[2:4]}/{digest}.json"
+
+def generate_batch_array_job_params(benchmarks, args):
+    """Generate parameters for one Batch array job covering benchmarks with equal resources"""
+    vcpus, memory = batch_job_resources(benchmarks[0])
+    
+    # Each child picks its entry from this list by AWS_BATCH_JOB_ARRAY_INDEX
+    entries = [
+        {
+            "benchmark": benchmark,
+            "output_path": f"s3://{args.output_bucket}/benchmark-results/{benchmark['id']}/"
+        }
+        for benchmark in benchmarks
+    ]
+    array_body = dumps_json(entries)
+    digest = hashlib.blake2b(array_body, digest_size=16).hexdigest()
+    array_key = config_object_key(digest, "arrays")
+    
+    run_id = f"benchmark-array-{digest[:12]}-{int(time.time())}"
+    
+    job_params = {
+        "jobName": run_id,
+        "jobQueue": args.job_queue,
+        "jobDefinition": args.job_definition,
+        "arrayProperties": {"size": len(benchmarks)},
+        "containerOverrides": {
+            "vcpus": vcpus,
+            "memory": memory,
+            "command": [
+                "--benchmark-array",
+                "Ref::arrayConfig"
+            ],
+            "environment": [
+                {"name": "BENCHMARK_RUN_ID", "value": run_id},
+                {"name": "OMP_NUM_THREADS", "value": str(vcpus)}
+            ]
+        },
+        "parameters": {
+            "arrayConfig": f"s3://{args.output_bucket}/{array_key}"
+        },
+        "timeout": {
+            "attemptDurationSeconds": int(max(estimate_benchmark_runtime(benchmark)
+                                              for benchmark in benchmarks) * 3600)
+        }
+    }
+    
+    return job_params, array_key, array_body
+
 def generate_parallel_cluster_job_params(benchmark, args):
     """Generate ParallelCluster job submission parameters"""
     # Output location
@@ -206,88 +457,239 @@ def generate_parallel_cluster_job_params(benchmark, args):
     # Duration in days
     duration_days = benchmark.get("duration", {}).get("days", 7)
     
-    # Create temporary config file for this benchmark
-    config_file = f"/tmp/benchmark-{benchmark['id']}.json"
-    with open(config_file, 'w') as f:
-        json.dump(benchmark, f)
-    
-    # Create S3 path for config
-    config_s3_path = f"s3://{args.output_bucket}/benchmark-configs/{benchmark['id']}.json"
-    
-    # Upload config to S3
-    s3_client = boto3.client('s3')
-    bucket = args.output_bucket
-    key = f"benchmark-configs/{benchmark['id']}.json"
-    
-    try:
-        s3_client.upload_file(config_file, bucket, key)
-    except ClientError as e:
-        logger.error(f"Error uploading config to S3: {e}")
-        return None
+    # Create S3 path for config, named by content hash so identical configs are
+    # uploaded once; the config itself is uploaded by upload_benchmark_configs
+    config_body = benchmark_json(benchmark)
+    digest = hashlib.blake2b(config_body, digest_size=16).hexdigest()
+    config_key = config_object_key(digest)
+    config_s3_path = f"s3://{args.output_bucket}/{config_key}"
     
     # Command to submit job to parallel cluster
-    ssh_command = (
-        f"ssh ec2-user@{args.parallel_cluster}-head "
-        f"'submit-gchp -c {config_s3_path} -o {output_path} "
-        f"-d {duration_days} -n {nodes} -q {queue}'"
+    head_node = f"{args.parallel_cluster}-head"
+    remote_command = (
+        f"submit-gchp -c {config_s3_path} -o {output_path} "
+        f"-d {duration_days} -n {nodes} -q {queue}"
     )
+    ssh_command = f"ssh {SSH_MULTIPLEX_OPTIONS} {SSH_USER}@{head_node} '{remote_command}'"
     
     return {
         "ssh_command": ssh_command,
+        "head_node": head_node,
+        "remote_command": remote_command,
         "config_s3_path": config_s3_path,
+        "config_key": config_key,
+        "config_body": config_body,
         "output_path": output_path,
         "duration_days": duration_days,
         "nodes": nodes,
         "queue": queue
     }
 
+def upload_benchmark_configs(pending_uploads, args):
+    """Upload (benchmark, job_params) configs to S3 concurrently, returning those that succeeded"""
+    s3_client = get_aws_client('s3')
+    
+    # Configs are content-addressed, so each distinct body only needs one PUT per run
+    uploads = {}
+    for benchmark, job_params in pending_uploads:
+        config_key = job_params["config_key"]
+        if config_key in _uploaded_config_keys:
+            logger.debug("Config for benchmark %s already uploaded as %s",
+                         benchmark.get('id', 'unknown'), config_key)
+        else:
+            uploads.setdefault(config_key, job_params["config_body"])
+    
+    def upload(item):
+        config_key, config_body = item
+        # Configs are tiny, so put them straight from memory rather than via the transfer manager.
+        # The orchestrator is the only holder of these bytes, so handing the head node a
+        # presigned URL would just move the same upload onto the SSH connection
+        try:
+            s3_client.put_object(Bucket=args.output_bucket, Key=config_key,
+                                 Body=config_body, ContentType='application/json')
+            return config_key
+        except Exception as e:
+            logger.error("Error uploading config %s to S3: %s", config_key, e)
+            return None
+    
+    if uploads:
+        with ThreadPoolExecutor(max_workers=min(CONFIG_UPLOAD_WORKERS, len(uploads))) as executor:
+            _uploaded_config_keys.update(key for key in executor.map(upload, uploads.items())
+                                         if key)
+    
+    return [item for item in pending_uploads if item[1]["config_key"] in _uploaded_config_keys]
+
 def submit_batch_job(job_params, args):
     """Submit a job to AWS Batch"""
     if args.dry_run:
-        logger.info(f"DRY RUN: Would submit Batch job with parameters: {json.dumps(job_params, indent=2)}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("DRY RUN: Would submit Batch job with parameters: %s",
+                        json.dumps(job_params, indent=2))
         return "dry-run-job-id"
 
     # Use the AWS_REGION environment variable or default to us-west-2
     region = os.environ.get('AWS_REGION', 'us-west-2')
-    logger.info(f"Using AWS region: {region}")
+    logger.info("Using AWS region: %s", region)
 
-    batch_client = boto3.client('batch', region_name=region)
-    try:
-        response = batch_client.submit_job(**job_params)
-        job_id = response['jobId']
-        logger.info(f"Submitted Batch job: {job_id}")
-        return job_id
-    except Exception as e:
-        logger.error(f"Error submitting Batch job: {e}")
-        return None
+    batch_client = get_aws_client('batch', region)
+    for attempt in range(SUBMIT_MAX_RETRIES):
+        wait_for_submit_token()
+        try:
+            response = batch_client.submit_job(**job_params)
+            job_id = response['jobId']
+            logger.info("Submitted Batch job: %s", job_id)
+            return job_id
+        except ClientError as e:
+            # Back off exponentially (with jitter) when Batch throttles us
+            throttled = e.response.get('Error', {}).get('Code') == 'TooManyRequestsException'
+            if throttled and attempt < SUBMIT_MAX_RETRIES - 1:
+                delay = SUBMIT_BACKOFF_BASE_SECONDS * (2 ** attempt) * (1 + random.random())
+                logger.warning("Batch submission throttled, retrying in %.1fs", delay)
+                time.sleep(delay)
+                continue
+            logger.error("Error submitting Batch job: %s", e)
+            return None
+        except Exception as e:
+            logger.error("Error submitting Batch job: %s", e)
+            return None
+
+def get_ssh_client(head_node):
+    """Return a persistent SSH session to a ParallelCluster head node, connecting on first use"""
+    with _ssh_lock:
+        client = _ssh_clients.get(head_node)
+        transport = client.get_transport() if client else None
+        if transport is None or not transport.is_active():
+            # Honour ~/.ssh/config the way the ssh command line would (head node aliases, keys)
+            ssh_config = paramiko.SSHConfig()
+            ssh_config_path = os.path.expanduser("~/.ssh/config")
+            if os.path.exists(ssh_config_path):
+                ssh_config = paramiko.SSHConfig.from_path(ssh_config_path)
+            host_config = ssh_config.lookup(head_node)
+            
+            client = paramiko.SSHClient()
+            client.load_system_host_keys()
+            client.connect(host_config.get("hostname", head_node),
+                           port=int(host_config.get("port", 22)),
+                           username=SSH_USER,
+                           key_filename=host_config.get("identityfile"))
+            _ssh_clients[head_node] = client
+        return client
+
+def close_ssh_clients():
+    """Close any persistent SSH sessions"""
+    with _ssh_lock:
+        for client in _ssh_clients.values():
+            client.close()
+        _ssh_clients.clear()
+
+atexit.register(close_ssh_clients)
 
 def submit_parallel_cluster_job(job_params, args):
     """Submit a job to ParallelCluster via SSH"""
     if args.dry_run:
-        logger.info(f"DRY RUN: Would submit ParallelCluster job with command: {job_params['ssh_command']}")
+        logger.info("DRY RUN: Would submit ParallelCluster job with command: %s",
+                    job_params['ssh_command'])
         return "dry-run-job-id"
     
     try:
-        import subprocess
-        result = subprocess.run(job_params['ssh_command'], shell=True, check=True, 
-                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, 
-                               text=True)
+        if paramiko is not None:
+            # Reuse one SSH session per head node instead of a new handshake per job
+            client = get_ssh_client(job_params['head_node'])
+            with _ssh_sessions:
+                _, stdout, stderr = client.exec_command(job_params['remote_command'])
+                output = stdout.read()
+                exit_status = stdout.channel.recv_exit_status()
+            if exit_status != 0:
+                raise RuntimeError(f"submit-gchp exited with status {exit_status}: "
+                                   f"{stderr.read().decode()}")
+        else:
+            # Multiplexed ssh shares one connection, so the same session cap applies
+            with _ssh_sessions:
+                result = subprocess.run(job_params['ssh_command'], shell=True, check=True, 
+                                       stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            output = result.stdout
         
         # Extract job ID from output
-        output = result.stdout
-        import re
-        match = re.search(r'Submitted batch job (\d+)', output)
+        match = JOB_ID_PATTERN.search(output)
         if match:
-            job_id = match.group(1)
-            logger.info(f"Submitted ParallelCluster job: {job_id}")
+            job_id = match.group(1).decode()
+            logger.info("Submitted ParallelCluster job: %s", job_id)
             return job_id
         else:
-            logger.error(f"Could not extract job ID from output: {output}")
+            logger.error("Could not extract job ID from output: %s",
+                         output.decode(errors='replace'))
             return None
     except Exception as e:
-        logger.error(f"Error submitting ParallelCluster job: {e}")
+        logger.error("Error submitting ParallelCluster job: %s", e)
         return None
 
+def setup_job_event_queue(region, job_queue):
+    """Create this run's SQS queue receiving state changes for jobs in a Batch job queue"""
+    batch_client = get_aws_client('batch', region)
+
+    # Scope the rule to the job queue, and give each run its own rule and queue
+    # so concurrent runs don't consume each other's events
+    job_queue_arn = batch_client.describe_job_queues(
+        jobQueues=[job_queue]
+    )['jobQueues'][0]['jobQueueArn']
+    run_id = f"{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+    name = f"{JOB_EVENTS_NAME}-{run_id}"
+    queue_url = create_job_event_queue(region, name, {"jobQueue": [job_queue_arn]},
+                                       f"GEOS-Chem benchmark run {run_id} job state changes")
+    return queue_url, name
+
+def describe_batch_jobs(batch_client, job_ids):
+    """Describe up to 100 Batch jobs, returning an empty list on error"""
+    try:
+        return batch_client.describe_jobs(jobs=job_ids)['jobs']
+    except Exception as e:
+        logger.error("Error checking batch job status: %s", e)
+        return []
+
+def poll_batch_jobs(batch_client, pending_batch):
+    """Check pending Batch jobs with describe_jobs, removing finished ones"""
+    batch_job_ids = list(pending_batch)
+
+    # Check job status in batches of 100, overlapping the round-trips and
+    # handling each chunk as soon as its response arrives
+    batch_size = 100
+    chunks = [batch_job_ids[i:i+batch_size] for i in range(0, len(batch_job_ids), batch_size)]
+    if len(chunks) <= 1:
+        responses = [describe_batch_jobs(batch_client, chunk) for chunk in chunks]
+        finish_batch_jobs(responses, pending_batch)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(DESCRIBE_WORKERS, len(chunks))) as executor:
+        futures = [executor.submit(describe_batch_jobs, batch_client, chunk) for chunk in chunks]
+        finish_batch_jobs((future.result() for future in as_completed(futures)), pending_batch)
+
+def finish_batch_jobs(responses, pending_batch):
+    """Remove jobs that reached a terminal state from the pending set"""
+    for jobs_details in responses:
+        for job_details in jobs_details:
+            if job_details['status'] in ('SUCCEEDED', 'FAILED'):
+                job = pending_batch.pop(job_details['jobId'], None)
+                if job:
+                    complete_batch_job(job, job_details)
+
+def complete_batch_job(job, job_details):
+    """Log the terminal state of a Batch job"""
+    job_id = job["job_id"]
+    status = job_details['status']
+    logger.info("Job %s for benchmark %s %s", job_id, job['benchmark_id'], status)
+
+    if status == 'FAILED':
+        reason = job_details.get('statusReason', 'Unknown reason')
+        logger.error("Job %s failed: %s", job_id, reason)
+
+def receive_tracked_job_events(sqs_client, queue_url, tracked_jobs):
+    """Receive terminal job events, keeping only those of jobs in tracked_jobs"""
+    events = receive_job_events(sqs_client, queue_url)
+    # The queue sees every job in the Batch job queue; events for other jobs are dropped
+    with _running_lock:
+        _completed_job_events.update((job_id, events[job_id])
+                                     for job_id in events.keys() & tracked_jobs.keys())
+
 def wait_for_batch_jobs(jobs, args, max_wait_minutes=120):
     """Wait for AWS Batch jobs to complete"""
     if args.dry_run or not jobs:
@@ -295,71 +697,225 @@ def wait_for_batch_jobs(jobs, args, max_wait_minutes=120):
 
     # Use the AWS_REGION environment variable or default to us-west-2
     region = os.environ.get('AWS_REGION', 'us-west-2')
-    logger.info(f"Using AWS region: {region}")
+    logger.info("Using AWS region: %s", region)
 
-    batch_client = boto3.client('batch', region_name=region)
+    batch_client = get_aws_client('batch', region)
+    queue_url = getattr(args, 'job_event_queue_url', None)
+    sqs_client = get_aws_client('sqs', region) if queue_url else None
 
-    pending_jobs = jobs.copy()
+    # Batch jobs keyed by job ID; ParallelCluster jobs can't be queried
+    pending_batch = {job["job_id"]: job for job in jobs if job["type"] == "batch"}
+    pending_pc = [job for job in jobs if job["type"] == "parallel_cluster"]
     start_time = time.time()
     timeout = max_wait_minutes * 60
+    last_reconcile = start_time
 
-    logger.info(f"Waiting for {len(pending_jobs)} jobs to complete...")
-
-    while pending_jobs and (time.time() - start_time) < timeout:
-        # Process batch jobs through AWS Batch API
-        batch_job_ids = [job["job_id"] for job in pending_jobs if job["type"] == "batch"]
-
-        if batch_job_ids:
-            # Check job status in batches of 100
-            batch_size = 100
-            for i in range(0, len(batch_job_ids), batch_size):
-                batch_ids = batch_job_ids[i:i+batch_size]
-                try:
-                    response = batch_client.describe_jobs(jobs=batch_ids)
+    logger.info("Waiting for %s jobs to complete...", len(jobs))
 
-                    for job_details in response['jobs']:
-                        job_id = job_details['jobId']
-                        status = job_details['status']
-
-                        # Find the corresponding job in our pending_jobs list
-                        for job in list(pending_jobs):
-                            if job["job_id"] == job_id:
-                                if status in ['SUCCEEDED', 'FAILED']:
-                                    benchmark_id = job["benchmark_id"]
-                                    logger.info(f"Job {job_id} for benchmark {benchmark_id} {status}")
+    while (pending_batch or pending_pc) and (time.time() - start_time) < timeout:
+        if queue_url:
+            # React to state-change events as they arrive, reconciling with
+            # describe_jobs only occasionally
+            try:
+                receive_tracked_job_events(sqs_client, queue_url, pending_batch)
+            except Exception as e:
+                logger.error("Error receiving job events: %s", e)
+                # The failed long poll didn't block, so wait before retrying
+                time.sleep(JOB_MONITOR_INTERVAL_SECONDS)
 
-                                    if status == 'FAILED':
-                                        reason = job_details.get('statusReason', 'Unknown reason')
-                                        logger.error(f"Job {job_id} failed: {reason}")
+            # Only the jobs that have new events need looking at
+            for job_id in _completed_job_events.keys() & pending_batch.keys():
+                complete_batch_job(pending_batch.pop(job_id), _completed_job_events.pop(job_id))
 
-                                    pending_jobs.remove(job)
-                                break
-                except Exception as e:
-                    logger.error(f"Error checking batch job status: {e}")
+            if time.time() - last_reconcile >= JOB_RECONCILE_INTERVAL_SECONDS:
+                poll_batch_jobs(batch_client, pending_batch)
+                last_reconcile = time.time()
+        else:
+            # Process batch jobs through AWS Batch API
+            poll_batch_jobs(batch_client, pending_batch)
 
         # Process ParallelCluster jobs - we can't easily query their status
         # Just log that we're waiting for them, but keep them in the pending list
-        parallel_cluster_jobs = [job for job in pending_jobs if job["type"] == "parallel_cluster"]
-        if parallel_cluster_jobs:
-            logger.info(f"Waiting for {len(parallel_cluster_jobs)} ParallelCluster jobs (status not available)")
+        if pending_pc:
+            logger.info("Waiting for %s ParallelCluster jobs (status not available)",
+                        len(pending_pc))
 
             # If all remaining jobs are ParallelCluster jobs and we have a long timeout,
             # we might want to check their status through SSH
             # This would require implementing a function like check_parallel_cluster_job_status
 
-        # Wait before checking again
-        if pending_jobs:
-            logger.info(f"Waiting for {len(pending_jobs)} jobs to complete...")
+        # Wait before checking again (the event long-poll already blocks)
+        if (pending_batch or pending_pc) and not queue_url:
+            logger.info("Waiting for %s jobs to complete...", len(pending_batch) + len(pending_pc))
             time.sleep(60)
 
+    pending_jobs = list(pending_batch.values()) + pending_pc
     if pending_jobs:
-        logger.warning(f"Timed out waiting for {len(pending_jobs)} jobs")
+        logger.warning("Timed out waiting for %s jobs", len(pending_jobs))
         # List the job IDs and types that timed out
         for job in pending_jobs:
-            logger.warning(f"Job {job['job_id']} ({job['type']}) for benchmark {job['benchmark_id']} timed out")
+            logger.warning("Job %s (%s) for benchmark %s timed out",
+                           job['job_id'], job['type'], job['benchmark_id'])
     else:
         logger.info("All jobs completed")
 
+def create_job_info(job_id, benchmark, job_type, phase_num):
+    """Build the tracking record for a submitted benchmark job"""
+    return {
+        "job_id": job_id,
+        "benchmark_id": benchmark.get("id", "unknown"),
+        "type": job_type,
+        "phase": phase_num,
+        "submission_time": datetime.datetime.now().isoformat(),
+        "benchmark": benchmark  # Include the full benchmark config
+    }
+
+def submit_gc_classic_benchmark(benchmark, phase_num, args):
+    """Generate and submit the AWS Batch job for a GC Classic benchmark"""
+    job_params = generate_batch_job_params(benchmark, args)
+    job_id = submit_batch_job(job_params, args)
+    if job_id:
+        return create_job_info(job_id, benchmark, "batch", phase_num)
+    return None
+
+def submit_gchp_benchmark(benchmark, job_params, phase_num, args):
+    """Submit the ParallelCluster job for a GCHP benchmark whose config is uploaded"""
+    job_id = submit_parallel_cluster_job(job_params, args)
+    if job_id:
+        return create_job_info(job_id, benchmark, "parallel_cluster", phase_num)
+    return None
+
+def submit_with_slots(submissions, args):
+    """Run submission callables from a bounded thread pool, each holding a concurrency slot"""
+    def run(submit):
+        acquire_job_slot()
+        job_info = submit()
+        track_job(job_info, args)
+        return job_info
+    
+    if not submissions:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(SUBMIT_WORKERS, len(submissions))) as executor:
+        return [job_info for job_info in executor.map(run, submissions) if job_info]
+
+def submit_gc_classic_array_jobs(benchmarks, phase_num, args):
+    """Submit GC Classic benchmarks as one Batch array job per resource shape"""
+    groups = {}
+    for benchmark in benchmarks:
+        groups.setdefault(batch_job_resources(benchmark), []).append(benchmark)
+    
+    job_infos = []
+    for group in groups.values():
+        # Array jobs need at least two children
+        if len(group) == 1:
+            job_infos.append(submit_gc_classic_benchmark(group[0], phase_num, args))
+            continue
+        
+        job_params, array_key, array_body = generate_batch_array_job_params(group, args)
+        if not args.dry_run:
+            try:
+                get_aws_client('s3').put_object(Bucket=args.output_bucket, Key=array_key,
+                                                Body=array_body, ContentType='application/json')
+            except Exception as e:
+                logger.error("Error uploading array config %s to S3: %s", array_key, e)
+                continue
+        
+        parent_id = submit_batch_job(job_params, args)
+        if parent_id:
+            # Children are addressable as <parent>:<index> in describe_jobs and job events
+            job_infos.extend(create_job_info(f"{parent_id}:{index}", benchmark, "batch", phase_num)
+                             for index, benchmark in enumerate(group))
+    
+    return job_infos
+
+def start_job_monitor(args):
+    """Create the concurrency slots and start the thread that frees them as jobs finish"""
+    global _job_slots
+    _job_slots = threading.BoundedSemaphore(args.max_concurrent)
+    _running_jobs.clear()
+    _monitor_stop.clear()
+    if args.dry_run:
+        return None
+    
+    thread = threading.Thread(target=monitor_running_jobs, args=(args,),
+                              name="job-monitor", daemon=True)
+    thread.start()
+    return thread
+
+def stop_job_monitor(thread):
+    """Stop the job monitor thread"""
+    _monitor_stop.set()
+    if thread:
+        thread.join()
+
+def acquire_job_slot():
+    """Block until fewer than --max-concurrent jobs are running"""
+    if not _job_slots.acquire(blocking=False):
+        logger.info("Reached maximum concurrent jobs, waiting for one to complete...")
+        _job_slots.acquire()
+
+def track_job(job_info, args):
+    """Hand a submitted job's slot to the monitor, or free it if nothing is running"""
+    if job_info is None or args.dry_run:
+        _job_slots.release()
+        return
+    with _running_lock:
+        _running_jobs[job_info["job_id"]] = (job_info, time.time())
+
+def monitor_running_jobs(args):
+    """Release a concurrency slot whenever a tracked job finishes"""
+    # Use the AWS_REGION environment variable or default to us-west-2
+    region = os.environ.get('AWS_REGION', 'us-west-2')
+    batch_client = get_aws_client('batch', region)
+    queue_url = getattr(args, 'job_event_queue_url', None)
+    sqs_client = get_aws_client('sqs', region) if queue_url else None
+    last_poll = 0
+    
+    while not _monitor_stop.is_set():
+        if queue_url:
+            try:
+                receive_tracked_job_events(sqs_client, queue_url, _running_jobs)
+            except Exception as e:
+                logger.error("Error receiving job events: %s", e)
+                # The failed long poll didn't block, so wait before retrying
+                if _monitor_stop.wait(JOB_MONITOR_INTERVAL_SECONDS):
+                    break
+        elif _monitor_stop.wait(JOB_MONITOR_INTERVAL_SECONDS):
+            break
+        
+        with _running_lock:
+            running = dict(_running_jobs)
+        
+        finished = []
+        pending_batch = {}
+        for job_id, (job, started) in running.items():
+            if job["type"] == "batch":
+                job_details = _completed_job_events.pop(job_id, None)
+                if job_details:
+                    complete_batch_job(job, job_details)
+                    finished.append(job_id)
+                else:
+                    pending_batch[job_id] = job
+            elif time.time() - started >= PARALLEL_CLUSTER_SLOT_TIMEOUT_SECONDS:
+                # ParallelCluster job status is not available; free the slot after
+                # the same timeout wait_for_batch_jobs uses
+                logger.warning("Releasing slot of ParallelCluster job %s after %s minutes",
+                               job_id, PARALLEL_CLUSTER_SLOT_TIMEOUT_SECONDS // 60)
+                finished.append(job_id)
+        
+        if pending_batch and (not queue_url
+                              or time.time() - last_poll >= JOB_RECONCILE_INTERVAL_SECONDS):
+            still_pending = dict(pending_batch)
+            poll_batch_jobs(batch_client, still_pending)
+            finished.extend(job_id for job_id in pending_batch if job_id not in still_pending)
+            last_poll = time.time()
+        
+        with _running_lock:
+            for job_id in finished:
+                if _running_jobs.pop(job_id, None):
+                    _job_slots.release()
+
 def run_benchmarks(config, args):
     """Run benchmarks according to configuration"""
     # Determine which phases to run
@@ -369,7 +925,7 @@ def run_benchmarks(config, args):
         if phase_key in config:
             phases = [(args.phase, config[phase_key])]
         else:
-            logger.error(f"Phase {args.phase} not found in configuration")
+            logger.error("Phase %s not found in configuration", args.phase)
             return []
     else:
         # Run all phases
@@ -378,76 +934,96 @@ def run_benchmarks(config, args):
             if phase_key in config:
                 phases.append((i, config[phase_key]))
     
-    # Track submitted jobs
+    # Track submitted jobs; --max-concurrent is enforced by the job monitor's slots
     submitted_jobs = []
+    monitor = start_job_monitor(args)
     
-    # Run each phase
-    for phase_num, benchmarks in phases:
-        logger.info(f"Starting benchmarks for Phase {phase_num}")
-        
-        # Process each benchmark in the phase
-        for benchmark in benchmarks:
-            benchmark_id = benchmark.get("id", "unknown")
-            logger.info(f"Processing benchmark {benchmark_id}")
-            
-            # Determine if this is a GC Classic or GCHP benchmark
-            is_gchp = benchmark.get("application", "gc-classic").lower() == "gchp"
+    try:
+        # Classify every benchmark up front so the GCHP configs of all phases can
+        # be uploaded in one concurrent pass
+        plan = []
+        for phase_num, benchmarks in phases:
+            # GC Classic and GCHP benchmarks are collected and submitted below
+            gc_classic_benchmarks = []
+            gchp_benchmarks = []
             
-            if is_gchp:
-                # Check if ParallelCluster is specified
-                if not args.parallel_cluster:
-                    logger.warning(f"Skipping GCHP benchmark {benchmark_id} - no ParallelCluster specified")
-                    continue
-
-                # Generate and submit ParallelCluster job
-                job_params = generate_parallel_cluster_job_params(benchmark, args)
-                if job_params:
-                    job_id = submit_parallel_cluster_job(job_params, args)
-                    if job_id:
-                        job_info = {
-                            "job_id": job_id,
-                            "benchmark_id": benchmark_id,
-                            "type": "parallel_cluster",
-                            "phase": phase_num,
-                            "submission_time": datetime.datetime.now().isoformat(),
-                            "benchmark": benchmark  # Include the full benchmark config
-                        }
-                        submitted_jobs.append(job_info)
-            else:
-                # Check if job queue and definition are specified
-                if not args.job_queue or not args.job_definition:
-                    logger.warning(f"Skipping GC Classic benchmark {benchmark_id} - no job queue or definition specified")
-                    continue
-
-                # Generate and submit AWS Batch job
-                job_params = generate_batch_job_params(benchmark, args)
-                job_id = submit_batch_job(job_params, args)
-                if job_id:
-                    job_info = {
-                        "job_id": job_id,
-                        "benchmark_id": benchmark_id,
-                        "type": "batch",
-                        "phase": phase_num,
-                        "submission_time": datetime.datetime.now().isoformat(),
-                        "benchmark": benchmark  # Include the full benchmark config
-                    }
-                    submitted_jobs.append(job_info)
+            # Process each benchmark in the phase
+            for benchmark in benchmarks:
+                benchmark_id = benchmark.get("id", "unknown")
+                logger.info("Processing benchmark %s", benchmark_id)
+                
+                # Determine if this is a GC Classic or GCHP benchmark
+                is_gchp = benchmark.get("application", "gc-classic").lower() == "gchp"
+                
+                if is_gchp:
+                    # Check if ParallelCluster is specified
+                    if not args.parallel_cluster:
+                        logger.warning("Skipping GCHP benchmark %s - no ParallelCluster specified",
+                                       benchmark_id)
+                        continue
+
+                    gchp_benchmarks.append(benchmark)
+                else:
+                    # Check if job queue and definition are specified
+                    if not args.job_queue or not args.job_definition:
+                        logger.warning("Skipping GC Classic benchmark %s - "
+                                       "no job queue or definition specified", benchmark_id)
+                        continue
+                    
+                    gc_classic_benchmarks.append(benchmark)
             
-            # Limit concurrent jobs
-            if len(submitted_jobs) >= args.max_concurrent:
-                logger.info(f"Reached maximum concurrent jobs ({args.max_concurrent}), waiting for some to complete...")
-                # Wait for a subset of jobs to complete
-                subset_to_wait = submitted_jobs[:min(5, len(submitted_jobs))]
-                wait_for_batch_jobs(subset_to_wait, args)  # Wait for the first few to complete
-                # Remove completed jobs from our tracking list
-                for job in subset_to_wait:
-                    if job in submitted_jobs:
-                        submitted_jobs.remove(job)
+            plan.append((phase_num, gc_classic_benchmarks, gchp_benchmarks))
+        
+        pending_uploads = [(benchmark, generate_parallel_cluster_job_params(benchmark, args))
+                           for _, _, gchp_benchmarks in plan for benchmark in gchp_benchmarks]
+        uploaded = {id(benchmark): job_params
+                    for benchmark, job_params in upload_benchmark_configs(pending_uploads, args)}
+        
+        # Phases have no execution dependencies on each other, so the jobs of every
+        # phase go through one submission pool: the ParallelCluster jobs whose configs
+        # uploaded and the GC Classic jobs, each submitted as soon as a slot is free
+        submissions = []
+        for phase_num, gc_classic_benchmarks, gchp_benchmarks in plan:
+            logger.info("Queueing benchmarks for Phase %s", phase_num)
+            submissions += [
+                functools.partial(submit_gchp_benchmark, benchmark, uploaded[id(benchmark)],
+                                  phase_num, args)
+                for benchmark in gchp_benchmarks if id(benchmark) in uploaded
+            ]
+            if not args.array_jobs:
+                submissions += [
+                    functools.partial(submit_gc_classic_benchmark, benchmark, phase_num, args)
+                    for benchmark in gc_classic_benchmarks
+                ]
+        submitted_jobs.extend(submit_with_slots(submissions, args))
+        
+        # Array mode batches together every GC Classic benchmark that currently has a free slot.
+        # The windows start only after submit_with_slots returns, i.e. once every pooled
+        # ParallelCluster submission holds a slot, so GC Classic arrays queue behind them
+        for phase_num, gc_classic_benchmarks, _ in plan:
+            backlog = deque(gc_classic_benchmarks) if args.array_jobs else ()
+            while backlog:
+                acquire_job_slot()
+                window = [backlog.popleft()]
+                while backlog and _job_slots.acquire(blocking=False):
+                    window.append(backlog.popleft())
+                
+                job_infos = [job_info for job_info in
+                             submit_gc_classic_array_jobs(window, phase_num, args) if job_info]
+                submitted_jobs.extend(job_infos)
+                for job_info in job_infos:
+                    track_job(job_info, args)
+                for _ in range(len(window) - len(job_infos)):
+                    track_job(None, args)
+
+    finally:
+        stop_job_monitor(monitor)
     
     # Wait for all remaining jobs
-    if submitted_jobs and not args.dry_run:
-        logger.info(f"Waiting for {len(submitted_jobs)} remaining jobs to complete...")
-        wait_for_batch_jobs(submitted_jobs, args)
+    remaining_jobs = [job for job, _ in _running_jobs.values()]
+    if remaining_jobs and not args.dry_run:
+        logger.info("Waiting for %s remaining jobs to complete...", len(remaining_jobs))
+        wait_for_batch_jobs(remaining_jobs, args)
 
     return submitted_jobs
 
@@ -460,13 +1036,20 @@ def save_benchmark_metadata(submitted_jobs, args):
     timestamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
     metadata_file = f"benchmark-jobs-{timestamp}.json"
 
+    # Embed the benchmark configs serialized at submission time rather than
+    # walking each dict again
+    jobs = submitted_jobs
+    if orjson_fragment is not None:
+        jobs = [dict(job, benchmark=orjson_fragment(benchmark_json(job["benchmark"])))
+                for job in submitted_jobs]
+
     # Prepare metadata including job information and submission details
     metadata = {
         "benchmark_run_id": timestamp,
         "submission_time": datetime.datetime.now().isoformat(),
         "submitted_by": os.getenv("USER", "unknown"),
         "dry_run": args.dry_run,
-        "jobs": submitted_jobs,
+        "jobs": jobs,
         # Include configuration options used
         "configuration": {
             "config_file": args.config,
@@ -478,29 +1061,45 @@ def save_benchmark_metadata(submitted_jobs, args):
         }
     }
 
-    # Save metadata to file
-    try:
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        logger.info(f"Saved benchmark job metadata to {metadata_file}")
+    # Serialize once for both the S3 copy and the optional local file
+    body = dumps_json(metadata, indent=True)
+    upload = args.output_bucket and not args.dry_run
+    save_local = args.save_local_metadata or not upload
 
-        # If we have an output bucket, also save there
-        if args.output_bucket and not args.dry_run:
+    try:
+        if upload:
             try:
                 # Use the AWS_REGION environment variable or default to us-west-2
                 region = os.environ.get('AWS_REGION', 'us-west-2')
                 logger.info(f"Using AWS region for S3: {region}")
 
-                s3_client = boto3.client('s3', region_name=region)
+                s3_client = get_aws_client('s3', region)
                 s3_key = f"benchmark-metadata/{metadata_file}"
+                put_args = {}
+                upload_body = body
+                # Large runs produce MB-scale metadata; store those zstd-compressed
+                if zstd is not None and len(body) >= METADATA_COMPRESS_THRESHOLD:
+                    upload_body = zstd.ZstdCompressor(level=3).compress(body)
+                    s3_key += ".zst"
+                    put_args = {"ContentEncoding": "zstd"}
                 s3_client.put_object(
                     Bucket=args.output_bucket,
                     Key=s3_key,
-                    Body=json.dumps(metadata, indent=2)
+                    Body=upload_body,
+                    ContentType='application/json',
+                    **put_args
                 )
                 logger.info(f"Uploaded benchmark job metadata to s3://{args.output_bucket}/{s3_key}")
             except Exception as e:
                 logger.error(f"Error uploading metadata to S3: {e}")
+                # Keep the metadata locally rather than losing it
+                save_local = True
+
+        # Save metadata to file when requested or when there is no S3 copy
+        if save_local:
+            with open(metadata_file, 'wb') as f:
+                f.write(body)
+            logger.info("Saved benchmark job metadata to %s", metadata_file)
 
         return metadata_file
     except Exception as e:
@@ -511,6 +1110,11 @@ def main():
     """Main function"""
     args = parse_args()
 
+    if args.log_file:
+        file_handler = logging.FileHandler(args.log_file)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        log_listener.handlers += (file_handler,)
+
     try:
         # Load and validate configuration
         config = load_config(args.config)
@@ -533,6 +1137,11 @@ def main():
             logger.error("Output bucket is required")
             sys.exit(1)
 
+        # Subscribe to Batch job state changes before any job is submitted
+        if args.job_events and args.job_queue and not args.dry_run:
+            args.job_event_queue_url, args.job_event_rule = setup_job_event_queue(
+                os.environ.get('AWS_REGION', 'us-west-2'), args.job_queue)
+
         # Run benchmarks and track submitted jobs
         all_submitted_jobs = []
 
@@ -552,6 +1161,10 @@ def main():
         import traceback
         logger.error(traceback.format_exc())
         sys.exit(1)
+    finally:
+        if getattr(args, 'job_event_queue_url', None):
+            teardown_job_event_queue(os.environ.get('AWS_REGION', 'us-west-2'),
+                                     args.job_event_queue_url, args.job_event_rule)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
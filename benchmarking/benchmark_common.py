@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+benchmark_common.py
+
+AWS helpers shared by benchmark-orchestrator.py and
+testing/scripts/instance-benchmark.py.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import boto3
+import yaml
+import logging
+from botocore.config import Config
+
+# orjson reads the config cache faster when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Token bucket pacing SubmitJob calls just under Batch's ~50 TPS account limit
+SUBMIT_RATE_PER_SECOND = 40
+SUBMIT_BURST = 10
+_submit_bucket = {"tokens": SUBMIT_BURST, "updated": time.monotonic()}
+_submit_bucket_lock = threading.Lock()
+
+# Terminal Batch job state changes delivered to the job event queues
+JOB_EVENT_PATTERN = {
+    "source": ["aws.batch"],
+    "detail-type": ["Batch Job State Change"],
+    "detail": {"status": ["SUCCEEDED", "FAILED"]}
+}
+
+# Shared client configuration: a connection pool large enough for the submit,
+# upload and describe threads, and adaptive retries that back off when AWS throttles
+BOTO_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    tcp_keepalive=True
+)
+
+# One session resolves credentials and endpoints for every client; creating
+# clients from it is not thread-safe
+_session = boto3.session.Session()
+_client_lock = threading.Lock()
+
+def get_config_cache_path(config_path):
+    """Path of the JSON sidecar that caches the parsed YAML configuration"""
+    directory, filename = os.path.split(os.path.abspath(config_path))
+    return os.path.join(directory, f".{filename}.cache.json")
+
+def load_cached_yaml(config_path):
+    """Parse a YAML configuration file, via its JSON sidecar cache when the content is unchanged"""
+    with open(config_path, 'rb') as file:
+        content = file.read()
+    # Key on the content rather than mtime so copies and checkouts still hit the cache
+    cache_key = hashlib.sha256(content).hexdigest()
+    cache_path = get_config_cache_path(config_path)
+    
+    # JSON parses far faster than YAML, so reuse the cached parse if the file is unchanged
+    try:
+        with open(cache_path, 'rb') as f:
+            data = f.read()
+        cached = orjson.loads(data) if orjson else json.loads(data)
+        if cached.get("key") == cache_key:
+            return cached["config"]
+    except (OSError, ValueError, AttributeError):
+        pass
+    
+    config = yaml.load(content, Loader=YAML_LOADER)
+    
+    # Write the cache atomically; failing to cache (e.g. read-only checkout) is not an error
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"key": cache_key, "config": config}, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug("Could not cache configuration: %s", e)
+        if tmp_path and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    return config
+
+@functools.lru_cache(maxsize=None)
+def get_aws_client(service, region=None):
+    """Return a shared boto3 client for a service/region, created on first use"""
+    with _client_lock:
+        return _session.client(service, region_name=region, config=BOTO_CONFIG)
+
+def wait_for_submit_token(rate=SUBMIT_RATE_PER_SECOND):
+    """Block until the submit token bucket allows another SubmitJob call"""
+    while True:
+        with _submit_bucket_lock:
+            now = time.monotonic()
+            tokens = min(SUBMIT_BURST, _submit_bucket["tokens"]
+                         + (now - _submit_bucket["updated"]) * rate)
+            _submit_bucket["updated"] = now
+            if tokens >= 1:
+                _submit_bucket["tokens"] = tokens - 1
+                return
+            _submit_bucket["tokens"] = tokens
+            delay = (1 - tokens) / rate
+        time.sleep(delay)
+
+def create_job_event_queue(region, name, detail, description):
+    """Create an SQS queue fed by a rule matching Batch job state changes with the given detail"""
+    sqs_client = get_aws_client('sqs', region)
+    events_client = get_aws_client('events', region)
+    event_pattern = dict(JOB_EVENT_PATTERN, detail=dict(JOB_EVENT_PATTERN["detail"], **detail))
+    
+    queue_url = sqs_client.create_queue(
+        QueueName=name,
+        Attributes={'MessageRetentionPeriod': '86400'}
+    )['QueueUrl']
+    queue_arn = sqs_client.get_queue_attributes(
+        QueueUrl=queue_url, AttributeNames=['QueueArn']
+    )['Attributes']['QueueArn']
+    
+    rule_arn = events_client.put_rule(
+        Name=name,
+        EventPattern=json.dumps(event_pattern),
+        State='ENABLED',
+        Description=description
+    )['RuleArn']
+    
+    # Allow the rule to deliver into the queue
+    policy = {
+        "Version": "2012-10-17",
+        "Statement": [{
+            "Effect": "Allow",
+            "Principal": {"Service": "events.amazonaws.com"},
+            "Action": "sqs:SendMessage",
+            "Resource": queue_arn,
+            "Condition": {"ArnEquals": {"aws:SourceArn": rule_arn}}
+        }]
+    }
+    sqs_client.set_queue_attributes(QueueUrl=queue_url,
+                                    Attributes={'Policy': json.dumps(policy)})
+    events_client.put_targets(Rule=name,
+                              Targets=[{'Id': 'job-events-queue', 'Arn': queue_arn}])
+    
+    logger.info("Receiving Batch job state changes from %s", queue_url)
+    return queue_url
+
+def teardown_job_event_queue(region, queue_url, rule_name):
+    """Delete a job event rule and its queue, attempting each deletion even if another fails"""
+    sqs_client = get_aws_client('sqs', region)
+    events_client = get_aws_client('events', region)
+    try:
+        events_client.remove_targets(Rule=rule_name, Ids=['job-events-queue'])
+    except Exception as e:
+        logger.error("Error removing the targets of job event rule %s: %s", rule_name, e)
+    try:
+        events_client.delete_rule(Name=rule_name)
+    except Exception as e:
+        logger.error("Error deleting job event rule %s: %s", rule_name, e)
+    try:
+        sqs_client.delete_queue(QueueUrl=queue_url)
+    except Exception as e:
+        logger.error("Error deleting job event queue %s: %s", queue_url, e)
+
+def receive_job_events(sqs_client, queue_url):
+    """Long-poll the job event queue, returning the terminal job details keyed by job ID"""
+    response = sqs_client.receive_message(
+        QueueUrl=queue_url,
+        MaxNumberOfMessages=10,
+        WaitTimeSeconds=20
+    )
+    messages = response.get('Messages', [])
+    
+    descriptions = {}
+    for message in messages:
+        try:
+            body = message['Body']
+            detail = (orjson.loads(body) if orjson else json.loads(body))['detail']
+            descriptions[detail['jobId']] = detail
+        except (ValueError, KeyError) as e:
+            logger.warning("Ignoring malformed job event: %s", e)
+    
+    if messages:
+        sqs_client.delete_message_batch(
+            QueueUrl=queue_url,
+            Entries=[{'Id': str(i), 'ReceiptHandle': m['ReceiptHandle']}
+                     for i, m in enumerate(messages)]
+        )
+    return descriptions
@@ -6,6 +6,7 @@ set -e
 
 # Parse command line arguments
 BENCHMARK_JSON=""
+BENCHMARK_ARRAY=""
 OUTPUT_PATH=""
 
 while [[ $# -gt 0 ]]; do
@@ -14,6 +15,10 @@ while [[ $# -gt 0 ]]; do
       BENCHMARK_JSON="$2"
       shift 2
       ;;
+    --benchmark-array)
+      BENCHMARK_ARRAY="$2"
+      shift 2
+      ;;
     --output-path)
       OUTPUT_PATH="$2"
       shift 2
@@ -25,6 +30,15 @@ while [[ $# -gt 0 ]]; do
   esac
 done
 
+# Batch array jobs pass an S3 list of {benchmark, output_path} entries;
+# each child picks its own entry by array index
+if [ -n "$BENCHMARK_ARRAY" ]; then
+  ARRAY_INDEX=${AWS_BATCH_JOB_ARRAY_INDEX:-0}
+  aws s3 cp "${BENCHMARK_ARRAY}" /tmp/benchmark_array.json
+  BENCHMARK_JSON=$(jq -c ".[${ARRAY_INDEX}].benchmark" /tmp/benchmark_array.json)
+  OUTPUT_PATH=$(jq -r ".[${ARRAY_INDEX}].output_path" /tmp/benchmark_array.json)
+fi
+
 # Validate required arguments
 if [ -z "$BENCHMARK_JSON" ]; then
   echo "Error: --benchmark argument is required"
@@ -2,24 +2,56 @@
 # download_data.py - Download required input data for GEOS-Chem
 
 import argparse
+import json
 import os
-import subprocess
+import re
 import sys
 import yaml
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
+# One transfer manager downloads every object across all months concurrently
+MB = 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * MB,
+    multipart_chunksize=64 * MB,
+    max_concurrency=32,
+    use_threads=True
+)
+
+# Number of month prefixes listed in parallel
+LIST_WORKERS = 8
+
+# ETags of the objects already downloaded into the data directory, so reruns and
+# benchmarks sharing a data directory skip files that haven't changed
+INVENTORY_FILE = ".download-inventory.json"
+
+# The top-level paths: key of geoschem_config.yml, and the indented ExtData entry
+# searched for after it (value and trailing comment captured separately so only the
+# value is replaced)
+PATHS_KEY_PATTERN = re.compile(r'^paths:', re.MULTILINE)
+EXTDATA_PATTERN = re.compile(r'^([ \t]+ExtData:[ \t]*)([^#\n]*?)([ \t]*(?:#.*)?)$', re.MULTILINE)
+
+# Use the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Download GEOS-Chem input data")
     parser.add_argument("--input-path", required=True, help="S3 path to input data")
     parser.add_argument("--data-dir", default="/data", help="Local directory for data")
     parser.add_argument("--config-file", default="/opt/geos-chem/rundir/geoschem_config.yml", 
                         help="GEOS-Chem configuration file")
+    parser.add_argument("--accelerate", action="store_true",
+                        help="Use S3 Transfer Acceleration (the input bucket must have it enabled)")
     return parser.parse_args()
 
 def read_config(config_file):
     with open(config_file, 'r') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=YAML_LOADER)
     return config
 
 def get_required_data_paths(config, input_path):
@@ -36,27 +68,60 @@ def get_required_data_paths(config, input_path):
     # Get resolution
     resolution = config['simulation']['resolution'] if 'simulation' in config and 'resolution' in config['simulation'] else "4x5"
     
-    # Calculate months needed
-    current_date = start_date
-    while current_date <= end_date:
-        year_month = current_date.strftime("%Y/%m")
-        data_path = f"{input_path}/{year_month}/"
-        data_paths.append(data_path)
-        
-        # Move to next month
-        next_month = current_date.month + 1
-        next_year = current_date.year
-        if next_month > 12:
-            next_month = 1
-            next_year += 1
-        current_date = datetime(next_year, next_month, 1)
+    # Calculate months needed by counting months since year 0
+    first_month = start_date.year * 12 + start_date.month - 1
+    last_month = end_date.year * 12 + end_date.month - 1
+    for month_index in range(first_month, last_month + 1):
+        year, month = divmod(month_index, 12)
+        data_paths.append(f"{input_path}/{year:04d}/{month + 1:02d}/")
     
     return data_paths
 
-def download_data(data_paths, data_dir):
+def list_objects(s3, bucket, prefix):
+    """List the (key, ETag, size) of the objects under an S3 prefix"""
+    objects = []
+    paginator = s3.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get('Contents', []):
+            if not obj['Key'].endswith('/'):
+                objects.append((obj['Key'], obj['ETag'], obj['Size']))
+    return objects
+
+def read_inventory(data_dir):
+    """Read the ETags of previously downloaded objects, keyed by bucket/key"""
+    try:
+        with open(os.path.join(data_dir, INVENTORY_FILE), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_inventory(data_dir, inventory):
+    """Atomically replace the download inventory"""
+    inventory_file = os.path.join(data_dir, INVENTORY_FILE)
+    with open(f"{inventory_file}.tmp", 'w') as f:
+        json.dump(inventory, f)
+    os.replace(f"{inventory_file}.tmp", inventory_file)
+
+def bucket_region(bucket):
+    """Look up the region an S3 bucket lives in (None if it can't be determined)"""
+    try:
+        response = boto3.client('s3').head_bucket(Bucket=bucket)
+    except ClientError as e:
+        # Redirects and access errors still report the bucket's region
+        response = e.response
+    return response.get('ResponseMetadata', {}).get('HTTPHeaders', {}).get('x-amz-bucket-region')
+
+def create_s3_client(region=None, accelerate=False):
+    """Create the S3 client shared by listing and downloading"""
+    return boto3.client('s3', region_name=region, config=Config(
+        max_pool_connections=TRANSFER_CONFIG.max_concurrency,
+        retries={'max_attempts': 10, 'mode': 'adaptive'},
+        s3={'use_accelerate_endpoint': accelerate}
+    ))
+
+def download_data(data_paths, data_dir, accelerate=False):
     """Download required data from S3"""
-    s3 = boto3.client('s3')
-    
+    prefixes = []
     for data_path in data_paths:
         # Parse bucket and key from S3 path
         if data_path.startswith('s3://'):
@@ -70,39 +135,78 @@ def download_data(data_paths, data_dir):
         # Create local directory structure
         local_dir = os.path.join(data_dir, prefix)
         os.makedirs(local_dir, exist_ok=True)
+        prefixes.append((bucket, prefix, local_dir))
+    
+    # Every month comes from the input bucket, so talk to that bucket's own region
+    # directly instead of being redirected there from the default endpoint
+    region = bucket_region(prefixes[0][0]) if prefixes else None
+    s3 = create_s3_client(region, accelerate)
+    
+    os.makedirs(data_dir, exist_ok=True)
+    inventory = read_inventory(data_dir)
+    try:
+        # List all month prefixes concurrently
+        with ThreadPoolExecutor(max_workers=LIST_WORKERS) as executor:
+            listings = list(executor.map(lambda p: list_objects(s3, p[0], p[1]), prefixes))
         
-        print(f"Downloading data from s3://{bucket}/{prefix} to {local_dir}")
-        
-        # Use AWS CLI for efficient recursive download
-        cmd = [
-            "aws", "s3", "cp", 
-            f"s3://{bucket}/{prefix}", 
-            local_dir,
-            "--recursive"
-        ]
-        
-        try:
-            subprocess.run(cmd, check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"Error downloading data: {e}")
-            sys.exit(1)
+        # Download every changed object through one connection pool, mirroring `aws s3 sync`
+        with create_transfer_manager(s3, TRANSFER_CONFIG) as manager:
+            futures = []
+            for (bucket, prefix, local_dir), objects in zip(prefixes, listings):
+                print(f"Downloading data from s3://{bucket}/{prefix} to {local_dir}")
+                for key, etag, size in objects:
+                    local_file = os.path.join(local_dir, key[len(prefix):].lstrip('/'))
+                    if (inventory.get(f"{bucket}/{key}") == etag
+                            and os.path.isfile(local_file)
+                            and os.path.getsize(local_file) == size):
+                        continue
+                    os.makedirs(os.path.dirname(local_file), exist_ok=True)
+                    futures.append((f"{bucket}/{key}", etag,
+                                    manager.download(bucket, key, local_file)))
+            for name, etag, future in futures:
+                future.result()
+                inventory[name] = etag
+    except Exception as e:
+        print(f"Error downloading data: {e}")
+        sys.exit(1)
+    finally:
+        # Keep whatever finished, even if another download failed
+        write_inventory(data_dir, inventory)
 
-def update_config_paths(config, data_dir):
+def update_config_paths(config, config_file, data_dir):
     """Update configuration file with local data paths"""
-    # Update ExtData path
-    if 'paths' in config:
+    if 'paths' not in config:
+        return
+    
+    # Edit the ExtData value under paths: in place, keeping the file's comments and layout
+    with open(config_file, 'r') as f:
+        text = f.read()
+    paths_key = PATHS_KEY_PATTERN.search(text)
+    match = paths_key and EXTDATA_PATTERN.search(text, paths_key.end())
+    if match:
+        text = text[:match.start(2)] + data_dir + text[match.end(2):]
+    
+    # Keep the edit only if it set paths.ExtData (the match may belong to another
+    # section, or the value may need quoting); otherwise rewrite the whole document
+    try:
+        edited = match and yaml.load(text, Loader=YAML_LOADER)
+    except yaml.YAMLError:
+        edited = None
+    if not (isinstance(edited, dict) and isinstance(edited.get('paths'), dict)
+            and edited['paths'].get('ExtData') == data_dir):
         config['paths']['ExtData'] = data_dir
+        text = yaml.dump(config, default_flow_style=False)
     
     # Write updated config
-    with open('/opt/geos-chem/rundir/geoschem_config.yml', 'w') as f:
-        yaml.dump(config, f, default_flow_style=False)
+    with open(config_file, 'w') as f:
+        f.write(text)
 
 def main():
     args = parse_args()
     config = read_config(args.config_file)
     data_paths = get_required_data_paths(config, args.input_path)
-    download_data(data_paths, args.data_dir)
-    update_config_paths(config, args.data_dir)
+    download_data(data_paths, args.data_dir, args.accelerate)
+    update_config_paths(config, args.config_file, args.data_dir)
     print("Data download complete")
 
 if __name__ == "__main__":
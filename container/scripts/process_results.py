@@ -5,16 +5,47 @@ import argparse
 import os
 import json
 import subprocess
-import glob
 import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# orjson parses and writes the run summary and manifest faster when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Multipart settings for large NetCDF outputs; smaller files go up in a single PUT
+MB = 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=64 * MB,
+    multipart_chunksize=64 * MB,
+    max_concurrency=16,
+    use_threads=True
+)
+
+# Logs, configs and small outputs skip the transfer manager and go up as plain PUTs
+# on their own pool, so they don't queue behind the parts of multi-GB NetCDF files
+SMALL_FILE_BYTES = 8 * MB
+SMALL_UPLOAD_WORKERS = 32
+
 def parse_args():
     parser = argparse.ArgumentParser(description="Process and upload GEOS-Chem results")
     parser.add_argument("--output-path", required=True, help="S3 path for results")
     parser.add_argument("--run-dir", default="/opt/geos-chem/rundir", help="GEOS-Chem run directory")
     return parser.parse_args()
 
+def scan_files(directory):
+    """List the paths of visible regular files in a directory (empty if it is missing)"""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries
+                    if not entry.name.startswith('.') and entry.is_file()]
+    except FileNotFoundError:
+        return []
+
 def collect_diagnostics(run_dir):
     """Collect diagnostic files and metadata"""
     diagnostics = {
@@ -24,21 +55,22 @@ def collect_diagnostics(run_dir):
         "restart_files": []
     }
     
-    # Output NetCDF files
-    for file in glob.glob(f"{run_dir}/OutputDir/*.nc*"):
-        diagnostics["output_files"].append(file)
-    
-    # Log files
-    for file in glob.glob(f"{run_dir}/*.log"):
-        diagnostics["log_files"].append(file)
+    # Log and configuration files, classified in a single pass over the run directory
+    for file in scan_files(run_dir):
+        if file.endswith(".log"):
+            diagnostics["log_files"].append(file)
+        elif file.endswith((".yml", ".rc")):
+            diagnostics["config_files"].append(file)
     
-    # Configuration files
-    for file in glob.glob(f"{run_dir}/*.yml") + glob.glob(f"{run_dir}/*.rc"):
-        diagnostics["config_files"].append(file)
+    # Output NetCDF files
+    for file in scan_files(f"{run_dir}/OutputDir"):
+        if ".nc" in os.path.basename(file):
+            diagnostics["output_files"].append(file)
     
     # Restart files
-    for file in glob.glob(f"{run_dir}/Restarts/*.nc*"):
-        diagnostics["restart_files"].append(file)
+    for file in scan_files(f"{run_dir}/Restarts"):
+        if ".nc" in os.path.basename(file):
+            diagnostics["restart_files"].append(file)
     
     return diagnostics
 
@@ -48,8 +80,8 @@ def create_manifest(run_dir, diagnostics, output_path):
     summary_file = f"{run_dir}/run_summary.json"
     summary = {}
     if os.path.exists(summary_file):
-        with open(summary_file, 'r') as f:
-            summary = json.load(f)
+        with open(summary_file, 'rb') as f:
+            summary = orjson.loads(f.read()) if orjson else json.load(f)
     
     # Create manifest
     manifest = {
@@ -64,8 +96,12 @@ def create_manifest(run_dir, diagnostics, output_path):
     
     # Write manifest locally
     manifest_file = f"{run_dir}/manifest.json"
-    with open(manifest_file, 'w') as f:
-        json.dump(manifest, f, indent=2)
+    if orjson:
+        with open(manifest_file, 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with open(manifest_file, 'w') as f:
+            json.dump(manifest, f, indent=2)
     
     return manifest_file
 
@@ -80,20 +116,33 @@ def upload_results(diagnostics, manifest_file, output_path):
         print(f"Invalid S3 path: {output_path}")
         return
     
-    s3 = boto3.client('s3')
-    
-    # Upload manifest
-    manifest_key = f"{prefix}/manifest.json"
-    print(f"Uploading manifest to s3://{bucket}/{manifest_key}")
-    s3.upload_file(manifest_file, bucket, manifest_key)
-    
-    # Upload output files
+    s3 = boto3.client('s3', config=Config(
+        max_pool_connections=TRANSFER_CONFIG.max_concurrency + SMALL_UPLOAD_WORKERS,
+        retries={'max_attempts': 10, 'mode': 'adaptive'}
+    ))
+    uploads = [(manifest_file, f"{prefix}/manifest.json")]
     for file_type in diagnostics:
         for file in diagnostics[file_type]:
             file_name = os.path.basename(file)
-            key = f"{prefix}/{file_type}/{file_name}"
+            uploads.append((file, f"{prefix}/{file_type}/{file_name}"))
+    
+    small = [(file, key) for file, key in uploads if os.path.getsize(file) < SMALL_FILE_BYTES]
+    large = [(file, key) for file, key in uploads if os.path.getsize(file) >= SMALL_FILE_BYTES]
+    
+    def put_file(file, key):
+        print(f"Uploading {file} to s3://{bucket}/{key}")
+        with open(file, 'rb') as f:
+            s3.put_object(Bucket=bucket, Key=key, Body=f)
+    
+    # Small files go up on their own pool while one transfer manager handles the large ones
+    with ThreadPoolExecutor(max_workers=SMALL_UPLOAD_WORKERS) as executor, \
+            create_transfer_manager(s3, TRANSFER_CONFIG) as manager:
+        futures = [executor.submit(put_file, file, key) for file, key in small]
+        for file, key in large:
             print(f"Uploading {file} to s3://{bucket}/{key}")
-            s3.upload_file(file, bucket, key)
+            futures.append(manager.upload(file, bucket, key))
+        for future in futures:
+            future.result()
     
     print(f"All results uploaded to s3://{bucket}/{prefix}/")
 
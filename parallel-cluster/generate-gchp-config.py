@@ -6,13 +6,77 @@ Script to generate GCHP configuration files for ParallelCluster execution.
 """
 
 import argparse
+import io
 import yaml
 import os
 import sys
 import datetime
+import functools
+import itertools
 import uuid
 import boto3
 import json
+import math
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson writes the JSON configs straight to bytes, much faster than the stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Use the libyaml-backed emitter when PyYAML was built with it
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Configs go up through the S3 transfer manager; anything past the threshold
+# (e.g. configs carrying large diagnostic lists) is sent as a multipart upload
+MB = 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# Allowed values of the choice-bound options, shared by argparse and --sweep
+SIMULATION_TYPES = ["fullchem", "aerosol", "transport", "ch4", "co2"]
+RESOLUTIONS = ["c24", "c48", "c90", "c180", "c360"]
+ARCHITECTURES = ["graviton", "x86"]
+
+# Cubed-sphere face size of each resolution
+CS_SIZES = {
+    "c24": 24,
+    "c48": 48,
+    "c90": 90,
+    "c180": 180,
+    "c360": 360
+}
+
+# Supported number of compute nodes
+MIN_NODES = 1
+MAX_NODES = 8
+
+# Options a --sweep file may give lists of values for
+SWEEP_CHOICES = {
+    "simulation_type": SIMULATION_TYPES,
+    "resolution": RESOLUTIONS,
+    "duration_days": None,
+    "start_date": None,
+    "nodes": None,
+    "architecture": ARCHITECTURES
+}
+
+# argparse types of the swept options that are not plain strings. Sweep values
+# are converted from their text like command-line values, so YAML dates and
+# quoted numbers end up with the same types as the parsed arguments
+SWEEP_TYPES = {
+    "duration_days": int,
+    "nodes": int
+}
+
+# Number of threads uploading sweep configs concurrently
+SWEEP_UPLOAD_WORKERS = 16
 
 def parse_args():
     """Parse command line arguments"""
@@ -21,10 +85,10 @@ def parse_args():
     parser.add_argument("--output-path", "-o", required=True,
                         help="S3 path to store the configuration file")
     parser.add_argument("--simulation-type", "-t", default="fullchem",
-                        choices=["fullchem", "aerosol", "transport", "ch4", "co2"],
+                        choices=SIMULATION_TYPES,
                         help="Type of simulation")
     parser.add_argument("--resolution", "-r", default="c24",
-                        choices=["c24", "c48", "c90", "c180", "c360"],
+                        choices=RESOLUTIONS,
                         help="Cubed-sphere resolution")
     parser.add_argument("--duration-days", "-d", type=int, default=7,
                         help="Simulation duration in days")
@@ -33,10 +97,13 @@ def parse_args():
     parser.add_argument("--nodes", "-n", type=int, default=2,
                         help="Number of compute nodes (1-8)")
     parser.add_argument("--architecture", "-a", default="graviton",
-                        choices=["graviton", "x86"],
+                        choices=ARCHITECTURES,
                         help="Processor architecture")
     parser.add_argument("--description", "--desc", default="",
                         help="Optional description of the simulation")
+    parser.add_argument("--sweep",
+                        help="YAML/JSON file mapping options (e.g. resolution, nodes) to lists of "
+                             "values; one config per combination is uploaded under --output-path")
     
     return parser.parse_args()
 
@@ -54,7 +121,7 @@ def validate_args(args):
             sys.exit("Error: start-date must be in YYYY-MM-DD format")
     
     # Validate nodes
-    if args.nodes < 1 or args.nodes > 8:
+    if args.nodes < MIN_NODES or args.nodes > MAX_NODES:
         sys.exit("Error: nodes must be between 1 and 8")
 
 def get_nz_levels(resolution):
@@ -71,31 +138,22 @@ def get_stretched_grid_params(resolution):
         "stretch_factor": 1.0  # 1.0 means no stretching
     }
 
-def get_processor_layout(resolution, nodes):
+def compute_processor_layout(resolution, nodes):
     """
-    Get processor layout based on resolution and number of nodes
+    Compute processor layout based on resolution and number of nodes
     Returns (IM_WORLD, JM_WORLD) - number of processes in X and Y directions
     """
-    # Mapping of resolution to cubed-sphere size
-    cs_sizes = {
-        "c24": 24,
-        "c48": 48,
-        "c90": 90,
-        "c180": 180,
-        "c360": 360
-    }
-    
     # Total number of cores (64 cores per node)
     total_cores = nodes * 64
     
-    # For GCHP, 6 faces of the cube
+    # For GCHP, 6 faces of the cube. 64 * nodes is only divisible by 6 when nodes
+    # is a multiple of 3; otherwise the remainder cores are left out of the layout
     cores_per_face = total_cores // 6
     
     # Calculate layout - keep X*Y close to cores_per_face
     # The product of IM_WORLD and JM_WORLD should equal cores_per_face
     # Try to keep them as close as possible for load balancing
-    import math
-    side_length = cs_sizes[resolution]
+    side_length = CS_SIZES[resolution]
     
     # Find factors of cores_per_face
     factors = []
@@ -115,20 +173,44 @@ def get_processor_layout(resolution, nodes):
     # Fallback
     return 1, cores_per_face
 
-def create_gchp_config(args):
-    """Create GCHP configuration file"""
+# Every valid (resolution, nodes) layout, computed once at import
+PROCESSOR_LAYOUTS = {
+    (resolution, nodes): compute_processor_layout(resolution, nodes)
+    for resolution in RESOLUTIONS for nodes in range(MIN_NODES, MAX_NODES + 1)
+}
+
+def get_processor_layout(resolution, nodes):
+    """
+    Get processor layout based on resolution and number of nodes
+    Returns (IM_WORLD, JM_WORLD) - number of processes in X and Y directions
+    """
+    layout = PROCESSOR_LAYOUTS.get((resolution, nodes))
+    return layout if layout else compute_processor_layout(resolution, nodes)
+
+@functools.lru_cache(maxsize=None)
+def get_s3_client():
+    """Return the S3 client shared by every upload, created on first use"""
+    return boto3.client('s3', config=Config(
+        max_pool_connections=TRANSFER_CONFIG.max_concurrency,
+        tcp_keepalive=True,
+        retries={'mode': 'standard'}
+    ))
+
+def create_gchp_config(args, *, now=None, sim_id=None):
+    """Create GCHP configuration file (a sweep passes one shared timestamp as now)"""
+    now = now or datetime.datetime.now()
+    
     # Set start date
     start_date = args.start_date
-    if not start_date:
+    if start_date:
+        start = datetime.datetime.strptime(start_date, "%Y-%m-%d").date()
+    else:
         # Default to current date
-        start_date = datetime.datetime.now().strftime("%Y-%m-%d")
-    
-    # Parse start date
-    start_datetime = datetime.datetime.strptime(start_date, "%Y-%m-%d")
+        start = now.date()
+        start_date = start.isoformat()
     
     # Calculate end date
-    end_datetime = start_datetime + datetime.timedelta(days=args.duration_days)
-    end_date = end_datetime.strftime("%Y-%m-%d")
+    end_date = (start + datetime.timedelta(days=args.duration_days)).isoformat()
     
     # Get processor layout
     im_world, jm_world = get_processor_layout(args.resolution, args.nodes)
@@ -136,9 +218,9 @@ def create_gchp_config(args):
     # Create configuration
     config = {
         "simulation": {
-            "id": str(uuid.uuid4()),
+            "id": sim_id or uuid.uuid4().hex,
             "type": args.simulation_type,
-            "created_at": datetime.datetime.now().isoformat(),
+            "created_at": now.isoformat(),
             "description": args.description or f"GCHP {args.simulation_type} simulation at {args.resolution} resolution",
             "duration_days": args.duration_days,
             "start_date": start_date,
@@ -175,7 +257,7 @@ def create_gchp_config(args):
     
     return config
 
-def upload_to_s3(config, output_path):
+def upload_to_s3(config, output_path, s3_client=None):
     """Upload configuration to S3"""
     # Parse S3 URL
     if not output_path.startswith("s3://"):
@@ -185,31 +267,112 @@ def upload_to_s3(config, output_path):
     bucket = parts[0]
     key = parts[1] if len(parts) > 1 else ""
     
-    # Make sure key ends with .yml or .json
+    # Make sure key ends with .yml or .json (JSON by default: it is far quicker to
+    # emit, and still valid YAML for the job script)
     if not (key.endswith('.yml') or key.endswith('.yaml') or key.endswith('.json')):
-        key = key.rstrip('/') + '/gchp-config.yml'
+        key = key.rstrip('/') + '/gchp-config.json'
     
-    # Configure S3 client
-    s3_client = boto3.client('s3')
+    # Reuse the shared S3 client unless the caller supplies one
+    s3_client = s3_client or get_s3_client()
     
-    # Convert config to YAML
-    config_str = yaml.dump(config, default_flow_style=False)
+    # Convert config to JSON, or YAML when a .yml/.yaml key was given
+    if key.endswith('.json'):
+        if orjson is not None:
+            body = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            body = json.dumps(config, indent=2, default=str).encode('utf-8')
+        content_type = 'application/json'
+    else:
+        body = yaml.dump(config, Dumper=YAML_DUMPER, default_flow_style=False).encode('utf-8')
+        content_type = 'application/yaml'
     
     # Upload to S3
-    s3_client.put_object(
-        Bucket=bucket,
-        Key=key,
-        Body=config_str,
-        ContentType='application/yaml'
+    s3_client.upload_fileobj(
+        io.BytesIO(body),
+        bucket,
+        key,
+        ExtraArgs={'ContentType': content_type},
+        Config=TRANSFER_CONFIG
     )
     
     return f"s3://{bucket}/{key}"
 
+def expand_sweep(args):
+    """Expand the --sweep file into one argument namespace per combination of values"""
+    try:
+        with open(args.sweep, 'r') as f:
+            matrix = yaml.safe_load(f) or {}
+    except (OSError, yaml.YAMLError, ValueError) as e:
+        # PyYAML raises ValueError for impossible dates such as 2024-13-01
+        sys.exit(f"Error: cannot read sweep file {args.sweep}: {e}")
+    if not isinstance(matrix, dict):
+        sys.exit("Error: the sweep file must map option names to lists of values")
+    
+    options = {}
+    for option, values in matrix.items():
+        option = str(option).replace('-', '_')
+        if option not in SWEEP_CHOICES:
+            sys.exit(f"Error: cannot sweep over '{option}' "
+                     f"(choose from {', '.join(SWEEP_CHOICES)})")
+        values = values if isinstance(values, list) else [values]
+        # YAML reads unquoted dates as datetime.date; take their ISO form as the text
+        convert = SWEEP_TYPES.get(option, str)
+        try:
+            values = [convert(value.isoformat() if isinstance(value, datetime.date) else str(value))
+                      for value in values]
+        except ValueError:
+            sys.exit(f"Error: invalid {option} values {values} "
+                     f"(expected {convert.__name__} values)")
+        choices = SWEEP_CHOICES[option]
+        invalid = [value for value in values if choices and value not in choices]
+        if invalid:
+            sys.exit(f"Error: invalid {option} values {invalid} (choose from {', '.join(choices)})")
+        options[option] = values
+    
+    sweep = []
+    for combination in itertools.product(*options.values()):
+        sweep_args = argparse.Namespace(**vars(args))
+        for option, value in zip(options, combination):
+            setattr(sweep_args, option, value)
+        validate_args(sweep_args)
+        sweep.append(sweep_args)
+    return sweep
+
+def sweep_config_path(args):
+    """S3 path of one sweep member's config under --output-path"""
+    name = (f"{args.simulation_type}-{args.resolution}-{args.duration_days}d-"
+            f"{args.nodes}n-{args.architecture}")
+    if args.start_date:
+        name += f"-{args.start_date}"
+    return f"{args.output_path.rstrip('/')}/{name}.json"
+
+def run_sweep(args):
+    """Generate every config in the sweep and upload them concurrently"""
+    sweep = expand_sweep(args)
+    
+    # Build the configs serially (cheap, sharing one creation time), then overlap the uploads
+    now = datetime.datetime.now()
+    uploads = [(create_gchp_config(sweep_args, now=now), sweep_config_path(sweep_args))
+               for sweep_args in sweep]
+    s3_client = get_s3_client()
+    with ThreadPoolExecutor(max_workers=min(SWEEP_UPLOAD_WORKERS, len(uploads) or 1)) as executor:
+        output_urls = list(executor.map(lambda upload: upload_to_s3(*upload, s3_client), uploads))
+    
+    print(f"Generated and uploaded {len(output_urls)} GCHP configurations:")
+    for sweep_args, output_url in zip(sweep, output_urls):
+        print(f"  {output_url}")
+        print(f"    submit-gchp -c {output_url} -o [output_path] -d {sweep_args.duration_days} "
+              f"-n {sweep_args.nodes} -q gchp-{sweep_args.architecture}")
+
 def main():
     """Main function"""
     args = parse_args()
     validate_args(args)
     
+    if args.sweep:
+        run_sweep(args)
+        return
+    
     config = create_gchp_config(args)
     output_url = upload_to_s3(config, args.output_path)
     
@@ -9,6 +9,13 @@ import sys
 import subprocess
 from pathlib import Path
 
+# Run flake8 in this interpreter when it is importable (skips a second Python
+# start-up and plugin load); otherwise fall back to the flake8 command
+try:
+    from flake8.main.application import Application
+except ImportError:
+    Application = None
+
 # Directories to check for Python files
 DIRS_TO_CHECK = [
     'benchmarking',
@@ -17,6 +24,19 @@ DIRS_TO_CHECK = [
     'visualization/lambda',
 ]
 
+# Directories never descended into (hidden directories are skipped as well)
+SKIP_DIRS = {'__pycache__', 'node_modules', 'venv'}
+
+def scan_python_files(directory):
+    """Recursively yield the .py files under a directory with a single scandir walk."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if not entry.name.startswith('.') and entry.name not in SKIP_DIRS:
+                    yield from scan_python_files(entry.path)
+            elif entry.name.endswith('.py') and entry.is_file():
+                yield entry.path
+
 def find_python_files(base_dir, dirs_to_check):
     """Find all Python files in the specified directories."""
     python_files = []
@@ -26,10 +46,7 @@ def find_python_files(base_dir, dirs_to_check):
             print(f"Warning: Directory {dir_path} does not exist")
             continue
         
-        for root, _, files in os.walk(dir_path):
-            for file in files:
-                if file.endswith('.py'):
-                    python_files.append(os.path.join(root, file))
+        python_files.extend(scan_python_files(dir_path))
     
     return python_files
 
@@ -40,6 +57,11 @@ def run_flake8(files):
         return 0
     
     print(f"Running flake8 on {len(files)} Python files...")
+    if Application is not None:
+        app = Application()
+        app.run(['--jobs=auto'] + files)
+        return app.exit_code()
+    
     try:
         result = subprocess.run(['flake8'] + files, check=False)
         return result.returncode
@@ -8,19 +8,34 @@ the results to determine the optimal instance type for different workloads.
 """
 
 import argparse
-import boto3
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 import json
 import yaml
 import time
 import datetime
+import html
 import uuid
 import os
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
 
+# Helpers shared with the benchmark orchestrator live in benchmarking/
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, os.pardir, "benchmarking"))
+from benchmark_common import (  # noqa: E402 (needs the sys.path entry above)
+    SUBMIT_RATE_PER_SECOND, YAML_LOADER, create_job_event_queue, get_aws_client,
+    load_cached_yaml, receive_job_events, teardown_job_event_queue, wait_for_submit_token
+)
+
+# orjson writes the job files faster when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,6 +47,142 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Configs parse with the libyaml-backed loader when PyYAML was built with it
+if YAML_LOADER is yaml.SafeLoader:
+    logger.warning("PyYAML was built without libyaml; configuration parsing will be slower")
+
+# Hardware fields a benchmark needs for its instance to be benchmarked
+REQUIRED_HARDWARE_FIELDS = ("instance_type", "processor_type", "architecture")
+
+# Job definition and queue by (architecture, HPC instance, multi-node); MPI
+# runs use their own job definition and HPC instances their own queue
+JOB_TARGETS = {
+    ("arm64", False, False): ("geos-chem-graviton-testing", "geos-chem-graviton-testing"),
+    ("arm64", False, True): ("geos-chem-graviton-mpi-testing", "geos-chem-graviton-testing"),
+    ("arm64", True, False): ("geos-chem-graviton-testing", "geos-chem-graviton-hpc-testing"),
+    ("arm64", True, True): ("geos-chem-graviton-mpi-testing", "geos-chem-graviton-hpc-testing"),
+    ("x86_64", False, False): ("geos-chem-x86-testing", "geos-chem-x86-testing"),
+    ("x86_64", False, True): ("geos-chem-x86-mpi-testing", "geos-chem-x86-testing"),
+    ("x86_64", True, False): ("geos-chem-x86-testing", "geos-chem-x86-hpc-testing"),
+    ("x86_64", True, True): ("geos-chem-x86-mpi-testing", "geos-chem-x86-hpc-testing"),
+}
+
+# Number of threads used to submit AWS Batch jobs concurrently
+SUBMIT_WORKERS = 16
+
+# describe_jobs accepts at most 100 job IDs per call
+DESCRIBE_BATCH_SIZE = 100
+
+# Name prefix of the per-run EventBridge rule and SQS queue delivering Batch job state changes
+JOB_EVENTS_NAME = "geos-chem-instance-benchmark"
+
+# How often describe_jobs reconciles the event stream when using job events
+JOB_RECONCILE_INTERVAL_SECONDS = 300
+
+# Job polling starts fast and backs off while no job changes state
+POLL_INTERVAL_MIN_SECONDS = 15
+POLL_INTERVAL_MAX_SECONDS = 120
+POLL_BACKOFF = 1.5
+
+# Result files of every instance download through one transfer manager
+TRANSFER_CONFIG = TransferConfig(max_concurrency=16, use_threads=True)
+
+# Number of instance result prefixes listed in parallel
+LIST_WORKERS = 8
+
+# Number formats of report table columns; other numbers are shown as-is
+REPORT_NUMBER_FORMATS = {
+    "throughput_days_per_day": "{:.2f}",
+    "cost_per_sim_day": "{:.2f}",
+    "wall_time_seconds": "{:.0f}",
+    "cpu_efficiency": "{:.1f}%",
+}
+
+# Bar charts of per-instance metrics: (column, file name, title, y-axis label)
+BAR_CHARTS = (
+    ("throughput_days_per_day", "throughput_by_instance.svg",
+     "Simulation Throughput by Instance Type", "Throughput (Simulation Days / Wall Day)"),
+    ("cpu_efficiency", "cpu_efficiency.svg",
+     "CPU Efficiency by Instance Type", "CPU Efficiency (%)"),
+    ("wall_time_seconds", "wall_time.svg",
+     "Wall Time by Instance Type", "Wall Time (seconds)"),
+    ("memory_usage_gb", "memory_usage.svg",
+     "Memory Usage by Instance Type", "Memory Usage (GB)"),
+)
+
+# HTML skeleton of the benchmark report, filled in by generate_report
+REPORT_TEMPLATE = string.Template("""
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>GEOS-Chem Instance Benchmark Report</title>
+        <style>
+            body { font-family: Arial, sans-serif; margin: 0; padding: 20px; color: #333; }
+            h1, h2, h3 { color: #2c3e50; }
+            table { border-collapse: collapse; width: 100%; margin-bottom: 20px; }
+            th, td { text-align: left; padding: 12px; border-bottom: 1px solid #ddd; }
+            th { background-color: #f2f2f2; }
+            tr:hover { background-color: #f5f5f5; }
+            .summary-card { background-color: #f8f9fa; border-radius: 5px; padding: 15px;
+                            margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+            .chart-container { margin: 30px 0; text-align: center; }
+            .chart-container img { max-width: 100%; height: auto;
+                                   box-shadow: 0 2px 10px rgba(0,0,0,0.1); }
+            .metric-highlight { font-weight: bold; color: #2980b9; }
+            footer { margin-top: 50px; text-align: center; font-size: 0.8em; color: #7f8c8d; }
+        </style>
+    </head>
+    <body>
+        <h1>GEOS-Chem Instance Benchmark Report</h1>
+        <p>Run ID: $run_id</p>
+        <p>Generated on $generated_at</p>
+        
+        <div class="summary-card">
+            <h2>Benchmark Configuration</h2>
+            <ul>
+                <li><strong>Simulation Type:</strong> $sim_type</li>
+                <li><strong>Resolution:</strong> $resolution</li>
+                <li><strong>Duration:</strong> $duration days</li>
+                <li><strong>Instances Tested:</strong> $total_instances</li>
+            </ul>
+        </div>
+        
+        <div class="summary-card">
+            <h2>Summary Statistics</h2>
+            <ul>
+    $summary_items
+            </ul>
+        </div>
+        
+        <h2>Performance Visualizations</h2>
+    $charts
+        <h2>Detailed Benchmark Results</h2>
+        $table
+        
+        <footer>
+            <p>GEOS-Chem AWS Cloud Runner Benchmark System</p>
+        </footer>
+    </body>
+    </html>
+    """)
+
+def write_json(path, obj, indent=True):
+    """Write obj to path as JSON, indented for humans unless indent is False"""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2 if indent else None)
+
+def json_line(obj):
+    """Serialize obj as a single JSON Lines record"""
+    if orjson:
+        return orjson.dumps(obj).decode() + "\n"
+    return json.dumps(obj) + "\n"
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="GEOS-Chem Instance Type Benchmarker")
@@ -56,15 +207,19 @@ def parse_args():
                        help="Don't wait for jobs to complete")
     parser.add_argument("--analyze-only", action="store_true",
                        help="Only analyze existing results, don't submit new jobs")
+    parser.add_argument("--submit-rate", type=float, default=SUBMIT_RATE_PER_SECOND,
+                       help="Maximum SubmitJob calls per second "
+                            "(keep below the account's Batch quota)")
+    parser.add_argument("--job-events", action="store_true",
+                       help="Wait for jobs via EventBridge/SQS state-change events "
+                            "instead of polling")
     
     return parser.parse_args()
 
 def load_instance_config(config_path):
-    """Load instance configuration from YAML file"""
+    """Load instance configuration from YAML file (via a JSON cache when unchanged)"""
     try:
-        with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
-        return config
+        return load_cached_yaml(config_path)
     except Exception as e:
         logger.error(f"Error loading configuration: {e}")
         return None
@@ -72,6 +227,7 @@ def load_instance_config(config_path):
 def extract_instance_types(config, graviton_only=False, x86_only=False):
     """Extract instance types to benchmark from config"""
     instances = []
+    seen = set()
     
     # Process all phases and collect unique instance configurations
     for phase_key, phase_benchmarks in config.items():
@@ -86,7 +242,7 @@ def extract_instance_types(config, graviton_only=False, x86_only=False):
             hardware = benchmark["hardware"]
             
             # Skip if missing required fields
-            if not all(k in hardware for k in ["instance_type", "processor_type", "architecture"]):
+            if not all(k in hardware for k in REQUIRED_HARDWARE_FIELDS):
                 continue
                 
             # Filter by architecture if requested
@@ -108,14 +264,15 @@ def extract_instance_types(config, graviton_only=False, x86_only=False):
             }
             
             # Check if we already have this instance type
-            if not any(i["instance_type"] == instance["instance_type"] for i in instances):
+            if instance["instance_type"] not in seen:
+                seen.add(instance["instance_type"])
                 instances.append(instance)
     
     return instances
 
 def submit_benchmark_jobs(instance_configs, args):
     """Submit benchmark jobs to AWS Batch"""
-    batch = boto3.client('batch', region_name=args.region)
+    batch = get_aws_client('batch', args.region)
     
     # Generate a unique run ID for this benchmark
     run_id = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -123,36 +280,29 @@ def submit_benchmark_jobs(instance_configs, args):
     # Prepare results directory
     os.makedirs(args.output, exist_ok=True)
     
-    # Track submitted jobs
-    submitted_jobs = []
+    # Subscribe to this run's job state changes before any job is submitted
+    if getattr(args, "job_events", False) and not args.no_wait:
+        try:
+            (args.job_event_queue_url,
+             args.job_event_rule) = setup_job_event_queue(args.region, run_id)
+        except Exception as e:
+            logger.error("Error setting up job events, falling back to polling: %s", e)
     
+    # Build every request first, then overlap the SubmitJob round trips
+    requests = []
     for idx, instance in enumerate(instance_configs):
-        # Determine job definition based on architecture
-        if instance["architecture"] == "arm64":
-            job_definition = "geos-chem-graviton-testing"
-            if instance.get("nodes", 1) > 1:
-                job_definition = "geos-chem-graviton-mpi-testing"
-        else:
-            job_definition = "geos-chem-x86-testing"
-            if instance.get("nodes", 1) > 1:
-                job_definition = "geos-chem-x86-mpi-testing"
+        # Pick the job definition and queue for the architecture, HPC instance
+        # family and node count
+        target = (
+            "arm64" if instance["architecture"] == "arm64" else "x86_64",
+            "hpc" in instance["instance_type"],
+            instance.get("nodes", 1) > 1
+        )
+        job_definition, job_queue = JOB_TARGETS[target]
         
         # Generate a unique job name
         job_name = f"geos-chem-benchmark-{instance['instance_type']}-{run_id}-{idx}"
         
-        # Determine job queue (queue should match instance architecture)
-        if instance["architecture"] == "arm64":
-            job_queue = "geos-chem-graviton-testing"
-        else:
-            job_queue = "geos-chem-x86-testing"
-        
-        # If instance type includes hpc, use HPC queue
-        if "hpc" in instance["instance_type"]:
-            if instance["architecture"] == "arm64":
-                job_queue = "geos-chem-graviton-hpc-testing"
-            else:
-                job_queue = "geos-chem-x86-hpc-testing"
-        
         # Create job parameters including benchmark configuration
         # Pass these parameters to the container
         params = {
@@ -170,24 +320,31 @@ def submit_benchmark_jobs(instance_configs, args):
         if instance.get("nodes", 1) > 1:
             params["nodes"] = str(instance["nodes"])
         
+        requests.append((instance, {
+            "jobName": job_name,
+            "jobQueue": job_queue,
+            "jobDefinition": job_definition,
+            "parameters": params,
+            "tags": {
+                "BenchmarkId": run_id,
+                "InstanceType": instance["instance_type"],
+                "ProcessorType": instance["processor_type"],
+                "Architecture": instance["architecture"],
+                "SimulationType": args.sim_type,
+                "Resolution": args.resolution
+            }
+        }))
+    
+    def submit(request):
+        instance, job_request = request
+        job_name = job_request["jobName"]
+        
         # Submit job to AWS Batch
         try:
             logger.info(f"Submitting benchmark job for {instance['instance_type']}")
             
-            response = batch.submit_job(
-                jobName=job_name,
-                jobQueue=job_queue,
-                jobDefinition=job_definition,
-                parameters=params,
-                tags={
-                    "BenchmarkId": run_id,
-                    "InstanceType": instance["instance_type"],
-                    "ProcessorType": instance["processor_type"],
-                    "Architecture": instance["architecture"],
-                    "SimulationType": args.sim_type,
-                    "Resolution": args.resolution
-                }
-            )
+            wait_for_submit_token(getattr(args, "submit_rate", SUBMIT_RATE_PER_SECOND))
+            response = batch.submit_job(**job_request)
             
             # Save job details
             job_details = {
@@ -206,24 +363,52 @@ def submit_benchmark_jobs(instance_configs, args):
                 "run_id": run_id
             }
             
-            submitted_jobs.append(job_details)
             logger.info(f"Submitted job {job_name} (ID: {response['jobId']})")
+            return job_details
             
         except Exception as e:
             logger.error(f"Error submitting job for {instance['instance_type']}: {e}")
+            return None
+    
+    # The boto3 client is safe to share across threads; results keep submission order
+    submitted_jobs = []
+    if requests:
+        with ThreadPoolExecutor(max_workers=min(SUBMIT_WORKERS, len(requests))) as executor:
+            submitted_jobs = [job for job in executor.map(submit, requests) if job]
     
     # Save submitted jobs to file
     job_file = os.path.join(args.output, f"benchmark-jobs-{run_id}.json")
-    with open(job_file, 'w') as f:
-        json.dump(submitted_jobs, f, indent=2)
+    write_json(job_file, submitted_jobs)
     
     logger.info(f"Submitted {len(submitted_jobs)} benchmark jobs. Details saved to {job_file}")
     
     return submitted_jobs, run_id
 
+def setup_job_event_queue(region, run_id):
+    """Create an SQS queue receiving terminal state changes of this run's Batch jobs"""
+    # Jobs are tagged with the run ID, so the rule only matches this run
+    name = f"{JOB_EVENTS_NAME}-{run_id}"
+    queue_url = create_job_event_queue(region, name, {"tags": {"BenchmarkId": [run_id]}},
+                                       f"GEOS-Chem instance benchmark {run_id} job state changes")
+    return queue_url, name
+
+def describe_tracked_jobs(batch, tracked_jobs):
+    """Describe the tracked jobs 100 at a time, returning details and the IDs checked"""
+    descriptions = {}
+    described = set()
+    for start in range(0, len(tracked_jobs), DESCRIBE_BATCH_SIZE):
+        chunk = [job["job_id"] for job in tracked_jobs[start:start + DESCRIBE_BATCH_SIZE]]
+        try:
+            response = batch.describe_jobs(jobs=chunk)
+            descriptions.update((details["jobId"], details) for details in response["jobs"])
+            described.update(chunk)
+        except Exception as e:
+            logger.error("Error checking jobs %s: %s", ', '.join(chunk), e)
+    return descriptions, described
+
 def monitor_jobs(jobs, args):
     """Monitor job status until all complete or fail"""
-    batch = boto3.client('batch', region_name=args.region)
+    batch = get_aws_client('batch', args.region)
     
     # Create a copy of jobs for tracking status
     tracked_jobs = jobs.copy()
@@ -231,61 +416,96 @@ def monitor_jobs(jobs, args):
     # Track completed jobs
     completed_jobs = []
     
-    # Continue until all jobs are completed or failed
-    while tracked_jobs:
-        # Check each job status
-        for job in list(tracked_jobs):  # Use list() to allow removing items during iteration
-            try:
-                response = batch.describe_jobs(jobs=[job["job_id"]])
-                
-                if not response["jobs"]:
-                    logger.warning(f"Job {job['job_id']} not found")
+    # Poll interval, reset whenever a job changes state
+    interval = POLL_INTERVAL_MIN_SECONDS
+    
+    # With job events, describe_jobs only reconciles the event stream
+    queue_url = getattr(args, "job_event_queue_url", None)
+    sqs = get_aws_client('sqs', args.region) if queue_url else None
+    last_reconcile = time.monotonic()
+    
+    # Completed job details are appended to one JSON Lines file per run
+    run_id = next((job["run_id"] for job in jobs if "run_id" in job), None)
+    details_path = (os.path.join(args.output, f"job-details-{run_id}.jsonl") if run_id
+                    else os.devnull)
+    with open(details_path, 'a', buffering=1) as details_log:
+        # Continue until all jobs are completed or failed
+        while tracked_jobs:
+            if queue_url:
+                # React to state-change events as they arrive (the long poll
+                # blocks), reconciling with describe_jobs only occasionally
+                try:
+                    descriptions = receive_job_events(sqs, queue_url)
+                except Exception as e:
+                    logger.error("Error receiving job events: %s", e)
+                    descriptions = {}
+                    # The failed long poll didn't block, so wait before retrying
+                    time.sleep(POLL_INTERVAL_MIN_SECONDS)
+                described = set(descriptions)
+                if time.monotonic() - last_reconcile >= JOB_RECONCILE_INTERVAL_SECONDS:
+                    polled, checked = describe_tracked_jobs(batch, tracked_jobs)
+                    descriptions.update(polled)
+                    described |= checked
+                    last_reconcile = time.monotonic()
+            else:
+                descriptions, described = describe_tracked_jobs(batch, tracked_jobs)
+        
+            changed = False
+            for job in list(tracked_jobs):  # Use list() to allow removing items during iteration
+                if job["job_id"] not in described:
+                    continue
+            
+                job_details = descriptions.get(job["job_id"])
+                if not job_details:
+                    logger.warning("Job %s not found", job['job_id'])
                     tracked_jobs.remove(job)
                     continue
-                
-                job_details = response["jobs"][0]
+            
                 status = job_details["status"]
-                
+            
                 # Update job status
+                if job["status"] != status:
+                    changed = True
                 job["status"] = status
-                
-                logger.info(f"Job {job['job_name']} ({job['instance_type']}) status: {status}")
-                
+            
+                logger.info("Job %s (%s) status: %s", job['job_name'], job['instance_type'], status)
+            
                 # If job completed or failed, move to completed list
                 if status in ["SUCCEEDED", "FAILED"]:
                     # Add job end time
                     if "stoppedAt" in job_details:
                         # Convert from milliseconds to seconds
                         job["end_time"] = job_details["stoppedAt"] / 1000
-                    
+                
                     # Add job start time
                     if "startedAt" in job_details:
                         # Convert from milliseconds to seconds
                         job["start_time"] = job_details["startedAt"] / 1000
-                        
+                    
                     # Calculate wall time if we have both start and end times
                     if "start_time" in job and "end_time" in job:
                         job["wall_time"] = job["end_time"] - job["start_time"]
-                    
+                
                     completed_jobs.append(job)
                     tracked_jobs.remove(job)
-                    
-                    logger.info(f"Job {job['job_name']} ({job['instance_type']}) completed with status {status}")
-                    
-                    # Save job details to file
-                    if "run_id" in job:
-                        run_id = job["run_id"]
-                        details_file = os.path.join(args.output, f"job-details-{run_id}-{job['job_id']}.json")
-                        with open(details_file, 'w') as f:
-                            json.dump(job, f, indent=2)
-            
-            except Exception as e:
-                logger.error(f"Error checking job {job['job_id']}: {e}")
-        
-        # If there are still jobs being tracked, wait before checking again
-        if tracked_jobs:
-            logger.info(f"Waiting for {len(tracked_jobs)} jobs to complete...")
-            time.sleep(60)  # Check every minute
+                
+                    logger.info("Job %s (%s) completed with status %s",
+                                job['job_name'], job['instance_type'], status)
+                
+                    # Append job details to the run's details file
+                    try:
+                        details_log.write(json_line(job))
+                    except OSError as e:
+                        logger.error("Error saving details of job %s: %s", job['job_id'], e)
+        
+            # If there are still jobs being tracked, wait before checking again
+            if tracked_jobs and not queue_url:
+                if changed:
+                    interval = POLL_INTERVAL_MIN_SECONDS
+                logger.info("Waiting for %s jobs to complete...", len(tracked_jobs))
+                time.sleep(interval)
+                if not changed:
+                    interval = min(interval * POLL_BACKOFF, POLL_INTERVAL_MAX_SECONDS)
     
     logger.info(f"All jobs completed. Total: {len(completed_jobs)}")
     
@@ -293,8 +513,7 @@ def monitor_jobs(jobs, args):
     if completed_jobs and "run_id" in completed_jobs[0]:
         run_id = completed_jobs[0]["run_id"]
         completed_file = os.path.join(args.output, f"completed-jobs-{run_id}.json")
-        with open(completed_file, 'w') as f:
-            json.dump(completed_jobs, f, indent=2)
+        write_json(completed_file, completed_jobs)
         
         logger.info(f"Completed job details saved to {completed_file}")
     
@@ -302,8 +521,8 @@ def monitor_jobs(jobs, args):
 
 def download_benchmark_results(jobs, args):
     """Download benchmark results from S3"""
-    # Create a boto3 S3 client
-    s3 = boto3.client('s3', region_name=args.region)
+    # The shared client's pool has a connection per transfer thread
+    s3 = get_aws_client('s3', args.region)
     
     # Create results directory
     if not jobs:
@@ -314,7 +533,7 @@ def download_benchmark_results(jobs, args):
     results_dir = os.path.join(args.output, f"results-{run_id}")
     os.makedirs(results_dir, exist_ok=True)
     
-    for job in jobs:
+    def list_results(job):
         instance_type = job["instance_type"]
         output_path = f"s3://geos-chem-benchmark-results/{run_id}/{instance_type}/"
         
@@ -323,41 +542,63 @@ def download_benchmark_results(jobs, args):
         bucket = s3_parts[0]
         prefix = s3_parts[1] if len(s3_parts) > 1 else ""
         
-        # Create directory for this instance
-        instance_dir = os.path.join(results_dir, instance_type)
-        os.makedirs(instance_dir, exist_ok=True)
-        
         logger.info(f"Downloading results for {instance_type} from {output_path}")
         
+        # List every object under the prefix (a single call stops at 1000 keys)
         try:
-            # List objects in S3
-            response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
+            keys = []
+            paginator = s3.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+                keys.extend(obj["Key"] for obj in page.get("Contents", []))
+        except Exception as e:
+            logger.error("Error downloading results for %s: %s", instance_type, e)
+            return bucket, []
+        
+        if not keys:
+            logger.warning("No results found for %s", instance_type)
+        return bucket, keys
+    
+    # List every instance's results concurrently
+    with ThreadPoolExecutor(max_workers=LIST_WORKERS) as executor:
+        listings = list(executor.map(list_results, jobs))
+    
+    # Download every result file, across all instances, through one transfer manager
+    with create_transfer_manager(s3, TRANSFER_CONFIG) as manager:
+        downloads = []
+        for job, (bucket, keys) in zip(jobs, listings):
+            instance_type = job["instance_type"]
             
-            if "Contents" not in response:
-                logger.warning(f"No results found for {instance_type}")
-                continue
-                
-            # Download each result file
-            for obj in response["Contents"]:
-                key = obj["Key"]
+            # Create directory for this instance
+            instance_dir = os.path.join(results_dir, instance_type)
+            os.makedirs(instance_dir, exist_ok=True)
+            
+            futures = []
+            for key in keys:
                 filename = os.path.basename(key)
                 
                 if filename:  # Skip if it's a directory
                     local_path = os.path.join(instance_dir, filename)
                     logger.info(f"Downloading {key} to {local_path}")
-                    
-                    s3.download_file(bucket, key, local_path)
-            
-            logger.info(f"Downloaded results for {instance_type}")
-                
-        except Exception as e:
-            logger.error(f"Error downloading results for {instance_type}: {e}")
+                    futures.append(manager.download(bucket, key, local_path))
+            if futures:
+                downloads.append((instance_type, futures))
+        
+        for instance_type, futures in downloads:
+            try:
+                for future in futures:
+                    future.result()
+                logger.info("Downloaded results for %s", instance_type)
+            except Exception as e:
+                logger.error("Error downloading results for %s: %s", instance_type, e)
     
     logger.info(f"Downloaded all benchmark results to {results_dir}")
     return results_dir
 
 def analyze_benchmark_results(results_dir, jobs, args):
     """Analyze benchmark results and generate report"""
+    # Imported here so submission and monitoring runs skip the cost
+    import pandas as pd
+    
     if not os.path.exists(results_dir):
         logger.error(f"Results directory not found: {results_dir}")
         return
@@ -442,10 +683,27 @@ def analyze_benchmark_results(results_dir, jobs, args):
     
     return df
 
+def plot_bar_chart(df, viz_dir, metric, filename, title, ylabel):
+    """Save a bar chart of one metric per instance type"""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    fig, ax = plt.subplots(figsize=(14, 8))
+    hue = "processor_type" if "processor_type" in df.columns else None
+    sns.barplot(x="instance_type", y=metric, hue=hue, data=df, ax=ax)
+    ax.set(title=title, xlabel='Instance Type', ylabel=ylabel)
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    fig.tight_layout()
+    fig.savefig(os.path.join(viz_dir, filename), format='svg', bbox_inches='tight')
+    plt.close(fig)
+
 def generate_visualizations(df, output_dir, run_id):
     """Generate visualizations from benchmark results"""
-    # Create visualizations directory
-    viz_dir = os.path.join(output_dir, f"visualizations-{run_id}")
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    
+    # Charts are written as SVG straight into the report directory
+    viz_dir = os.path.join(output_dir, f"report-{run_id}")
     os.makedirs(viz_dir, exist_ok=True)
     
     # Set the style
@@ -454,114 +712,44 @@ def generate_visualizations(df, output_dir, run_id):
     
     # 1. Throughput Comparison by Instance Type
     if "throughput_days_per_day" in df.columns:
-        plt.figure(figsize=(14, 8))
-        
-        if "processor_type" in df.columns:
-            # Group by processor type
-            ax = sns.barplot(x="instance_type", y="throughput_days_per_day", hue="processor_type", data=df)
-        else:
-            ax = sns.barplot(x="instance_type", y="throughput_days_per_day", data=df)
-            
-        ax.set_title('Simulation Throughput by Instance Type')
-        ax.set_xlabel('Instance Type')
-        ax.set_ylabel('Throughput (Simulation Days / Wall Day)')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig(os.path.join(viz_dir, 'throughput_by_instance.png'), dpi=300)
-        plt.close()
+        plot_bar_chart(df, viz_dir, *BAR_CHARTS[0])
     
     # 2. Cost vs. Performance
     if "cost_per_sim_day" in df.columns and "throughput_days_per_day" in df.columns:
-        plt.figure(figsize=(12, 8))
-        
-        if "processor_type" in df.columns:
-            ax = sns.scatterplot(x="cost_per_sim_day", y="throughput_days_per_day", 
-                              hue="processor_type", size="vcpus", data=df)
-        else:
-            ax = sns.scatterplot(x="cost_per_sim_day", y="throughput_days_per_day", 
-                              size="vcpus", data=df)
+        fig, ax = plt.subplots(figsize=(12, 8))
+        hue = "processor_type" if "processor_type" in df.columns else None
+        sns.scatterplot(x="cost_per_sim_day", y="throughput_days_per_day",
+                        hue=hue, size="vcpus", data=df, ax=ax)
             
         # Add labels for each point
-        for i, row in df.iterrows():
-            plt.text(row["cost_per_sim_day"], row["throughput_days_per_day"], 
-                    row["instance_type"], fontsize=8)
+        for x, y, label in zip(df["cost_per_sim_day"].to_numpy(),
+                               df["throughput_days_per_day"].to_numpy(),
+                               df["instance_type"].to_numpy()):
+            ax.text(x, y, label, fontsize=8)
             
         ax.set_title('Cost vs. Performance')
         ax.set_xlabel('Cost per Simulation Day ($)')
         ax.set_ylabel('Throughput (Simulation Days / Wall Day)')
-        plt.tight_layout()
-        plt.savefig(os.path.join(viz_dir, 'cost_vs_performance.png'), dpi=300)
-        plt.close()
+        fig.tight_layout()
+        fig.savefig(os.path.join(viz_dir, 'cost_vs_performance.svg'), format='svg',
+                    bbox_inches='tight')
+        plt.close(fig)
     
-    # 3. CPU Efficiency by Instance Type
-    if "cpu_efficiency" in df.columns:
-        plt.figure(figsize=(14, 8))
-        
-        if "processor_type" in df.columns:
-            ax = sns.barplot(x="instance_type", y="cpu_efficiency", hue="processor_type", data=df)
-        else:
-            ax = sns.barplot(x="instance_type", y="cpu_efficiency", data=df)
-            
-        ax.set_title('CPU Efficiency by Instance Type')
-        ax.set_xlabel('Instance Type')
-        ax.set_ylabel('CPU Efficiency (%)')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig(os.path.join(viz_dir, 'cpu_efficiency.png'), dpi=300)
-        plt.close()
-    
-    # 4. Wall Time Comparison
-    if "wall_time_seconds" in df.columns:
-        plt.figure(figsize=(14, 8))
-        
-        if "processor_type" in df.columns:
-            ax = sns.barplot(x="instance_type", y="wall_time_seconds", hue="processor_type", data=df)
-        else:
-            ax = sns.barplot(x="instance_type", y="wall_time_seconds", data=df)
-            
-        ax.set_title('Wall Time by Instance Type')
-        ax.set_xlabel('Instance Type')
-        ax.set_ylabel('Wall Time (seconds)')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig(os.path.join(viz_dir, 'wall_time.png'), dpi=300)
-        plt.close()
-    
-    # 5. Memory Usage by Instance Type
-    if "memory_usage_gb" in df.columns:
-        plt.figure(figsize=(14, 8))
-        
-        if "processor_type" in df.columns:
-            ax = sns.barplot(x="instance_type", y="memory_usage_gb", hue="processor_type", data=df)
-        else:
-            ax = sns.barplot(x="instance_type", y="memory_usage_gb", data=df)
-            
-        ax.set_title('Memory Usage by Instance Type')
-        ax.set_xlabel('Instance Type')
-        ax.set_ylabel('Memory Usage (GB)')
-        plt.xticks(rotation=45, ha='right')
-        plt.tight_layout()
-        plt.savefig(os.path.join(viz_dir, 'memory_usage.png'), dpi=300)
-        plt.close()
+    # 3-5. CPU efficiency, wall time and memory usage by instance type
+    for chart in BAR_CHARTS[1:]:
+        if chart[0] in df.columns:
+            plot_bar_chart(df, viz_dir, *chart)
     
     logger.info(f"Visualizations generated in {viz_dir}")
 
 def generate_report(df, output_dir, run_id, args):
     """Generate HTML report with benchmark results"""
+    import numpy as np
+    
     # Create report directory
     report_dir = os.path.join(output_dir, f"report-{run_id}")
     os.makedirs(report_dir, exist_ok=True)
     
-    # Copy visualization images
-    viz_dir = os.path.join(output_dir, f"visualizations-{run_id}")
-    if os.path.exists(viz_dir):
-        for img_file in os.listdir(viz_dir):
-            if img_file.endswith('.png'):
-                src = os.path.join(viz_dir, img_file)
-                dst = os.path.join(report_dir, img_file)
-                import shutil
-                shutil.copy2(src, dst)
-    
     # Calculate summary statistics
     summary = {
         "total_instances": len(df),
@@ -569,8 +757,10 @@ def generate_report(df, output_dir, run_id, args):
         "processor_type_count": df["processor_type"].value_counts().to_dict() if "processor_type" in df.columns else {},
     }
     
+    # Pick the best rows by position from the raw column arrays
     if "throughput_days_per_day" in df.columns:
-        best_throughput = df.loc[df["throughput_days_per_day"].idxmax()]
+        throughput = df["throughput_days_per_day"].to_numpy(dtype=float)
+        best_throughput = df.iloc[int(np.nanargmax(throughput))]
         summary["best_throughput"] = {
             "instance": best_throughput["instance_type"],
             "processor": best_throughput.get("processor_type", "Unknown"),
@@ -578,7 +768,8 @@ def generate_report(df, output_dir, run_id, args):
         }
         
     if "cost_per_sim_day" in df.columns:
-        best_cost = df.loc[df["cost_per_sim_day"].idxmin()]
+        cost = df["cost_per_sim_day"].to_numpy(dtype=float)
+        best_cost = df.iloc[int(np.nanargmin(cost))]
         summary["best_cost"] = {
             "instance": best_cost["instance_type"],
             "processor": best_cost.get("processor_type", "Unknown"),
@@ -586,7 +777,8 @@ def generate_report(df, output_dir, run_id, args):
         }
         
     if "cost_performance_ratio" in df.columns:
-        best_value = df.loc[df["cost_performance_ratio"].idxmin()]
+        ratio = df["cost_performance_ratio"].to_numpy(dtype=float)
+        best_value = df.iloc[int(np.nanargmin(ratio))]
         summary["best_value"] = {
             "instance": best_value["instance_type"],
             "processor": best_value.get("processor_type", "Unknown"),
@@ -594,106 +786,57 @@ def generate_report(df, output_dir, run_id, args):
             "cost": best_value["cost_per_sim_day"]
         }
     
-    # Build HTML content
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>GEOS-Chem Instance Benchmark Report</title>
-        <style>
-            body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; color: #333; }}
-            h1, h2, h3 {{ color: #2c3e50; }}
-            table {{ border-collapse: collapse; width: 100%; margin-bottom: 20px; }}
-            th, td {{ text-align: left; padding: 12px; border-bottom: 1px solid #ddd; }}
-            th {{ background-color: #f2f2f2; }}
-            tr:hover {{ background-color: #f5f5f5; }}
-            .summary-card {{ background-color: #f8f9fa; border-radius: 5px; padding: 15px; margin-bottom: 20px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-            .chart-container {{ margin: 30px 0; text-align: center; }}
-            .chart-container img {{ max-width: 100%; height: auto; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-            .metric-highlight {{ font-weight: bold; color: #2980b9; }}
-            footer {{ margin-top: 50px; text-align: center; font-size: 0.8em; color: #7f8c8d; }}
-        </style>
-    </head>
-    <body>
-        <h1>GEOS-Chem Instance Benchmark Report</h1>
-        <p>Run ID: {run_id}</p>
-        <p>Generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <div class="summary-card">
-            <h2>Benchmark Configuration</h2>
-            <ul>
-                <li><strong>Simulation Type:</strong> {args.sim_type}</li>
-                <li><strong>Resolution:</strong> {args.resolution}</li>
-                <li><strong>Duration:</strong> {args.duration} days</li>
-                <li><strong>Instances Tested:</strong> {summary['total_instances']}</li>
-            </ul>
-        </div>
-        
-        <div class="summary-card">
-            <h2>Summary Statistics</h2>
-            <ul>
-    """
-    
-    # Add best throughput if available
+    # Best-of lines of the summary card, for the metrics that are present
+    summary_items = []
     if "best_throughput" in summary:
-        html_content += f"""
-                <li><strong>Best Throughput:</strong> <span class='metric-highlight'>{summary['best_throughput']['instance']}</span> 
-                    ({summary['best_throughput']['processor']}) - 
-                    {summary['best_throughput']['value']:.2f} sim days/day</li>
-        """
+        best = summary['best_throughput']
+        summary_items.append(f"""
+                <li><strong>Best Throughput:</strong>
+                    <span class='metric-highlight'>{html.escape(str(best['instance']))}</span>
+                    ({html.escape(str(best['processor']))}) -
+                    {best['value']:.2f} sim days/day</li>
+        """)
     
-    # Add best cost if available
     if "best_cost" in summary:
-        html_content += f"""
-                <li><strong>Best Cost Efficiency:</strong> <span class='metric-highlight'>{summary['best_cost']['instance']}</span> 
-                    ({summary['best_cost']['processor']}) - 
-                    ${summary['best_cost']['value']:.2f} per sim day</li>
-        """
+        best = summary['best_cost']
+        summary_items.append(f"""
+                <li><strong>Best Cost Efficiency:</strong>
+                    <span class='metric-highlight'>{html.escape(str(best['instance']))}</span>
+                    ({html.escape(str(best['processor']))}) -
+                    ${best['value']:.2f} per sim day</li>
+        """)
     
-    # Add best value if available
     if "best_value" in summary:
-        html_content += f"""
-                <li><strong>Best Overall Value:</strong> <span class='metric-highlight'>{summary['best_value']['instance']}</span> 
-                    ({summary['best_value']['processor']}) - 
-                    {summary['best_value']['throughput']:.2f} sim days/day at 
-                    ${summary['best_value']['cost']:.2f} per sim day</li>
-        """
-    
-    html_content += """
-            </ul>
-        </div>
-        
-        <h2>Performance Visualizations</h2>
-    """
-    
-    # Add visualization images
+        best = summary['best_value']
+        summary_items.append(f"""
+                <li><strong>Best Overall Value:</strong>
+                    <span class='metric-highlight'>{html.escape(str(best['instance']))}</span>
+                    ({html.escape(str(best['processor']))}) -
+                    {best['throughput']:.2f} sim days/day at
+                    ${best['cost']:.2f} per sim day</li>
+        """)
+    
+    # Charts that were generated, in report order
     viz_files = [
-        'throughput_by_instance.png',
-        'cost_vs_performance.png',
-        'cpu_efficiency.png',
-        'wall_time.png',
-        'memory_usage.png'
+        'throughput_by_instance.svg',
+        'cost_vs_performance.svg',
+        'cpu_efficiency.svg',
+        'wall_time.svg',
+        'memory_usage.svg'
     ]
     
+    charts = []
     for viz_file in viz_files:
         if os.path.exists(os.path.join(report_dir, viz_file)):
-            html_content += f"""
+            title = ' '.join(word.capitalize() for word in os.path.splitext(viz_file)[0].split('_'))
+            charts.append(f"""
             <div class="chart-container">
-                <h3>{' '.join(word.capitalize() for word in viz_file.replace('.png', '').split('_'))}</h3>
+                <h3>{title}</h3>
                 <img src="{viz_file}" alt="{viz_file}">
             </div>
-            """
-    
-    html_content += """
-        <h2>Detailed Benchmark Results</h2>
-        <table>
-            <thead>
-                <tr>
-    """
+            """)
     
-    # Table headers - use columns that actually exist in the DataFrame
+    # Table columns - use columns that actually exist in the DataFrame
     columns_to_show = ['instance_type', 'processor_type', 'architecture', 'nodes', 'vcpus',
                       'throughput_days_per_day', 'cost_per_sim_day', 'wall_time_seconds',
                       'memory_usage_gb', 'cpu_efficiency', 'job_status']
@@ -701,54 +844,33 @@ def generate_report(df, output_dir, run_id, args):
     # Filter only columns that exist in the DataFrame
     columns_to_show = [col for col in columns_to_show if col in df.columns]
     
-    # Add table headers
-    for col in columns_to_show:
-        formatted_col = ' '.join(word.capitalize() for word in col.split('_'))
-        html_content += f"<th>{formatted_col}</th>\n"
-    
-    html_content += """
-                </tr>
-            </thead>
-            <tbody>
-    """
-    
-    # Add table rows
-    for _, row in df.iterrows():
-        html_content += "<tr>\n"
-        for col in columns_to_show:
-            value = row.get(col)
-            if pd.isna(value):
-                formatted_value = ""
-            elif isinstance(value, (int, float)):
-                if col in ['throughput_days_per_day', 'cost_per_sim_day']:
-                    formatted_value = f"{value:.2f}"
-                elif col in ['wall_time_seconds']:
-                    formatted_value = f"{value:.0f}"
-                elif col in ['cpu_efficiency']:
-                    formatted_value = f"{value:.1f}%"
-                else:
-                    formatted_value = str(value)
-            else:
-                formatted_value = str(value)
-            
-            html_content += f"<td>{formatted_value}</td>\n"
-        html_content += "</tr>\n"
-    
-    html_content += """
-            </tbody>
-        </table>
-        
-        <footer>
-            <p>GEOS-Chem AWS Cloud Runner Benchmark System</p>
-        </footer>
-    </body>
-    </html>
-    """
-    
-    # Write HTML file
+    # Render the results table in one call under title-cased headers,
+    # leaving missing values blank
+    titles = {col: ' '.join(word.capitalize() for word in col.split('_'))
+              for col in columns_to_show}
+    table_html = df[columns_to_show].rename(columns=titles).to_html(
+        index=False,
+        na_rep="",
+        border=0,
+        classes="metrics-table",
+        formatters={titles[col]: fmt.format
+                    for col, fmt in REPORT_NUMBER_FORMATS.items() if col in titles}
+    )
+    
+    # Fill in the report template and write it out
     html_path = os.path.join(report_dir, "benchmark-report.html")
     with open(html_path, 'w') as f:
-        f.write(html_content)
+        f.write(REPORT_TEMPLATE.substitute(
+            run_id=html.escape(run_id),
+            generated_at=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            sim_type=html.escape(str(args.sim_type)),
+            resolution=html.escape(str(args.resolution)),
+            duration=args.duration,
+            total_instances=summary['total_instances'],
+            summary_items=''.join(summary_items),
+            charts=''.join(charts),
+            table=table_html
+        ))
     
     logger.info(f"Generated HTML report at {html_path}")
     return html_path
@@ -811,16 +933,20 @@ def main():
     for instance in instance_configs:
         logger.info(f"  - {instance['instance_type']} ({instance['processor_type']})")
     
-    # Submit benchmark jobs
-    submitted_jobs, run_id = submit_benchmark_jobs(instance_configs, args)
-    
-    # If no-wait, exit here
-    if args.no_wait:
-        logger.info("Jobs submitted - exiting without waiting for completion")
-        return
-    
-    # Monitor jobs
-    completed_jobs = monitor_jobs(submitted_jobs, args)
+    # Submit and monitor benchmark jobs, removing the run's job event rule and
+    # queue (created during submission) afterwards
+    try:
+        submitted_jobs, run_id = submit_benchmark_jobs(instance_configs, args)
+        
+        # If no-wait, exit here
+        if args.no_wait:
+            logger.info("Jobs submitted - exiting without waiting for completion")
+            return
+        
+        completed_jobs = monitor_jobs(submitted_jobs, args)
+    finally:
+        if getattr(args, "job_event_queue_url", None):
+            teardown_job_event_queue(args.region, args.job_event_queue_url, args.job_event_rule)
     
     # Download and analyze results
     results_dir = download_benchmark_results(completed_jobs, args)
@@ -8,6 +8,7 @@ that the numerical results are consistent within acceptable tolerances.
 """
 
 import argparse
+import importlib.util
 import os
 import sys
 import json
@@ -16,11 +17,18 @@ import xarray as xr
 import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import shutil
 import pandas as pd
 from tabulate import tabulate
 
+# Numba compiles the fused single-pass comparison kernel when available
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -51,6 +59,83 @@ VALIDATION_THRESHOLDS = {
     'max_abs_diff': 1e-3  # Maximum absolute difference should be less than 0.1% of mean value
 }
 
+# Number of NetCDF files opened concurrently
+LOAD_WORKERS = 32
+
+# h5netcdf reads NetCDF4/HDF5 files without the netCDF4 library's global lock
+NETCDF_ENGINE = "h5netcdf" if importlib.util.find_spec("h5netcdf") else None
+
+# With dask installed, variables open lazily in the files' native chunks so
+# comparisons stream through the data instead of loading whole grids
+NETCDF_CHUNKS = {} if importlib.util.find_spec("dask") else None
+
+# Accumulators of the fused comparison kernel. Means and (co)moments are kept
+# with Welford's online updates, so correlation needs no large sums of squares
+STREAM_FIELDS = ('count', 'mean_ref', 'mean_test', 'sum_abs_diff', 'max_abs_diff', 'sum_sq_diff',
+                 'sum_rel_diff', 'max_rel_diff', 'm2_ref', 'm2_test', 'comoment')
+
+# Elements per parallel chunk of the fused comparison kernel
+STREAM_CHUNK_SIZE = 65536
+
+def _merge_stats(a, b):
+    """Combine the accumulators of two disjoint blocks (Chan et al. parallel update)"""
+    merged = a + b
+    n = a[0] + b[0]
+    if n > 0:
+        weight = a[0] * b[0] / n
+        delta_ref = b[1] - a[1]
+        delta_test = b[2] - a[2]
+        merged[1] = a[1] + delta_ref * b[0] / n
+        merged[2] = a[2] + delta_test * b[0] / n
+        merged[8] = a[8] + b[8] + delta_ref * delta_ref * weight
+        merged[9] = a[9] + b[9] + delta_test * delta_test * weight
+        merged[10] = a[10] + b[10] + delta_ref * delta_test * weight
+    merged[4] = max(a[4], b[4])
+    merged[7] = max(a[7], b[7])
+    return merged
+
+def _stream_stats(ref, test):
+    """Accumulate the comparison statistics of two flat arrays in a single pass"""
+    n = ref.shape[0]
+    nchunks = max(1, (n + STREAM_CHUNK_SIZE - 1) // STREAM_CHUNK_SIZE)
+    partial = np.zeros((nchunks, 11))
+    for c in numba.prange(nchunks):
+        acc = partial[c]
+        for i in range(c * STREAM_CHUNK_SIZE, min(n, (c + 1) * STREAM_CHUNK_SIZE)):
+            # float64 accumulation over float32 inputs
+            x = np.float64(ref[i])
+            y = np.float64(test[i])
+            # Skip cells where either run is NaN
+            if x != x or y != y:
+                continue
+            d = abs(y - x)
+            acc[0] += 1
+            delta_ref = x - acc[1]
+            delta_test = y - acc[2]
+            acc[1] += delta_ref / acc[0]
+            acc[2] += delta_test / acc[0]
+            acc[8] += delta_ref * (x - acc[1])
+            acc[9] += delta_test * (y - acc[2])
+            acc[10] += delta_ref * (y - acc[2])
+            acc[3] += d
+            acc[4] = max(acc[4], d)
+            acc[5] += d * d
+            # Relative differences only where reference is not too close to zero
+            if abs(x) > 1e-10:
+                r = d / abs(x)
+                acc[6] += r
+                acc[7] = max(acc[7], r)
+    
+    totals = partial[0]
+    for c in range(1, nchunks):
+        totals = _merge_stats(totals, partial[c])
+    return totals
+
+if numba:
+    # NaN handling stays strict; only contraction and sign-of-zero rules are relaxed
+    _merge_stats = numba.njit(_merge_stats)
+    _stream_stats = numba.njit(parallel=True, fastmath={'contract', 'nsz', 'arcp'})(_stream_stats)
+
 def parse_args():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="GEOS-Chem Scientific Results Validator")
@@ -92,24 +177,27 @@ def load_netcdf_outputs(directory):
         logger.error(f"No NetCDF files found in {directory}")
         return None
         
-    # For each file type, load the data
-    datasets = {}
+    # Open the files concurrently; results keep the file order
+    with ThreadPoolExecutor(max_workers=min(LOAD_WORKERS, len(nc_files))) as executor:
+        loaded = list(executor.map(open_netcdf, nc_files))
     
-    for nc_file in nc_files:
-        try:
-            # Use the file stem as a key
-            key = nc_file.stem
-            
-            # Load the dataset
-            logger.info(f"Loading {nc_file}")
-            ds = xr.open_dataset(nc_file)
-            
-            datasets[key] = ds
-            
-        except Exception as e:
-            logger.error(f"Error loading {nc_file}: {e}")
-    
-    return datasets
+    # Use the file stem as a key
+    return {nc_file.stem: ds for nc_file, ds in zip(nc_files, loaded) if ds is not None}
+
+def open_netcdf(nc_file):
+    """Open one NetCDF file, returning None if it can't be read"""
+    logger.info(f"Loading {nc_file}")
+    try:
+        if NETCDF_ENGINE:
+            try:
+                return xr.open_dataset(nc_file, engine=NETCDF_ENGINE, chunks=NETCDF_CHUNKS)
+            except (OSError, ValueError):
+                # NetCDF3 files aren't HDF5; let xarray pick another engine
+                pass
+        return xr.open_dataset(nc_file, chunks=NETCDF_CHUNKS)
+    except Exception as e:
+        logger.error(f"Error loading {nc_file}: {e}")
+        return None
 
 def get_species_data(datasets, species, time_step=-1):
     """Extract species data from datasets for comparison"""
@@ -150,6 +238,64 @@ def get_species_data(datasets, species, time_step=-1):
     
     return species_data
 
+def streamed_comparison_stats(ref_array, test_array):
+    """Comparison statistics from the fused kernel, loading one leading-dimension slice at a time"""
+    totals = np.zeros(len(STREAM_FIELDS))
+    for index in (range(ref_array.shape[0]) if ref_array.ndim > 1 else [Ellipsis]):
+        part = _stream_stats(np.ravel(ref_array[index].values), np.ravel(test_array[index].values))
+        totals = _merge_stats(totals, part)
+    
+    acc = dict(zip(STREAM_FIELDS, totals))
+    n = acc['count']
+    if n == 0:
+        return None
+    
+    # Correlation is undefined when either run is constant; report NaN as xr.corr does
+    spread = np.sqrt(acc['m2_ref'] * acc['m2_test'])
+    corr_coef = acc['comoment'] / spread if spread > 0 else np.nan
+    
+    return {
+        'mean_ref': float(acc['mean_ref']),
+        'mean_test': float(acc['mean_test']),
+        'mean_abs_diff': float(acc['sum_abs_diff'] / n),
+        'max_abs_diff': float(acc['max_abs_diff']),
+        'rmse': float(np.sqrt(acc['sum_sq_diff'] / n)),
+        'mean_rel_diff': float(acc['sum_rel_diff'] / n),
+        'max_rel_diff': float(acc['max_rel_diff']),
+        'corr_coef': float(corr_coef)
+    }
+
+def lazy_comparison_stats(ref_array, test_array):
+    """Comparison statistics built as lazy reductions and evaluated together"""
+    valid = ref_array.notnull() & test_array.notnull()
+    ref_valid = ref_array.where(valid)
+    test_valid = test_array.where(valid)
+    
+    # Calculate absolute differences
+    abs_diff = abs(test_valid - ref_valid)
+    
+    # Calculate relative differences where reference is not too close to zero
+    # Avoid division by zero or very small values
+    abs_ref = abs(ref_valid)
+    rel_diff = (abs_diff / abs_ref.where(abs_ref > 1e-10)).fillna(0).where(valid)
+    
+    # Build every reduction lazily, then evaluate them together in one pass
+    reductions = xr.Dataset({
+        'count': valid.sum(),
+        'mean_ref': ref_valid.mean(),
+        'mean_test': test_valid.mean(),
+        'mean_abs_diff': abs_diff.mean(),
+        'max_abs_diff': abs_diff.max(),
+        'rmse': (abs_diff ** 2).mean() ** 0.5,
+        'mean_rel_diff': rel_diff.mean(),
+        'max_rel_diff': rel_diff.max(),
+        'corr_coef': xr.corr(xr.DataArray(ref_valid), xr.DataArray(test_valid))
+    }).compute()
+    
+    if int(reductions['count']) == 0:
+        return None
+    return {name: float(value) for name, value in reductions.data_vars.items() if name != 'count'}
+
 def compare_species(reference_data, test_data, species, thresholds=None):
     """Compare species data between reference and test runs"""
     if thresholds is None:
@@ -166,50 +312,25 @@ def compare_species(reference_data, test_data, species, thresholds=None):
         
         # For each dataset containing this species
         for dataset_name in set(reference_data[species_name].keys()) & set(test_data[species_name].keys()):
-            # Get the data arrays
-            ref_array = reference_data[species_name][dataset_name].values
-            test_array = test_data[species_name][dataset_name].values
+            # Get the data arrays (lazy when dask-backed)
+            ref_array = reference_data[species_name][dataset_name]
+            test_array = test_data[species_name][dataset_name]
             
             # Ensure shapes match
             if ref_array.shape != test_array.shape:
                 logger.warning(f"Shape mismatch for {species_name} in {dataset_name}: {ref_array.shape} vs {test_array.shape}")
                 continue
             
-            # Calculate statistics
-            # Convert to numpy arrays and flatten for easier processing
-            ref_flat = ref_array.flatten()
-            test_flat = test_array.flatten()
-            
-            # Remove NaN values
-            valid_idx = ~np.isnan(ref_flat) & ~np.isnan(test_flat)
-            ref_valid = ref_flat[valid_idx]
-            test_valid = test_flat[valid_idx]
+            # Compare positionally, ignoring cells where either run is NaN
+            if numba:
+                stats = streamed_comparison_stats(ref_array.variable, test_array.variable)
+            else:
+                stats = lazy_comparison_stats(ref_array.variable, test_array.variable)
             
-            if len(ref_valid) == 0:
+            if stats is None:
                 logger.warning(f"No valid (non-NaN) data for {species_name} in {dataset_name}")
                 continue
             
-            # Calculate absolute differences
-            abs_diff = np.abs(test_valid - ref_valid)
-            
-            # Calculate relative differences where reference is not too close to zero
-            # Avoid division by zero or very small values
-            safe_idx = np.abs(ref_valid) > 1e-10
-            rel_diff = np.zeros_like(ref_valid)
-            rel_diff[safe_idx] = abs_diff[safe_idx] / np.abs(ref_valid[safe_idx])
-            
-            # Calculate statistics
-            stats = {
-                'mean_ref': float(np.mean(ref_valid)),
-                'mean_test': float(np.mean(test_valid)),
-                'mean_abs_diff': float(np.mean(abs_diff)),
-                'max_abs_diff': float(np.max(abs_diff)),
-                'rmse': float(np.sqrt(np.mean(np.square(abs_diff)))),
-                'mean_rel_diff': float(np.mean(rel_diff)),
-                'max_rel_diff': float(np.max(rel_diff)),
-                'corr_coef': float(np.corrcoef(ref_valid, test_valid)[0, 1])
-            }
-            
             # Determine if the results pass validation
             # Calculate the relative statistics as percentages of mean reference value
             if stats['mean_ref'] != 0:
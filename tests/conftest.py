@@ -0,0 +1,38 @@
+"""Shared fixtures for the tests of the repository's Python scripts"""
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# benchmark-orchestrator.py imports benchmark_common from its own directory
+sys.path.insert(0, os.path.join(REPO_ROOT, "benchmarking"))
+
+@pytest.fixture(scope="session")
+def load_script(tmp_path_factory):
+    """Import a script by path (hyphenated file names can't be imported by name)
+
+    Scripts are executed from a scratch working directory because some of them
+    open their log file there on import.
+    """
+    modules = {}
+
+    def load(relative_path):
+        if relative_path not in modules:
+            name = os.path.splitext(os.path.basename(relative_path))[0].replace('-', '_')
+            path = os.path.join(REPO_ROOT, relative_path)
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            cwd = os.getcwd()
+            os.chdir(tmp_path_factory.mktemp("cwd"))
+            try:
+                spec.loader.exec_module(module)
+            finally:
+                os.chdir(cwd)
+            modules[relative_path] = module
+        return modules[relative_path]
+
+    return load
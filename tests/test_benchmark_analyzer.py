@@ -0,0 +1,77 @@
+"""Tests for the summary statistics of benchmarking/benchmark-analyzer.py"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+@pytest.fixture(scope="module")
+def analyzer(load_script):
+    pytest.importorskip("seaborn")
+    return load_script("benchmarking/benchmark-analyzer.py")
+
+def test_summary_stats_locate_best_benchmarks(analyzer):
+    df = pd.DataFrame({"benchmark_id": ["a", "b", "c"],
+                       "throughput_days_per_day": [10.0, np.nan, 30.0],
+                       "cost_per_sim_day": [2.0, 1.0, np.nan]})
+    stats = analyzer.compute_summary_stats(df)
+
+    assert stats.at["max", "throughput_days_per_day"] == 30.0
+    assert df.loc[stats.at["idxmax", "throughput_days_per_day"], "benchmark_id"] == "c"
+    assert stats.at["mean", "cost_per_sim_day"] == 1.5
+    assert df.loc[stats.at["idxmin", "cost_per_sim_day"], "benchmark_id"] == "b"
+
+def test_summary_stats_without_summary_columns(analyzer):
+    stats = analyzer.compute_summary_stats(pd.DataFrame({"benchmark_id": ["a"]}))
+    assert stats.columns.empty
+
+def test_summary_stats_with_all_na_column(analyzer):
+    df = pd.DataFrame({"benchmark_id": ["a", "b"],
+                       "throughput_days_per_day": [5.0, 7.0],
+                       "cost_per_sim_day": [np.nan, np.nan]})
+    stats = analyzer.compute_summary_stats(df)
+
+    assert df.loc[stats.at["idxmax", "throughput_days_per_day"], "benchmark_id"] == "b"
+    assert np.isnan(stats.at["mean", "cost_per_sim_day"])
+    assert np.isnan(stats.at["idxmin", "cost_per_sim_day"])
+
+@pytest.mark.parametrize("metrics", [
+    {},
+    {"throughput_days_per_day": [np.nan, np.nan], "cost_per_sim_day": [np.nan, np.nan]},
+])
+def test_reports_without_summary_values(analyzer, tmp_path, metrics):
+    df = pd.DataFrame(dict({"benchmark_id": ["a", "b"]}, **metrics))
+
+    paths = analyzer.generate_benchmark_report(df, str(tmp_path), "all")
+
+    with open(paths["json"]) as f:
+        summary = json.load(f)["summary"]
+    assert summary["total_benchmarks"] == 2
+    assert "Max Throughput" not in open(paths["html"]).read()
+
+def write_benchmark(results_dir, benchmark_id, results, config):
+    benchmark_dir = results_dir / benchmark_id
+    benchmark_dir.mkdir()
+    (benchmark_dir / "results.json").write_text(json.dumps(results))
+    (benchmark_dir / "config.json").write_text(json.dumps(config))
+
+def test_analyze_benchmarks_column_dtypes(analyzer, tmp_path):
+    write_benchmark(tmp_path, "b1", {"throughput_days_per_day": "12.5", "cost_per_sim_day": 3},
+                    {"application": "gchp", "simulation_type": "fullchem",
+                     "hardware": {"processor_type": "graviton3", "nodes": 4}})
+    write_benchmark(tmp_path, "b2", {"throughput_days_per_day": 20.0, "cost_per_sim_day": None},
+                    {"application": "gchp", "simulation_type": "transport",
+                     "hardware": {"processor_type": "graviton3", "nodes": 2}})
+    config = {"phase_1": [{"id": "b1", "description": "first"}],
+              "phase_2": [{"id": "b2", "description": "second"}]}
+
+    df = analyzer.analyze_benchmarks(str(tmp_path), config).set_index("benchmark_id")
+
+    assert df["throughput_days_per_day"].dtype == "float64"
+    assert df.at["b1", "throughput_days_per_day"] == 12.5
+    assert df["cost_per_sim_day"].dtype == "float64"
+    assert df["phase"].dtype == "int64"
+    assert df["nodes"].dtype == "int64"
+    assert df["description"].dtype == object
+    assert df["simulation_type"].dtype == "category"
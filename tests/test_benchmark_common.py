@@ -0,0 +1,50 @@
+"""Tests for the YAML configuration cache of benchmarking/benchmark_common.py"""
+
+import json
+import os
+
+import benchmark_common
+
+def write_config(tmp_path, text):
+    path = tmp_path / "benchmarks.yaml"
+    path.write_text(text)
+    return str(path)
+
+def test_load_cached_yaml_writes_sidecar(tmp_path):
+    config_path = write_config(tmp_path, "benchmarks:\n  - id: b1\n")
+
+    assert benchmark_common.load_cached_yaml(config_path) == {"benchmarks": [{"id": "b1"}]}
+
+    cache_path = benchmark_common.get_config_cache_path(config_path)
+    assert os.path.basename(cache_path) == ".benchmarks.yaml.cache.json"
+    with open(cache_path) as f:
+        assert json.load(f)["config"] == {"benchmarks": [{"id": "b1"}]}
+    assert sorted(os.listdir(tmp_path)) == [".benchmarks.yaml.cache.json", "benchmarks.yaml"]
+
+def test_load_cached_yaml_reuses_cache_for_same_content(tmp_path):
+    config_path = write_config(tmp_path, "benchmarks:\n  - id: b1\n")
+    benchmark_common.load_cached_yaml(config_path)
+
+    # Only a cache hit can return the tampered config
+    cache_path = benchmark_common.get_config_cache_path(config_path)
+    with open(cache_path) as f:
+        cached = json.load(f)
+    cached["config"] = {"from": "cache"}
+    with open(cache_path, "w") as f:
+        json.dump(cached, f)
+
+    assert benchmark_common.load_cached_yaml(config_path) == {"from": "cache"}
+
+def test_load_cached_yaml_invalidates_on_content_change(tmp_path):
+    config_path = write_config(tmp_path, "benchmarks:\n  - id: b1\n")
+    benchmark_common.load_cached_yaml(config_path)
+
+    write_config(tmp_path, "benchmarks:\n  - id: b2\n")
+    assert benchmark_common.load_cached_yaml(config_path) == {"benchmarks": [{"id": "b2"}]}
+
+def test_load_cached_yaml_ignores_corrupt_cache(tmp_path):
+    config_path = write_config(tmp_path, "benchmarks: []\n")
+    with open(benchmark_common.get_config_cache_path(config_path), "w") as f:
+        f.write("{not json")
+
+    assert benchmark_common.load_cached_yaml(config_path) == {"benchmarks": []}
@@ -0,0 +1,148 @@
+"""Tests for the Batch job parameters built by benchmarking/benchmark-orchestrator.py"""
+
+import argparse
+import json
+import threading
+import time
+
+import pytest
+
+@pytest.fixture(scope="module")
+def orchestrator(load_script):
+    return load_script("benchmarking/benchmark-orchestrator.py")
+
+def test_config_object_key_fans_out_by_digest(orchestrator):
+    digest = "0123456789abcdef0123456789abcdef"
+    assert orchestrator.config_object_key(digest) == f"benchmark-configs/01/23/{digest}.json"
+    assert (orchestrator.config_object_key(digest, "arrays")
+            == f"benchmark-configs/arrays/01/23/{digest}.json")
+
+def array_job_args():
+    """Argument namespace with the options generate_batch_array_job_params reads"""
+    return argparse.Namespace(output_bucket="bench-bucket", job_queue="queue",
+                              job_definition="jobdef")
+
+def test_generate_batch_array_job_params(orchestrator):
+    benchmarks = [
+        {"id": "b1", "simulation_type": "fullchem", "duration": {"days": 7},
+         "domain": {"resolution": "4x5"}, "hardware": {"instance_type": "c7g.8xlarge"}},
+        {"id": "b2", "simulation_type": "transport", "duration": {"days": 14},
+         "domain": {"resolution": "4x5"}, "hardware": {"instance_type": "c7g.8xlarge"}},
+    ]
+
+    job_params, array_key, array_body = orchestrator.generate_batch_array_job_params(
+        benchmarks, array_job_args())
+
+    # One manifest entry per child, in array index order
+    entries = json.loads(array_body)
+    assert [entry["benchmark"]["id"] for entry in entries] == ["b1", "b2"]
+    assert entries[1]["output_path"] == "s3://bench-bucket/benchmark-results/b2/"
+
+    # The manifest is stored under the key of its own digest
+    digest = array_key.rsplit("/", 1)[-1][:-len(".json")]
+    assert array_key == orchestrator.config_object_key(digest, "arrays")
+    assert job_params["parameters"] == {"arrayConfig": f"s3://bench-bucket/{array_key}"}
+
+    assert job_params["jobQueue"] == "queue"
+    assert job_params["jobDefinition"] == "jobdef"
+    assert job_params["arrayProperties"] == {"size": 2}
+    overrides = job_params["containerOverrides"]
+    assert ((overrides["vcpus"], overrides["memory"])
+            == orchestrator.batch_job_resources(benchmarks[0]))
+    assert overrides["command"] == ["--benchmark-array", "Ref::arrayConfig"]
+
+    # The timeout covers the longest benchmark in the array
+    longest = max(orchestrator.estimate_benchmark_runtime(benchmark) for benchmark in benchmarks)
+    assert job_params["timeout"]["attemptDurationSeconds"] == int(longest * 3600)
+
+def test_generate_batch_array_job_params_is_content_addressed(orchestrator):
+    args = array_job_args()
+    benchmarks = [{"id": "b1"}, {"id": "b2"}]
+
+    _, first_key, _ = orchestrator.generate_batch_array_job_params(benchmarks, args)
+    _, same_key, _ = orchestrator.generate_batch_array_job_params(
+        [dict(benchmark) for benchmark in benchmarks], args)
+    _, other_key, _ = orchestrator.generate_batch_array_job_params(benchmarks[::-1], args)
+
+    assert first_key == same_key
+    assert first_key != other_key
+
+class FakeSQS:
+    """Delivers one batch of terminal job events"""
+
+    def __init__(self, job_ids):
+        self.messages = [{"Body": json.dumps({"detail": {"jobId": job_id, "status": "SUCCEEDED"}}),
+                          "ReceiptHandle": job_id} for job_id in job_ids]
+
+    def receive_message(self, **kwargs):
+        messages, self.messages = self.messages, []
+        return {"Messages": messages}
+
+    def delete_message_batch(self, **kwargs):
+        pass
+
+def test_receive_tracked_job_events_drops_untracked_jobs(orchestrator, monkeypatch):
+    monkeypatch.setattr(orchestrator, "_completed_job_events", {})
+    sqs = FakeSQS(["ours", "other-run", "ours:1"])
+
+    orchestrator.receive_tracked_job_events(sqs, "queue-url", {"ours": None, "ours:1": None})
+
+    assert sorted(orchestrator._completed_job_events) == ["ours", "ours:1"]
+
+class FailingSQS:
+    """Counts receive attempts that fail without blocking"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def receive_message(self, **kwargs):
+        self.calls += 1
+        raise ConnectionError("queue unavailable")
+
+def test_job_monitor_backs_off_when_receiving_events_fails(orchestrator, monkeypatch):
+    sqs = FailingSQS()
+    monkeypatch.setattr(orchestrator, "get_aws_client", lambda service, region=None: sqs)
+    monkeypatch.setattr(orchestrator, "JOB_MONITOR_INTERVAL_SECONDS", 0.1)
+    args = argparse.Namespace(job_event_queue_url="queue-url")
+
+    orchestrator._monitor_stop.clear()
+    thread = threading.Thread(target=orchestrator.monitor_running_jobs, args=(args,))
+    thread.start()
+    time.sleep(0.35)
+    orchestrator.stop_job_monitor(thread)
+
+    assert 1 <= sqs.calls <= 5
+
+def test_wait_for_batch_jobs_backs_off_when_receiving_events_fails(orchestrator, monkeypatch):
+    sqs = FailingSQS()
+    monkeypatch.setattr(orchestrator, "get_aws_client", lambda service, region=None: sqs)
+    monkeypatch.setattr(orchestrator, "JOB_MONITOR_INTERVAL_SECONDS", 0.1)
+    args = argparse.Namespace(dry_run=False, job_event_queue_url="queue-url")
+    jobs = [{"job_id": "job", "type": "batch", "benchmark_id": "b1"}]
+
+    orchestrator.wait_for_batch_jobs(jobs, args, max_wait_minutes=0.005)
+
+    assert 1 <= sqs.calls <= 5
+
+@pytest.mark.parametrize("use_schema", [True, False])
+def test_validate_config_generates_missing_ids(orchestrator, monkeypatch, use_schema):
+    if not use_schema:
+        monkeypatch.setattr(orchestrator, "CONFIG_VALIDATOR", None)
+    elif orchestrator.CONFIG_VALIDATOR is None:
+        pytest.skip("fastjsonschema is not installed")
+    benchmark = {"simulation_type": "fullchem", "hardware": {"instance_type": "c7g.8xlarge"}}
+    config = {"phase_1": [dict(benchmark, id="named"), dict(benchmark)],
+              "phase_2": [], "phase_3": [], "phase_4": []}
+
+    assert orchestrator.validate_config(config)
+
+    assert config["phase_1"][0]["id"] == "named"
+    assert config["phase_1"][1]["id"].startswith("phase-1-")
+
+def test_validate_config_fallback_rejects_incomplete_benchmarks(orchestrator, monkeypatch):
+    monkeypatch.setattr(orchestrator, "CONFIG_VALIDATOR", None)
+    config = {"phase_1": [{"simulation_type": "fullchem"}],
+              "phase_2": [], "phase_3": [], "phase_4": []}
+
+    assert not orchestrator.validate_config(config)
+    assert "id" not in config["phase_1"][0]
@@ -0,0 +1,52 @@
+"""Tests for the ExtData rewrite of container/scripts/download_data.py"""
+
+import pytest
+import yaml
+
+@pytest.fixture(scope="module")
+def download_data(load_script):
+    return load_script("container/scripts/download_data.py")
+
+def rewrite(download_data, tmp_path, text, data_dir="/data"):
+    """Run update_config_paths over a config file and return the new text"""
+    config_file = tmp_path / "geoschem_config.yml"
+    config_file.write_text(text)
+    download_data.update_config_paths(yaml.safe_load(text), str(config_file), data_dir)
+    return config_file.read_text()
+
+def test_rewrite_edits_value_in_place(download_data, tmp_path):
+    text = ("# GEOS-Chem run configuration\n"
+            "simulation:\n"
+            "  name: fullchem\n"
+            "paths:\n"
+            "  ExtData: /home/ExtData   # input data root\n"
+            "  RunDir: ./\n")
+    assert rewrite(download_data, tmp_path, text) == text.replace("/home/ExtData", "/data")
+
+def test_rewrite_skips_extdata_keys_before_paths(download_data, tmp_path):
+    text = ("operations:\n"
+            "  ExtData: keep-me\n"
+            "paths:\n"
+            "  ExtData: /home/ExtData\n")
+    result = rewrite(download_data, tmp_path, text)
+    assert result == text.replace("/home/ExtData", "/data")
+
+def test_rewrite_falls_back_when_paths_has_no_extdata(download_data, tmp_path):
+    text = ("paths:\n"
+            "  RunDir: ./\n"
+            "operations:\n"
+            "  ExtData: keep-me\n")
+    config = yaml.safe_load(rewrite(download_data, tmp_path, text))
+    assert config["paths"] == {"RunDir": "./", "ExtData": "/data"}
+    assert config["operations"]["ExtData"] == "keep-me"
+
+def test_rewrite_falls_back_for_flow_style(download_data, tmp_path):
+    text = "paths: {ExtData: /home/ExtData, RunDir: ./}\n"
+    config = yaml.safe_load(rewrite(download_data, tmp_path, text))
+    assert config["paths"] == {"ExtData": "/data", "RunDir": "./"}
+
+@pytest.mark.parametrize("data_dir", ["/data: weird", "/data #1", "'quoted'"])
+def test_rewrite_falls_back_when_value_needs_quoting(download_data, tmp_path, data_dir):
+    text = "paths:\n  ExtData: /home/ExtData\n"
+    config = yaml.safe_load(rewrite(download_data, tmp_path, text, data_dir))
+    assert config["paths"]["ExtData"] == data_dir
@@ -0,0 +1,69 @@
+"""Tests for the --sweep mode of parallel-cluster/generate-gchp-config.py"""
+
+import argparse
+
+import pytest
+
+@pytest.fixture(scope="module")
+def gchp(load_script):
+    return load_script("parallel-cluster/generate-gchp-config.py")
+
+def make_args(sweep_file, **overrides):
+    """Argument namespace with the command-line defaults"""
+    args = dict(output_path="s3://bucket/configs", simulation_type="fullchem", resolution="c24",
+                duration_days=7, start_date=None, nodes=2, architecture="graviton",
+                description="", sweep=str(sweep_file))
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+def write_sweep(tmp_path, text):
+    path = tmp_path / "sweep.yaml"
+    path.write_text(text)
+    return path
+
+def test_expand_sweep_builds_every_combination(gchp, tmp_path):
+    sweep_file = write_sweep(tmp_path, "resolution: [c24, c48]\nnodes: [1, 2, 4]\n")
+    sweep = gchp.expand_sweep(make_args(sweep_file))
+
+    assert [(args.resolution, args.nodes) for args in sweep] == [
+        ("c24", 1), ("c24", 2), ("c24", 4), ("c48", 1), ("c48", 2), ("c48", 4)
+    ]
+    assert all(args.simulation_type == "fullchem" for args in sweep)
+
+def test_expand_sweep_converts_values_to_argument_types(gchp, tmp_path):
+    # Unquoted dates load as datetime.date and quoted numbers stay strings
+    sweep_file = write_sweep(tmp_path, 'start-date: [2024-01-01, "2024-02-01"]\n'
+                                       'nodes: ["4"]\nduration_days: ["3"]\n')
+    sweep = gchp.expand_sweep(make_args(sweep_file))
+
+    assert [args.start_date for args in sweep] == ["2024-01-01", "2024-02-01"]
+    assert all(args.nodes == 4 and args.duration_days == 3 for args in sweep)
+
+    # The converted values go straight into a config
+    config = gchp.create_gchp_config(sweep[0], sim_id="sweep")
+    assert config["simulation"]["end_date"] == "2024-01-04"
+    assert config["resource"]["nodes"] == 4
+
+@pytest.mark.parametrize("text", [
+    "nodes: [4.5]\n",
+    "nodes: [twelve]\n",
+    "nodes: [12]\n",
+    "start_date: [2024-13-01]\n",
+    "resolution: [c1000]\n",
+    "memory: [64]\n",
+    "- resolution\n",
+    "nodes: [1, 2\n",
+])
+def test_expand_sweep_rejects_invalid_values(gchp, tmp_path, text):
+    with pytest.raises(SystemExit) as excinfo:
+        gchp.expand_sweep(make_args(write_sweep(tmp_path, text)))
+    assert str(excinfo.value).startswith("Error:")
+
+def test_sweep_config_path(gchp, tmp_path):
+    args = make_args(None, output_path="s3://bucket/configs/", resolution="c48", duration_days=3,
+                     nodes=4, architecture="x86")
+    assert gchp.sweep_config_path(args) == "s3://bucket/configs/fullchem-c48-3d-4n-x86.json"
+
+    args.start_date = "2024-01-01"
+    assert (gchp.sweep_config_path(args)
+            == "s3://bucket/configs/fullchem-c48-3d-4n-x86-2024-01-01.json")
@@ -0,0 +1,80 @@
+"""Tests for the Batch job submission of testing/scripts/instance-benchmark.py"""
+
+import argparse
+import threading
+
+import pytest
+
+@pytest.fixture(scope="module")
+def ib(load_script):
+    return load_script("testing/scripts/instance-benchmark.py")
+
+class FakeBatch:
+    """Records the SubmitJob requests instead of sending them"""
+
+    def __init__(self):
+        self.requests = {}
+        self.lock = threading.Lock()
+
+    def submit_job(self, **request):
+        with self.lock:
+            self.requests[request["parameters"]["instanceType"]] = request
+            return {"jobId": f"job-{len(self.requests)}"}
+
+@pytest.mark.parametrize("instance, job_definition, job_queue", [
+    ({"instance_type": "c7g.8xlarge", "architecture": "arm64"},
+     "geos-chem-graviton-testing", "geos-chem-graviton-testing"),
+    ({"instance_type": "c7g.8xlarge", "architecture": "arm64", "nodes": 4},
+     "geos-chem-graviton-mpi-testing", "geos-chem-graviton-testing"),
+    ({"instance_type": "hpc7g.16xlarge", "architecture": "arm64"},
+     "geos-chem-graviton-testing", "geos-chem-graviton-hpc-testing"),
+    ({"instance_type": "hpc7g.16xlarge", "architecture": "arm64", "nodes": 2},
+     "geos-chem-graviton-mpi-testing", "geos-chem-graviton-hpc-testing"),
+    ({"instance_type": "c7i.8xlarge", "architecture": "x86_64"},
+     "geos-chem-x86-testing", "geos-chem-x86-testing"),
+    ({"instance_type": "c6a.8xlarge", "architecture": "amd64", "nodes": 2},
+     "geos-chem-x86-mpi-testing", "geos-chem-x86-testing"),
+    ({"instance_type": "hpc6a.48xlarge", "architecture": "x86_64"},
+     "geos-chem-x86-testing", "geos-chem-x86-hpc-testing"),
+    ({"instance_type": "hpc6a.48xlarge", "architecture": "x86_64", "nodes": 1},
+     "geos-chem-x86-testing", "geos-chem-x86-hpc-testing"),
+])
+def test_submit_benchmark_jobs_picks_job_targets(ib, monkeypatch, tmp_path,
+                                                 instance, job_definition, job_queue):
+    batch = FakeBatch()
+    monkeypatch.setattr(ib, "get_aws_client", lambda service, region=None: batch)
+    args = argparse.Namespace(region="us-east-1", output=str(tmp_path), sim_type="fullchem",
+                              resolution="4x5", duration=1, no_wait=True)
+
+    submitted, _ = ib.submit_benchmark_jobs([dict(instance, processor_type="test")], args)
+
+    request = batch.requests[instance["instance_type"]]
+    assert (request["jobDefinition"], request["jobQueue"]) == (job_definition, job_queue)
+    assert len(submitted) == 1
+    assert ("nodes" in request["parameters"]) == (instance.get("nodes", 1) > 1)
+
+class FailingSQS:
+    """Counts receive attempts that fail without blocking"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def receive_message(self, **kwargs):
+        self.calls += 1
+        if self.calls > 3:
+            raise KeyboardInterrupt
+        raise ConnectionError("queue unavailable")
+
+def test_monitor_jobs_waits_before_retrying_failed_receive(ib, monkeypatch, tmp_path):
+    sqs = FailingSQS()
+    sleeps = []
+    monkeypatch.setattr(ib, "get_aws_client", lambda service, region=None: sqs)
+    monkeypatch.setattr(ib.time, "sleep", sleeps.append)
+    args = argparse.Namespace(region="us-east-1", output=str(tmp_path), job_event_queue_url="url")
+    jobs = [{"job_id": "job", "job_name": "name", "instance_type": "c7g.8xlarge",
+             "status": "SUBMITTED"}]
+
+    with pytest.raises(KeyboardInterrupt):
+        ib.monitor_jobs(jobs, args)
+
+    assert sleeps == [ib.POLL_INTERVAL_MIN_SECONDS] * 3
@@ -0,0 +1,86 @@
+"""Tests for the species comparison statistics of testing/scripts/validate-scientific-results.py"""
+
+import warnings
+
+import numpy as np
+import pytest
+
+xr = pytest.importorskip("xarray")
+
+@pytest.fixture(scope="module")
+def vsr(load_script):
+    pytest.importorskip("seaborn")
+    pytest.importorskip("tabulate")
+    return load_script("testing/scripts/validate-scientific-results.py")
+
+@pytest.fixture(scope="module")
+def fields():
+    """A float32 reference field, a perturbed test field, and NaNs in both"""
+    rng = np.random.default_rng(42)
+    ref = rng.lognormal(mean=-20, sigma=1.5, size=(3, 8, 40, 50)).astype(np.float32)
+    test = (ref * (1 + rng.normal(0, 1e-4, size=ref.shape))).astype(np.float32)
+    ref.flat[rng.choice(ref.size, 200, replace=False)] = np.nan
+    test.flat[rng.choice(test.size, 200, replace=False)] = np.nan
+    return xr.DataArray(ref), xr.DataArray(test)
+
+def expected_stats(ref, test):
+    """The statistics computed directly with NumPy in float64 over cells valid in both runs"""
+    ref = ref.values.ravel().astype(np.float64)
+    test = test.values.ravel().astype(np.float64)
+    valid = ~np.isnan(ref) & ~np.isnan(test)
+    ref, test = ref[valid], test[valid]
+    abs_diff = np.abs(test - ref)
+    rel_diff = np.where(np.abs(ref) > 1e-10, abs_diff / np.abs(ref), 0.0)
+    return {
+        'mean_ref': ref.mean(),
+        'mean_test': test.mean(),
+        'mean_abs_diff': abs_diff.mean(),
+        'max_abs_diff': abs_diff.max(),
+        'rmse': np.sqrt((abs_diff ** 2).mean()),
+        'mean_rel_diff': rel_diff.mean(),
+        'max_rel_diff': rel_diff.max(),
+        'corr_coef': np.corrcoef(ref, test)[0, 1],
+    }
+
+def test_lazy_comparison_stats_match_numpy(vsr, fields):
+    stats = vsr.lazy_comparison_stats(*fields)
+    for name, value in expected_stats(*fields).items():
+        assert stats[name] == pytest.approx(value, rel=1e-5), name
+
+def test_streamed_comparison_stats_match_numpy_and_lazy(vsr, fields):
+    if vsr.numba is None:
+        pytest.skip("numba is not installed")
+    streamed = vsr.streamed_comparison_stats(*fields)
+    lazy = vsr.lazy_comparison_stats(*fields)
+    for name, value in expected_stats(*fields).items():
+        assert streamed[name] == pytest.approx(value, rel=1e-9), name
+        assert streamed[name] == pytest.approx(lazy[name], rel=1e-5), name
+
+def test_stream_stats_merge_matches_single_pass(vsr, fields):
+    if vsr.numba is None:
+        pytest.skip("numba is not installed")
+    ref, test = (np.ravel(field.values) for field in fields)
+    whole = vsr._stream_stats(ref, test)
+    half = ref.size // 2
+    merged = vsr._merge_stats(vsr._stream_stats(ref[:half], test[:half]),
+                              vsr._stream_stats(ref[half:], test[half:]))
+    np.testing.assert_allclose(merged, whole, rtol=1e-9)
+
+def test_constant_field_has_nan_correlation_without_warning(vsr):
+    ref = xr.DataArray(np.full((2, 10, 10), 1e-9, dtype=np.float32))
+    test = xr.DataArray(np.linspace(0, 1, 200, dtype=np.float32).reshape(2, 10, 10))
+    if vsr.numba is not None:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert np.isnan(vsr.streamed_comparison_stats(ref, test)['corr_coef'])
+    with warnings.catch_warnings():
+        # xr.corr itself divides by the zero standard deviation
+        warnings.simplefilter("ignore", RuntimeWarning)
+        assert np.isnan(vsr.lazy_comparison_stats(ref, test)['corr_coef'])
+
+def test_all_nan_fields_have_no_stats(vsr):
+    ref = xr.DataArray(np.full((2, 4), np.nan, dtype=np.float32))
+    test = xr.DataArray(np.ones((2, 4), dtype=np.float32))
+    assert vsr.lazy_comparison_stats(ref, test) is None
+    if vsr.numba is not None:
+        assert vsr.streamed_comparison_stats(ref, test) is None